@@ -7,9 +7,13 @@ import sys
 import json
 import re
 import base64
+import copy
+import hmac
+import queue
+import threading
 import requests
 from datetime import datetime
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, Response, request, jsonify, render_template, send_from_directory
 from flask_cors import CORS
 from dotenv import load_dotenv
 
@@ -20,6 +24,7 @@ load_dotenv()
 # Import Blockchain Service
 try:
     from blockchain_service import (
+        BlockchainService,
         blockchain_service,
         record_verification as blockchain_record,
         get_verification as blockchain_get,
@@ -29,6 +34,7 @@ try:
     print("✅ Blockchain service imported")
 except ImportError as e:
     print(f"⚠️ Blockchain service not available: {e}")
+    BlockchainService = None
     blockchain_service = None
 
 app = Flask(__name__, 
@@ -39,7 +45,17 @@ allowed_origins = os.getenv('ALLOWED_ORIGINS', 'http://localhost:3000,http://loc
 CORS(app, origins=allowed_origins, supports_credentials=True)
 
 # Import News Scraper and Verifier
-from news_scraper import scraper, verifier, NewsScraper, NewsVerifier
+from article_cache import article_cache
+from search_providers import search_service
+from news_scraper import scraper, verifier, NewsScraper, NewsVerifier, fact_check_cache
+from http_client import http_client
+from cache import TTLCache, SingleFlight, MISSING
+from lexicon import lexicon_registry
+from job_queue import job_queue, QueueFull
+from pipeline import VerificationCancelled
+
+# Hot-reload the pattern lexicon on SIGHUP (no restart needed for new scam phrases)
+lexicon_registry.install_signal_handler()
 
 # Google Gemini Configuration
 GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
@@ -58,6 +74,16 @@ except ImportError:
 
 # Production: No mock data - all data comes from actual verification
 
+# Whole-result cache for text verifications (viral hoaxes arrive in bursts)
+# Freshness window per verdict status, in seconds (0 disables caching for that status)
+VERIFY_CACHE_TTLS = {
+    'debunked': float(os.getenv('VERIFY_CACHE_TTL_DEBUNKED', '3600')),
+    'verified': float(os.getenv('VERIFY_CACHE_TTL_VERIFIED', '1800')),
+    'investigating': float(os.getenv('VERIFY_CACHE_TTL_INVESTIGATING', '300')),
+}
+verification_cache = TTLCache('verification', max_entries=int(os.getenv('VERIFY_CACHE_SIZE', '2048')), default_ttl=300)
+verification_flight = SingleFlight()
+
 
 def get_status_from_score(score):
     """Get status based on verification score"""
@@ -81,6 +107,43 @@ def get_risk_level(score):
         return "low"
 
 
+def verification_cache_key(claim_text):
+    """Cache key for a claim: hash of the case/whitespace-canonicalized text"""
+    canonical = ' '.join(claim_text.casefold().split())
+    if BlockchainService:
+        return BlockchainService.hash_claim(canonical)
+    import hashlib
+    return '0x' + hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def cached_verify_text(claim_text, on_stage=None):
+    """
+    Run verifier.verify_text through the result cache
+    Concurrent identical claims share one in-flight computation.
+    A streaming caller (on_stage given) computes on its own instead, so
+    cancelling it can never fail requests that joined its flight.
+    Returns: (result, cache_state) where cache_state is hit, shared or miss
+    """
+    key = verification_cache_key(claim_text)
+    cached = verification_cache.get(key)
+    if cached is not MISSING:
+        return copy.deepcopy(cached), 'hit'
+    
+    def compute():
+        result = verifier.verify_text(claim_text, on_stage=on_stage)
+        status = (result or {}).get('verification', {}).get('status')
+        ttl = VERIFY_CACHE_TTLS.get(status, 0)
+        if ttl > 0:
+            verification_cache.set(key, result, ttl=ttl)
+        return result
+    
+    if on_stage:
+        return copy.deepcopy(compute()), 'miss'
+    
+    result, shared = verification_flight.do(key, compute)
+    return copy.deepcopy(result), 'shared' if shared else 'miss'
+
+
 # Routes for serving HTML pages
 @app.route('/')
 def index():
@@ -108,40 +171,57 @@ def verify_page():
 def verify_claim():
     """
     Verify text content (claim, message, etc.)
+    Add ?async=1 to run as a background job (see /api/jobs)
     """
-    data = request.get_json()
-    
+    return dispatch_verification('text', request.get_json())
+
+
+def validate_text_request(data):
+    """Returns (error body, HTTP status) for a bad text request, else None"""
     if not data:
-        return jsonify({"error": "No data provided"}), 400
+        return {"error": "No data provided"}, 400
     
     claim_text = data.get('claim') or data.get('text', '')
-    source = data.get('source', 'User Submission')
-    
     if not claim_text:
-        return jsonify({"error": "No claim/text provided"}), 400
+        return {"error": "No claim/text provided"}, 400
+    
+    # Validate input
+    if len(claim_text.strip()) < 10:
+        return {
+            "success": False,
+            "error": "Claim text must be at least 10 characters long"
+        }, 400
+    
+    # Use the verifier
+    if not verifier:
+        return {
+            "success": False,
+            "error": "Verification service unavailable"
+        }, 503
+    return None
+
+
+def run_text_verification(data, on_stage=None):
+    """
+    Verify text content (claim, message, etc.)
+    on_stage: optional per-stage progress callback (see NewsVerifier.verify_text)
+    Returns: (response body, HTTP status)
+    """
+    invalid = validate_text_request(data)
+    if invalid:
+        return invalid
+    
+    claim_text = data.get('claim') or data.get('text', '')
+    source = data.get('source', 'User Submission')
     
     try:
-        # Validate input
-        if len(claim_text.strip()) < 10:
-            return jsonify({
-                "success": False,
-                "error": "Claim text must be at least 10 characters long"
-            }), 400
-        
-        # Use the verifier
-        if not verifier:
-            return jsonify({
-                "success": False,
-                "error": "Verification service unavailable"
-            }), 503
-            
-        result = verifier.verify_text(claim_text)
+        result, cache_state = cached_verify_text(claim_text, on_stage)
         
         if not result or 'verification' not in result:
-            return jsonify({
+            return {
                 "success": False,
                 "error": "Verification failed - invalid response from service"
-            }), 500
+            }, 500
         
         # Build response data
         response_data = {
@@ -159,6 +239,7 @@ def verify_claim():
             "cross_references": result.get('cross_references', []),
             "warnings": result.get('warnings', []),
             "timestamp": result.get('timestamp', datetime.now().isoformat()),
+            "cache": cache_state,
             "blockchain_hash": None,
             "blockchain": None
         }
@@ -182,6 +263,7 @@ def verify_claim():
                     "network": blockchain_result.get('network', 'ethereum'),
                     "explorer_url": blockchain_result.get('explorer_url'),
                     "mode": blockchain_result.get('mode', 'live'),
+                    "chain_status": blockchain_result.get('chain_status'),
                     "timestamp": blockchain_result.get('timestamp_iso', datetime.now().isoformat())
                 }
             except (ConnectionError, TimeoutError) as e:
@@ -196,34 +278,38 @@ def verify_claim():
                 traceback.print_exc()
                 response_data["blockchain_hash"] = None
         
-        return jsonify(response_data)
+        if on_stage:
+            on_stage('blockchain', response_data["blockchain"])
+        return response_data, 200
         
+    except VerificationCancelled:
+        raise
     except ValueError as e:
         print(f"❌ Validation error in verify_claim: {e}")
-        return jsonify({
+        return {
             "success": False,
             "error": f"Invalid input: {str(e)}",
             "type": "text",
             "input": claim_text
-        }), 400
+        }, 400
     except ConnectionError as e:
         print(f"❌ Connection error in verify_claim: {e}")
-        return jsonify({
+        return {
             "success": False,
             "error": "Service temporarily unavailable. Please try again later.",
                 "type": "text",
                 "input": claim_text
-            }), 503
+            }, 503
     except Exception as e:
         print(f"❌ Unexpected error in verify_claim: {e}")
         import traceback
         traceback.print_exc()
-        return jsonify({
+        return {
             "success": False,
             "error": "An unexpected error occurred. Please try again later.",
             "type": "text",
             "input": claim_text
-        }), 500
+        }, 500
 
 
 @app.route('/api/verify/url', methods=['POST'])
@@ -234,58 +320,79 @@ def verify_url():
     2. Extracts claims
     3. Checks against fact-check sources
     4. Returns verification with source citations
+    Add ?async=1 to run as a background job (see /api/jobs)
     """
-    data = request.get_json()
-    url = data.get('url')
+    return dispatch_verification('url', request.get_json())
+
+
+def validate_url_request(data):
+    """Returns (error body, HTTP status) for a bad URL request, else None"""
+    url = (data or {}).get('url')
     
     if not url:
-        return jsonify({"error": "No URL provided"}), 400
+        return {"error": "No URL provided"}, 400
     
     # Validate URL format
     try:
         from urllib.parse import urlparse
         parsed = urlparse(url)
         if not parsed.scheme or not parsed.netloc:
-            return jsonify({"error": "Invalid URL format. Please include http:// or https://"}), 400
+            return {"error": "Invalid URL format. Please include http:// or https://"}, 400
     except Exception as e:
-        return jsonify({"error": f"Invalid URL: {str(e)}"}), 400
+        return {"error": f"Invalid URL: {str(e)}"}, 400
     
     # Verify the URL using our verifier
     if not verifier:
-        return jsonify({
+        return {
             "success": False,
             "error": "Verification service unavailable"
-        }), 503
-        
+        }, 503
+    return None
+
+
+def run_url_verification(data, on_stage=None):
+    """
+    Verify a news article URL
+    on_stage: optional per-stage progress callback (see NewsVerifier.verify_url)
+    Returns: (response body, HTTP status)
+    """
+    invalid = validate_url_request(data)
+    if invalid:
+        return invalid
+    
+    url = data.get('url')
+    
     try:
-        result = verifier.verify_url(url)
+        result = verifier.verify_url(url, on_stage=on_stage)
+    except VerificationCancelled:
+        raise
     except requests.RequestException as e:
         print(f"❌ Network error in verify_url: {e}")
-        return jsonify({
+        return {
             "success": False,
             "error": f"Failed to fetch URL: {str(e)}"
-        }), 400
+        }, 400
     except ValueError as e:
         print(f"❌ Validation error in verify_url: {e}")
-        return jsonify({
+        return {
             "success": False,
             "error": f"Invalid URL format: {str(e)}"
-        }), 400
+        }, 400
     except Exception as e:
         print(f"❌ Unexpected error in verify_url: {e}")
         import traceback
         traceback.print_exc()
-        return jsonify({
+        return {
             "success": False,
             "error": "An unexpected error occurred. Please try again later."
-        }), 500
+        }, 500
     
     if not result['success'] and result.get('article', {}).get('error'):
-        return jsonify({
+        return {
             "success": False,
             "error": result['article']['error'],
             "url": url
-        }), 400
+        }, 400
     
     article = result.get('article', {})
     verification = result.get('verification', {})
@@ -339,28 +446,46 @@ def verify_url():
                 "network": blockchain_result.get('network', 'ethereum'),
                 "explorer_url": blockchain_result.get('explorer_url'),
                 "mode": blockchain_result.get('mode', 'live'),
+                "chain_status": blockchain_result.get('chain_status'),
                 "timestamp": blockchain_result.get('timestamp_iso', datetime.now().isoformat())
             }
         except Exception as e:
             print(f"⚠️ Blockchain recording failed: {e}")
             response_data["blockchain_hash"] = None
     
-    return jsonify(response_data)
+    if on_stage:
+        on_stage('blockchain', response_data["blockchain"])
+    return response_data, 200
 
 
 @app.route('/api/verify/image', methods=['POST'])
 def verify_image():
     """
     Verify an image for misinformation
+    Add ?async=1 to run as a background job (see /api/jobs)
     """
-    data = request.get_json()
+    return dispatch_verification('image', request.get_json())
+
+
+def validate_image_request(data):
+    """Returns (error body, HTTP status) for a bad image request, else None"""
+    if not data or (not data.get('image_url') and not data.get('image_base64')):
+        return {"error": "No image provided"}, 400
+    return None
+
+
+def run_image_verification(data):
+    """
+    Verify an image for misinformation
+    Returns: (response body, HTTP status)
+    """
+    invalid = validate_image_request(data)
+    if invalid:
+        return invalid
     
     image_url = data.get('image_url')
     image_base64 = data.get('image_base64')
     
-    if not image_url and not image_base64:
-        return jsonify({"error": "No image provided"}), 400
-    
     result = {
         'success': True,
         'type': 'image',
@@ -382,7 +507,7 @@ def verify_image():
         try:
             # Download or decode image
             if image_url:
-                response = requests.get(image_url, timeout=15)
+                response = http_client.get(image_url, timeout=15)
                 image_bytes = response.content
                 mime_type = response.headers.get('content-type', 'image/jpeg')
             else:
@@ -436,7 +561,7 @@ Respond in JSON format:
                 
                 # If text was extracted, verify it
                 if result['extracted_text']:
-                    text_verification = verifier.verify_text(result['extracted_text'])
+                    text_verification, _ = cached_verify_text(result['extracted_text'])
                     result['fact_checks'] = text_verification.get('fact_checks', [])
                     result['cross_references'] = text_verification.get('cross_references', [])
                     
@@ -494,6 +619,7 @@ Respond in JSON format:
                 "network": blockchain_result.get('network'),
                 "explorer_url": blockchain_result.get('explorer_url'),
                 "mode": blockchain_result.get('mode'),
+                "chain_status": blockchain_result.get('chain_status'),
                 "timestamp": blockchain_result.get('timestamp_iso')
             }
         except Exception as e:
@@ -505,7 +631,52 @@ Respond in JSON format:
     if result.get('blockchain_hash') is None:
         result['blockchain'] = None
     
-    return jsonify(result)
+    return result, 200
+
+
+# Verification kinds runnable inline or as background jobs: kind -> (validator, runner)
+VERIFICATION_KINDS = {
+    'text': (validate_text_request, run_text_verification),
+    'url': (validate_url_request, run_url_verification),
+    'image': (validate_image_request, run_image_verification),
+}
+
+for _kind, (_, _runner) in VERIFICATION_KINDS.items():
+    job_queue.register(_kind, _runner)
+
+
+@app.before_request
+def start_job_workers():
+    """Start the job workers with the first request served, not at import (idempotent)"""
+    job_queue.start()
+
+
+def wants_async():
+    return request.args.get('async', '').lower() in ('1', 'true', 'yes')
+
+
+def dispatch_verification(kind, data):
+    """Run a verification inline, or queue it when the client asked for async mode"""
+    validate, run = VERIFICATION_KINDS[kind]
+    if wants_async():
+        invalid = validate(data)
+        if invalid:
+            return jsonify(invalid[0]), invalid[1]
+        return submit_job(kind, data)
+    
+    body, status = run(data)
+    return jsonify(body), status
+
+
+def submit_job(kind, data):
+    """Queue a verification job - 202 with the URL to poll"""
+    try:
+        job = job_queue.submit(kind, data)
+    except QueueFull as e:
+        return jsonify({"success": False, "error": str(e)}), 503
+    
+    job['poll_url'] = f"/api/jobs/{job['job_id']}"
+    return jsonify({"success": True, "job": job}), 202
 
 
 @app.route('/api/verify/multi', methods=['POST'])
@@ -527,7 +698,7 @@ def verify_multi():
     
     # Verify text
     if data.get('text'):
-        text_result = verifier.verify_text(data['text'])
+        text_result, _ = cached_verify_text(data['text'])
         scores.append(text_result['verification']['score'])
         results['analyses']['text'] = {
             'score': text_result['verification']['score'],
@@ -613,6 +784,135 @@ def verify_multi():
     return jsonify(results)
 
 
+# ============================================
+# STREAMING VERIFICATION (Server-Sent Events)
+# ============================================
+
+SSE_HEARTBEAT_SECONDS = float(os.getenv('SSE_HEARTBEAT_SECONDS', '15'))
+
+
+def sse_event(event, payload):
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+def stream_verification(kind, data):
+    """
+    Run a verification in a background thread and stream its stages as SSE
+
+    Events: one per stage as it completes (patterns, article,
+    source_credibility, key_claims, fact_checks, cross_references,
+    ai_analysis, verification, blockchain), then `result` with the same
+    body the non-streaming endpoint returns, or `error`. If the client
+    disconnects, the verification is cancelled at the next stage boundary.
+    """
+    validate, run = VERIFICATION_KINDS[kind]
+    invalid = validate(data)
+    if invalid:
+        return jsonify(invalid[0]), invalid[1]
+    
+    events = queue.Queue()
+    cancelled = threading.Event()
+    
+    def on_stage(stage, payload):
+        if cancelled.is_set():
+            raise VerificationCancelled(stage)
+        events.put((stage, payload))
+    
+    def work():
+        try:
+            body, status = run(data, on_stage)
+            events.put(('result' if status < 400 else 'error', {**body, 'http_status': status}))
+        except VerificationCancelled as e:
+            print(f"ℹ️ Streaming {kind} verification cancelled before stage '{e}' (client disconnected)")
+        except Exception as e:
+            print(f"❌ Streaming {kind} verification failed: {e}")
+            events.put(('error', {"success": False, "error": "An unexpected error occurred. Please try again later."}))
+        finally:
+            events.put(None)
+    
+    threading.Thread(target=work, name=f"verify-stream-{kind}", daemon=True).start()
+    
+    def generate():
+        try:
+            yield sse_event('started', {"type": kind, "timestamp": datetime.now().isoformat()})
+            while True:
+                try:
+                    item = events.get(timeout=SSE_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"  # Also surfaces a dead connection
+                    continue
+                if item is None:
+                    return
+                yield sse_event(*item)
+        finally:
+            # Runs on completion and when the server closes the generator after a disconnect
+            cancelled.set()
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # Don't let nginx buffer the stream
+    })
+
+
+@app.route('/api/verify/stream', methods=['GET', 'POST'])
+def verify_claim_stream():
+    """
+    Streaming /api/verify - POST the same JSON body, or GET ?claim=... for EventSource
+    """
+    return stream_verification('text', request.get_json(silent=True) or request.args.to_dict())
+
+
+@app.route('/api/verify/url/stream', methods=['GET', 'POST'])
+def verify_url_stream():
+    """
+    Streaming /api/verify/url - POST the same JSON body, or GET ?url=... for EventSource
+    """
+    return stream_verification('url', request.get_json(silent=True) or request.args.to_dict())
+
+
+# ============================================
+# BACKGROUND JOBS
+# ============================================
+
+JOB_MAX_WAIT = float(os.getenv('JOB_MAX_WAIT_SECONDS', '30'))
+
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    """
+    Queue a verification job
+    Body: {"kind": "text" | "url" | "image", ...same fields as the matching /api/verify endpoint}
+    """
+    data = request.get_json()
+    kind = (data or {}).get('kind')
+    if kind not in VERIFICATION_KINDS:
+        return jsonify({"error": f"kind must be one of: {', '.join(VERIFICATION_KINDS)}"}), 400
+    
+    payload = {k: v for k, v in data.items() if k != 'kind'}
+    invalid = VERIFICATION_KINDS[kind][0](payload)
+    if invalid:
+        return jsonify(invalid[0]), invalid[1]
+    return submit_job(kind, payload)
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    Job status, with the verification result once finished
+    ?wait=N long-polls up to N seconds (capped) for the job to finish
+    """
+    try:
+        wait = min(max(float(request.args.get('wait', 0)), 0), JOB_MAX_WAIT)
+    except ValueError:
+        return jsonify({"error": "wait must be a number of seconds"}), 400
+    
+    job = job_queue.wait(job_id, wait) if wait else job_queue.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Job not found"}), 404
+    return jsonify({"success": True, "job": job})
+
+
 # ============================================
 # OTHER API ENDPOINTS
 # ============================================
@@ -647,19 +947,17 @@ def get_dashboard_stats():
             }
         })
     
-    # Get all records
-    records = blockchain_service.get_recent_records(limit=1000)
-    total_claims = len(records)
-    
-    # Calculate stats
-    false_claims = sum(1 for r in records if r.get('status') == 'debunked' or r.get('verification_score', 0) < 0.4)
-    verified_claims = sum(1 for r in records if r.get('status') == 'verified' or r.get('verification_score', 0) >= 0.7)
+    # Running counters kept by the record store: exact at any history size, O(1) to read
+    record_stats = blockchain_service.get_record_stats()
+    total_claims = record_stats['total']
+    false_claims = record_stats['false']
+    verified_claims = record_stats['verified']
     
     # Alerts are typically sent for high-risk/debunked content
     alerts_sent = false_claims * 3  # Estimate: ~3 alerts per false claim (Telegram, Dashboard, etc.)
     
     # Calculate accuracy (mock calculation based on confidence if available, else high default)
-    accuracy = 94.5 + (len(records) * 0.01) if records else 98.5
+    accuracy = 94.5 + (total_claims * 0.01) if total_claims else 98.5
     accuracy = min(accuracy, 99.9)
     
     return jsonify({
@@ -668,7 +966,10 @@ def get_dashboard_stats():
             "claims": total_claims,
             "false": false_claims,
             "alerts": alerts_sent,
-            "accuracy": round(accuracy, 1)
+            "accuracy": round(accuracy, 1),
+            "verified": verified_claims,
+            "by_status": record_stats['by_status'],
+            "hourly": blockchain_service.get_hourly_stats(24)
         }
     })
 
@@ -767,6 +1068,31 @@ def verify_blockchain(hash_id):
         }), 500
 
 
+@app.route('/api/blockchain/claim/<claim_hash>', methods=['GET'])
+def blockchain_claim(claim_hash):
+    """Latest blockchain record for a claim hash (see BlockchainService.hash_claim)"""
+    if not blockchain_service:
+        return jsonify({
+            "success": False,
+            "error": "Blockchain service not available"
+        }), 503
+    
+    try:
+        record = blockchain_service.get_verification_by_claim_hash(claim_hash)
+        return jsonify({
+            "success": True,
+            "verified": record is not None,
+            "record": record,
+            "claim_hash": claim_hash,
+            "message": "Record found on blockchain" if record else "Record not found"
+        })
+    except ValueError:
+        return jsonify({
+            "success": False,
+            "error": "claim_hash must be a 32-byte hex string"
+        }), 400
+
+
 @app.route('/api/blockchain/status', methods=['GET'])
 def blockchain_status():
     """Get blockchain service status"""
@@ -871,6 +1197,76 @@ def api_status():
     })
 
 
+def require_admin():
+    """Return an error response unless the request carries the admin token"""
+    admin_token = os.getenv('ADMIN_TOKEN')
+    if not admin_token:
+        return jsonify({"success": False, "error": "Admin endpoints disabled (ADMIN_TOKEN not set)"}), 403
+    # Bytes: compare_digest rejects non-ASCII str, and a header can carry any latin-1 text
+    if not hmac.compare_digest(request.headers.get('X-Admin-Token', '').encode(), admin_token.encode()):
+        return jsonify({"success": False, "error": "Invalid admin token"}), 401
+    return None
+
+
+@app.route('/api/admin/lexicon', methods=['GET'])
+def lexicon_info():
+    """Get the active pattern lexicon version"""
+    denied = require_admin()
+    if denied:
+        return denied
+    return jsonify({
+        "success": True,
+        "lexicon": lexicon_registry.current().describe()
+    })
+
+
+@app.route('/api/admin/lexicon/reload', methods=['POST'])
+def lexicon_reload():
+    """
+    Swap in a new pattern lexicon without restarting
+    With a JSON body, the body is validated, compiled and saved to data/lexicon.json
+    (which then overrides the shipped lexicon); without one, the lexicon file is re-read from disk.
+    """
+    denied = require_admin()
+    if denied:
+        return denied
+    
+    document = request.get_json(silent=True)
+    previous = lexicon_registry.current().version
+    try:
+        lexicon = lexicon_registry.reload(document)
+    except (ValueError, IOError) as e:
+        return jsonify({
+            "success": False,
+            "error": f"Lexicon rejected: {str(e)}",
+            "active_version": previous
+        }), 400
+    
+    return jsonify({
+        "success": True,
+        "previous_version": previous,
+        "lexicon": lexicon.describe()
+    })
+
+
+@app.route('/api/metrics', methods=['GET'])
+def api_metrics():
+    """Get runtime performance counters"""
+    return jsonify({
+        "success": True,
+        "http_client": http_client.get_stats(),
+        "fact_check_cache": fact_check_cache.get_stats(),
+        "article_cache": article_cache.get_stats() if article_cache else None,
+        "search": search_service.get_stats(),
+        "job_queue": job_queue.get_stats(),
+        "verification_cache": {
+            **verification_cache.get_stats(),
+            "single_flight": verification_flight.get_stats()
+        },
+        "timestamp": datetime.now().isoformat()
+    })
+
+
 # Static files
 @app.route('/static/<path:filename>')
 def serve_static(filename):
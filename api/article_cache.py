@@ -0,0 +1,292 @@
+"""
+RapidVerify Article Cache
+Persistent, content-addressed cache of fetched article HTML and extracted article dicts,
+keyed by canonical URL and revalidated with HTTP conditional requests
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from cache import DATA_DIR
+
+# Bump when extraction changes: cached article dicts from older versions are re-parsed from their HTML
+ARTICLE_CACHE_VERSION = 1
+
+TRACKING_PARAMS = frozenset([
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', '_ga', '_gl',
+    'ref', 'ref_src', 'ref_url', 'cmpid', 'ocid', 'ito', 's_cid', 'smid',
+    'amp', 'outputtype', 'amp_js_v', 'usqp'
+])
+TRACKING_PREFIXES = ('utm_', 'pk_', 'hsa_')
+
+_CANONICAL_RE = re.compile(r'<link\b[^>]*\brel\s*=\s*["\']?canonical\b[^>]*>', re.IGNORECASE)
+_HREF_RE = re.compile(r'\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE)
+_HEAD_END_RE = re.compile(r'</head\s*>', re.IGNORECASE)
+
+
+def _site(host: str) -> str:
+    """Host without the www./m./amp. prefixes publishers use for alternate renditions"""
+    for prefix in ('www.', 'amp.', 'm.'):
+        if host.startswith(prefix):
+            return host[len(prefix):]
+    return host
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Cache key form of a URL: lowercase scheme and host, no default port,
+    fragment, tracking parameters or AMP markers, sorted query
+    """
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or 'https').lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and (scheme, parts.port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{parts.port}"
+    host = _site(host) if host.startswith('amp.') else host
+
+    path = parts.path or '/'
+    path = path.replace('/amp_', '/')  # Times of India: /amp_articleshow/ → /articleshow/
+    for suffix in ('/amp/', '/amp', '.amp'):
+        if path.endswith(suffix) and len(path) > len(suffix):
+            path = path[:-len(suffix)] or '/'
+            break
+
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in TRACKING_PARAMS and not name.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+def _same_page(key: str, other_key: str) -> bool:
+    """Cache keys of one page's renditions: equal apart from the scheme and a www./m./amp. host prefix"""
+    a, b = urlsplit(key), urlsplit(other_key)
+    return _site(a.netloc) == _site(b.netloc) and (a.path, a.query) == (b.path, b.query)
+
+
+def find_canonical_url(html: str, base_url: str) -> Optional[str]:
+    """<link rel="canonical"> from the page head, if it names another rendition of base_url itself"""
+    head_end = _HEAD_END_RE.search(html)
+    head = html[:head_end.start()] if head_end else html[:65536]
+    link = _CANONICAL_RE.search(head)
+    if not link:
+        return None
+    href = _HREF_RE.search(link.group(0))
+    if not href:
+        return None
+    canonical = urljoin(base_url, (href.group(1) or href.group(2) or href.group(3)).strip())
+    # Only the same page (its AMP, mobile or www rendition) may be followed: on shared hosts
+    # (medium.com, blogspot paths) a same-site check would let one author's page file its
+    # content under another article's key
+    if not _same_page(canonicalize_url(canonical), canonicalize_url(base_url)):
+        return None
+    return canonical
+
+
+class ArticleCache:
+    """
+    Canonical-URL → (HTML, article dict, validators) cache on disk
+
+    HTML bodies are stored gzip-compressed under their SHA-256, so the same
+    page reached through different URLs (AMP, tracking parameters, a
+    canonical link) is stored once. The SQLite index keeps the ETag /
+    Last-Modified validators and the extracted article per URL. Entries
+    younger than `fresh_seconds` are served without contacting the origin;
+    older ones are revalidated with a conditional GET. When the stored HTML
+    exceeds `max_bytes`, least-recently-used entries and their
+    now-unreferenced blobs are evicted.
+    """
+
+    def __init__(self, root: str, max_bytes: int = 256 * 1024 * 1024, fresh_seconds: float = 600):
+        self.root = root
+        self.blob_dir = os.path.join(root, 'blobs')
+        self.max_bytes = max_bytes
+        self.fresh_seconds = fresh_seconds
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(root, 'index.sqlite3'), check_same_thread=False)
+        self._db.executescript('''
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                article TEXT,
+                version INTEGER NOT NULL,
+                validated_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at);
+            CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries(digest);
+            CREATE TABLE IF NOT EXISTS aliases (alias TEXT PRIMARY KEY, key TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, size INTEGER NOT NULL);
+        ''')
+        self._db.commit()
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """The entry for url (directly or through an alias), or None"""
+        key = canonicalize_url(url)
+        with self._lock:
+            row = self._db.execute('SELECT key FROM aliases WHERE alias = ?', (key,)).fetchone()
+            if row:
+                key = row[0]
+            row = self._db.execute(
+                'SELECT key, url, digest, etag, last_modified, article, version, validated_at '
+                'FROM entries WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self._stats['misses'] += 1
+                return None
+            self._db.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            self._db.commit()
+        return {
+            'key': row[0], 'url': row[1], 'digest': row[2], 'etag': row[3], 'last_modified': row[4],
+            'article': json.loads(row[5]) if row[5] and row[6] == ARTICLE_CACHE_VERSION else None,
+            'validated_at': row[7]
+        }
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry['validated_at'] < self.fresh_seconds
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for revalidating entry"""
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load_html(self, entry: Dict[str, Any]) -> Optional[str]:
+        try:
+            with gzip.open(self._blob_path(entry['digest']), 'rt', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def record_hit(self, revalidated: bool = False):
+        with self._lock:
+            self._stats['revalidated' if revalidated else 'hits'] += 1
+
+    def revalidated(self, entry: Dict[str, Any]):
+        """The origin answered 304: entry is fresh again"""
+        with self._lock:
+            self._db.execute('UPDATE entries SET validated_at = ? WHERE key = ?', (time.time(), entry['key']))
+            self._db.commit()
+
+    def update_article(self, entry: Dict[str, Any], article: dict):
+        """Replace an entry's article with one re-extracted from its stored HTML"""
+        with self._lock:
+            self._db.execute(
+                'UPDATE entries SET article = ?, version = ? WHERE key = ?',
+                (json.dumps(article), ARTICLE_CACHE_VERSION, entry['key'])
+            )
+            self._db.commit()
+
+    def store(self, url: str, html: str, article: dict, etag: Optional[str] = None,
+              last_modified: Optional[str] = None):
+        """Cache a fetched page under its canonical link (same page only) and alias the requested URL to it"""
+        requested = canonicalize_url(url)
+        canonical = find_canonical_url(html, url)
+        key = canonicalize_url(canonical) if canonical else requested
+
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            previous = self._db.execute('SELECT digest FROM entries WHERE key = ?', (key,)).fetchone()
+            self._db.execute('INSERT OR IGNORE INTO blobs (digest, size) VALUES (?, ?)', (digest, os.path.getsize(path)))
+            self._db.execute(
+                'INSERT OR REPLACE INTO entries '
+                '(key, url, digest, etag, last_modified, article, version, validated_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, url, digest, etag, last_modified, json.dumps(article), ARTICLE_CACHE_VERSION, now, now)
+            )
+            if requested != key:
+                self._db.execute('INSERT OR REPLACE INTO aliases (alias, key) VALUES (?, ?)', (requested, key))
+            if previous and previous[0] != digest:
+                self._drop_blob_if_unused(previous[0])  # The page changed: its old HTML is garbage
+            self._stats['stores'] += 1
+            self._evict()
+            self._db.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+            size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['revalidated'] + stats['misses']
+        return {
+            **stats,
+            'entries': entries,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+            'fresh_seconds': self.fresh_seconds,
+            'hit_rate': round((stats['hits'] + stats['revalidated']) / lookups, 3) if lookups else 0.0
+        }
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], f"{digest}.html.gz")
+
+    def _evict(self):
+        """Drop least-recently-used entries until blobs fit in max_bytes (lock held)"""
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, digest in self._db.execute('SELECT key, digest FROM entries ORDER BY accessed_at').fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+            self._db.execute('DELETE FROM aliases WHERE key = ?', (key,))
+            self._stats['evictions'] += 1
+            total -= self._drop_blob_if_unused(digest)
+
+    def _drop_blob_if_unused(self, digest: str) -> int:
+        """Delete a blob no entry references any more (lock held). Returns bytes freed"""
+        if self._db.execute('SELECT 1 FROM entries WHERE digest = ? LIMIT 1', (digest,)).fetchone():
+            return 0  # Still shared by another URL
+        row = self._db.execute('SELECT size FROM blobs WHERE digest = ?', (digest,)).fetchone()
+        self._db.execute('DELETE FROM blobs WHERE digest = ?', (digest,))
+        try:
+            os.remove(self._blob_path(digest))
+        except OSError:
+            pass
+        return row[0] if row else 0
+
+
+def _open_article_cache() -> Optional[ArticleCache]:
+    if os.getenv('ARTICLE_CACHE_ENABLED', 'true').lower() != 'true':
+        return None
+    try:
+        return ArticleCache(
+            os.getenv('ARTICLE_CACHE_DIR') or os.path.join(DATA_DIR, 'article_cache'),
+            max_bytes=int(float(os.getenv('ARTICLE_CACHE_MAX_MB', '256')) * 1024 * 1024),
+            fresh_seconds=float(os.getenv('ARTICLE_CACHE_FRESH_SECONDS', '600'))
+        )
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️ Article cache disabled: {e}")
+        return None
+
+
+# Global instance (None when disabled)
+article_cache = _open_article_cache()
@@ -0,0 +1,300 @@
+"""
+RapidVerify Article Extractor
+Parses article HTML once with lxml and collects every field's candidates in a single tree walk
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from lxml import etree
+    from lxml.html import HTMLParser, document_fromstring
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Selector cascades, highest priority first (same order as NewsScraper._extract_*)
+TITLE_SELECTORS = [
+    'h1.article-title', 'h1.entry-title', 'h1.post-title',
+    'h1[itemprop="headline"]', '.article-heading h1',
+    'article h1', '.story-title', '.headline',
+    'meta[property="og:title"]', 'meta[name="title"]',
+    'title'
+]
+CONTENT_SELECTORS = [
+    'article .content', 'article .article-body', '.article-content',
+    '.story-content', '.post-content', '.entry-content',
+    '[itemprop="articleBody"]', '.article-text', '.story-body',
+    'article p', '.news-content', '#article-body'
+]
+AUTHOR_SELECTORS = [
+    '[itemprop="author"]', '.author-name', '.byline',
+    '.article-author', 'meta[name="author"]',
+    '.writer', '[rel="author"]'
+]
+DATE_SELECTORS = [
+    'time[datetime]', '[itemprop="datePublished"]',
+    '.article-date', '.publish-date', '.post-date',
+    'meta[property="article:published_time"]'
+]
+IMAGE_SELECTORS = [
+    'article img', '.article-image img', '.featured-image img',
+    '[itemprop="image"]', '.story-image img'
+]
+MAX_IMAGES_PER_SELECTOR = 3
+
+# Subtrees NewsScraper._extract_content decomposes before body, author, date and image lookup
+PRUNED_TAGS = frozenset(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement'])
+# Never part of get_text() output, even before pruning
+NON_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+
+_COMPOUND_RE = re.compile(r'([a-z0-9]+)|\.([\w-]+)|#([\w-]+)|\[([\w:-]+)(?:="([^"]*)")?\]')
+
+
+class Compound:
+    """One compound selector (tag, .class, #id, [attr], [attr="value"]) matched against an element"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tag: Optional[str] = None
+        self.classes: List[str] = []
+        self.attrs: List[Tuple[str, Optional[str]]] = []
+        pos = 0
+        while pos < len(text):
+            match = _COMPOUND_RE.match(text, pos)
+            if not match:
+                raise ValueError(f"Unsupported selector: {text!r}")
+            tag, cls, id_, attr, value = match.groups()
+            if tag:
+                self.tag = tag
+            elif cls:
+                self.classes.append(cls)
+            elif id_:
+                self.attrs.append(('id', id_))
+            else:
+                self.attrs.append((attr, value))
+            pos = match.end()
+
+    def matches(self, tag: str, classes: frozenset, attrib) -> bool:
+        if self.tag is not None and tag != self.tag:
+            return False
+        for cls in self.classes:
+            if cls not in classes:
+                return False
+        for name, value in self.attrs:
+            actual = attrib.get(name)
+            if actual is None or (value is not None and actual != value):
+                return False
+        return True
+
+
+class Selector:
+    """`compound` or `ancestor descendant` - the only CSS the extraction cascades use"""
+
+    def __init__(self, text: str):
+        parts = text.split()
+        if not 1 <= len(parts) <= 2:
+            raise ValueError(f"Unsupported selector: {text!r}")
+        self.text = text
+        self.target = Compound(parts[-1])
+        self.ancestor = parts[0] if len(parts) == 2 else None
+
+
+class ArticleExtractor:
+    """
+    Single-pass extraction of title, body, author, date and images
+
+    The document is parsed once (lxml's C parser) and walked once with
+    iterwalk start/end events. Each element is tested against every
+    cascade's selectors; descendant selectors are answered from counters of
+    currently-open ancestors, so no selector re-scans the tree. Candidates
+    are then resolved in the cascades' priority order, with the same
+    first-match-in-document-order semantics as BeautifulSoup's select_one /
+    select, including skipping PRUNED_TAGS for everything but the title.
+    """
+
+    def __init__(self):
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml is required for ArticleExtractor")
+        self._parser = HTMLParser(encoding='utf-8', remove_comments=True)
+        self._cascades = {
+            'title': [Selector(s) for s in TITLE_SELECTORS],
+            'content': [Selector(s) for s in CONTENT_SELECTORS],
+            'author': [Selector(s) for s in AUTHOR_SELECTORS],
+            'date': [Selector(s) for s in DATE_SELECTORS],
+            'images': [Selector(s) for s in IMAGE_SELECTORS],
+        }
+        # Every distinct ancestor compound gets one open-element counter during the walk
+        self._ancestors = {}
+        for selectors in self._cascades.values():
+            for selector in selectors:
+                if selector.ancestor and selector.ancestor not in self._ancestors:
+                    self._ancestors[selector.ancestor] = Compound(selector.ancestor)
+        # Bucket selectors by one required tag/class/attribute so each element only tests plausible ones
+        self._index: Dict[Tuple[str, str], list] = {}
+        for field, selectors in self._cascades.items():
+            for position, selector in enumerate(selectors):
+                self._index.setdefault(self._index_key(selector.target), []).append((field, position, selector))
+        self._ancestor_index: Dict[Tuple[str, str], list] = {}
+        for key, compound in self._ancestors.items():
+            self._ancestor_index.setdefault(self._index_key(compound), []).append((key, compound))
+
+    @staticmethod
+    def _index_key(compound: Compound) -> Tuple[str, str]:
+        if compound.classes:
+            return ('class', compound.classes[0])
+        if compound.attrs:
+            return ('attr', compound.attrs[0][0])
+        return ('tag', compound.tag)
+
+    @staticmethod
+    def _candidates(index: dict, tag: str, classes: frozenset, attrib) -> list:
+        candidates = list(index.get(('tag', tag), ()))
+        for cls in classes:
+            candidates.extend(index.get(('class', cls), ()))
+        for name in attrib:
+            candidates.extend(index.get(('attr', name), ()))
+        return candidates
+
+    def extract(self, html: str) -> Dict[str, Any]:
+        """
+        Returns {title, content, author, date, image_sources}; content is the
+        raw joined text (not yet cleaned) and image sources are not yet absolute
+        """
+        fields = {'title': '', 'content': '', 'author': '', 'date': '', 'image_sources': []}
+        if not html or not html.strip():
+            return fields
+        try:
+            root = document_fromstring(html.encode('utf-8', 'replace'), parser=self._parser)
+        except (etree.ParserError, ValueError):
+            return fields
+
+        found = self._walk(root)
+
+        fields['title'] = self._first(found['title'], prune=False)
+        fields['author'] = self._first(found['author'], prune=True)
+        date = self._first_element(found['date'])
+        if date is not None:
+            if date.tag == 'meta':
+                fields['date'] = date.get('content', '').strip()
+            else:
+                fields['date'] = date.get('datetime', '') or self._text(date, PRUNED_TAGS).strip()
+        fields['content'] = self._content(found['content'], found['fallback'])
+        fields['image_sources'] = self._image_sources(found['images'])
+        return fields
+
+    def _walk(self, root) -> Dict[str, Any]:
+        index, ancestor_index = self._index, self._ancestor_index
+        open_count = dict.fromkeys(self._ancestors, 0)
+        found = {field: [[] for _ in selectors] for field, selectors in self._cascades.items()}
+        fallback = {'article': None, 'main': None, 'body': None}
+        pruned_depth = 0
+        opened = []  # Per element: ancestor compounds it incremented
+
+        for event, element in etree.iterwalk(root, events=('start', 'end')):
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue
+            if event == 'end':
+                for key in opened.pop():
+                    open_count[key] -= 1
+                if tag in PRUNED_TAGS:
+                    pruned_depth -= 1
+                continue
+
+            if tag in PRUNED_TAGS:
+                pruned_depth += 1
+            attrib = element.attrib
+            classes = frozenset(attrib.get('class', '').split())
+
+            for field, position, selector in self._candidates(index, tag, classes, attrib):
+                if pruned_depth and field != 'title':
+                    continue  # Decomposed before these cascades run
+                matches = found[field][position]
+                if matches and field in ('title', 'author', 'date'):
+                    continue  # select_one: the first match in document order wins
+                if selector.ancestor and not open_count[selector.ancestor]:
+                    continue
+                if selector.target.matches(tag, classes, attrib):
+                    matches.append(element)
+
+            if not pruned_depth and tag in fallback and fallback[tag] is None:
+                fallback[tag] = element
+
+            entered = [key for key, compound in self._candidates(ancestor_index, tag, classes, attrib)
+                       if compound.matches(tag, classes, attrib)]
+            for key in entered:
+                open_count[key] += 1
+            opened.append(entered)
+
+        found['fallback'] = fallback['article'] if fallback['article'] is not None else (
+            fallback['main'] if fallback['main'] is not None else fallback['body'])
+        return found
+
+    @staticmethod
+    def _first_element(matches: List[list]):
+        for elements in matches:
+            if elements:
+                return elements[0]
+        return None
+
+    def _first(self, matches: List[list], prune: bool) -> str:
+        element = self._first_element(matches)
+        if element is None:
+            return ''
+        if element.tag == 'meta':
+            return element.get('content', '').strip()
+        return self._text(element, PRUNED_TAGS if prune else NON_TEXT_TAGS).strip()
+
+    def _content(self, matches: List[list], fallback) -> str:
+        for elements in matches:
+            if elements:
+                content = ' '.join(self._text(el, PRUNED_TAGS).strip() for el in elements)
+                if len(content) > 100:  # Meaningful content
+                    return content
+        if fallback is None:
+            return ''
+        paragraphs = self._paragraphs(fallback)
+        return ' '.join(self._text(p, PRUNED_TAGS).strip() for p in paragraphs)
+
+    @staticmethod
+    def _paragraphs(element) -> list:
+        """Descendant <p> elements outside pruned subtrees"""
+        paragraphs = []
+        stack = list(reversed(element))
+        while stack:
+            node = stack.pop()
+            if not isinstance(node.tag, str) or node.tag in PRUNED_TAGS:
+                continue
+            if node.tag == 'p':
+                paragraphs.append(node)
+            stack.extend(reversed(node))
+        return paragraphs
+
+    @staticmethod
+    def _image_sources(matches: List[list]) -> List[str]:
+        sources = []
+        for elements in matches:
+            for img in elements[:MAX_IMAGES_PER_SELECTOR]:
+                src = img.get('src') or img.get('data-src')
+                if src:
+                    sources.append(src)
+        return sources
+
+    @staticmethod
+    def _text(element, skip: frozenset) -> str:
+        """get_text() equivalent that leaves out `skip` subtrees"""
+        parts = []
+        stack = [(element, False)]
+        while stack:
+            node, tail_only = stack.pop()
+            if tail_only:
+                if node.tail:
+                    parts.append(node.tail)
+                continue
+            if node.text:
+                parts.append(node.text)
+            for child in reversed(node):
+                stack.append((child, True))
+                if isinstance(child.tag, str) and child.tag not in skip:
+                    stack.append((child, False))
+        return ''.join(parts)
@@ -0,0 +1,313 @@
+"""
+RapidVerify Async Verification Engine
+Coroutine versions of the network-bound verification steps (aiohttp + Gemini async API)
+"""
+import asyncio
+import os
+from typing import Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from article_cache import ArticleCache, article_cache
+from cache import MISSING
+from http_client import DEFAULT_HEADERS, http_client
+from host_scheduler import HostQueueTimeout, host_scheduler
+from lexicon import lexicon_registry
+from page_reader import SCRAPE_CHUNK_SIZE, PageReader, PageRejected
+from search_providers import search_service
+from news_scraper import (
+    AI_VERIFY_GENERATION_CONFIG, FACT_CHECK_API_URL,
+    NewsVerifier, fact_check_cache, gemini_model
+)
+
+ASYNC_HTTP_LIMIT = int(os.getenv('ASYNC_HTTP_LIMIT', '100'))  # Open connections across all hosts
+ASYNC_HTTP_LIMIT_PER_HOST = int(os.getenv('ASYNC_HTTP_LIMIT_PER_HOST', '10'))
+
+
+class AsyncNewsVerifier(NewsVerifier):
+    """
+    NewsVerifier whose fetches, searches and Gemini calls are awaitable
+
+    Prompt building, response parsing and scoring are inherited from
+    NewsVerifier, so both engines return identical results for identical
+    upstream responses. Only I/O is replaced: one event loop can keep many
+    verifications in flight without a thread per request. HTML parsing is
+    CPU-bound and runs in the default executor to keep the loop responsive.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Shared ClientSession for the running loop (created lazily, per loop)"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=ASYNC_HTTP_LIMIT,
+                limit_per_host=ASYNC_HTTP_LIMIT_PER_HOST,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+            self._session_loop = loop
+        return self._session
+
+    @staticmethod
+    async def _blocking(fn, *args):
+        """Run a blocking call (SQLite-backed caches, HTML parsing) in the default executor"""
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    async def close(self):
+        """Close the HTTP session (call on shutdown)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get_text(self, url: str, timeout: float = 15, raise_for_status: bool = False, **kwargs) -> tuple:
+        """GET url. Returns (status, body text)"""
+        session = await self._get_session()
+        async with host_scheduler.slot_async(url), \
+                session.get(url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs) as response:
+            if raise_for_status:
+                response.raise_for_status()
+            return response.status, await response.text(errors='replace')
+
+    async def _get_page(self, url: str, timeout: float = 15, deadline: Optional[float] = None, **kwargs) -> tuple:
+        """
+        Async http_client.fetch_page: streamed through a PageReader, stops early.
+        Same limits as the sync client: `timeout` per socket read, `deadline`
+        (default HTTP_PAGE_DEADLINE) for the whole request. Returns (status, headers, text)
+        """
+        session = await self._get_session()
+        client_timeout = aiohttp.ClientTimeout(
+            total=http_client.page_deadline if deadline is None else deadline, sock_read=timeout
+        )
+        async with host_scheduler.slot_async(url), \
+                session.get(url, timeout=client_timeout, **kwargs) as response:
+            response.raise_for_status()
+            reader = PageReader(response.headers.get('Content-Type'), response.headers.get('Content-Length'))
+            async for chunk in response.content.iter_chunked(SCRAPE_CHUNK_SIZE):
+                if reader.feed(chunk):
+                    break
+            return response.status, response.headers, reader.finish()
+
+    # ------------------------------------------------------------------
+    # Scraping
+    # ------------------------------------------------------------------
+
+    async def scrape_article_async(self, url: str) -> dict:
+        """
+        Scrape news article from URL
+        Returns: {title, content, author, date, source, images, url}
+        """
+        scraper = self.scraper
+        result = scraper._new_article_result(url)
+
+        try:
+            # Parse domain
+            parsed = urlparse(url)
+            result['domain'] = parsed.netloc.replace('www.', '')
+            result['source'] = scraper._get_source_name(result['domain'])
+
+            # Article cache first (SQLite index and blob reads run off the loop, like parsing)
+            entry = await self._blocking(article_cache.lookup, url) if article_cache else None
+            if entry and article_cache.is_fresh(entry) and \
+                    await self._blocking(scraper._restore_cached_article, entry, result):
+                article_cache.record_hit()
+                return result
+
+            # Fetch the page
+            headers = {**scraper.headers, **ArticleCache.conditional_headers(entry)}
+            status, response_headers, html = await self._get_page(url, timeout=15, headers=headers)
+            if status == 304:
+                if entry and await self._blocking(scraper._restore_cached_article, entry, result):
+                    await self._blocking(article_cache.revalidated, entry)
+                    article_cache.record_hit(revalidated=True)
+                    return result
+                status, response_headers, html = await self._get_page(url, timeout=15, headers=scraper.headers)
+
+            await self._blocking(scraper._parse_article, html, url, result)
+            result['success'] = True
+            await self._blocking(scraper._cache_article, url, html, result, response_headers)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, PageRejected, HostQueueTimeout) as e:
+            result['error'] = f"Failed to fetch URL: {str(e) or type(e).__name__}"
+        except ValueError as e:
+            result['error'] = f"Invalid URL format: {str(e)}"
+        except Exception as e:
+            result['error'] = f"Error parsing article: {str(e)}"
+            import traceback
+            traceback.print_exc()
+
+        return result
+
+    # ------------------------------------------------------------------
+    # Fact checks and search
+    # ------------------------------------------------------------------
+
+    async def _fact_check_api_search_async(self, query: str, timeout: int = 15):
+        """Async _fact_check_api_search (shares the same response cache)"""
+        google_api_key = os.getenv('GOOGLE_API_KEY')
+        if not google_api_key:
+            return None
+
+        params, cache_key = self._fact_check_params(query)
+        cached = await self._blocking(fact_check_cache.get, cache_key)  # SQLite read when persistent
+        if cached is not MISSING:
+            return cached
+
+        session = await self._get_session()
+        async with host_scheduler.slot_async(FACT_CHECK_API_URL), \
+                session.get(FACT_CHECK_API_URL, params={'key': google_api_key, **params},
+                            timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status != 200:
+                return None  # Don't cache transient API failures
+            data = await response.json(content_type=None)
+
+        return await self._blocking(self._cache_fact_check_claims, cache_key, data.get('claims', []))
+
+    async def _fact_check_query_async(self, query: str) -> list:
+        try:
+            return self._query_fact_checks_from(await self._fact_check_api_search_async(query, timeout=15))
+        except Exception as e:
+            print(f"⚠️ Google Fact Check API error: {e}")
+            return []
+
+    async def _fact_check_claim_async(self, claim_text: str) -> list:
+        if not claim_text:
+            return []
+        try:
+            return self._claim_fact_checks_from(await self._fact_check_api_search_async(claim_text, timeout=10))
+        except Exception:
+            return []  # Continue if one claim search fails
+
+    async def _google_search_async(self, query: str, num_results: int = 10) -> list:
+        return await search_service.search_async(query, num_results, self._search_fetch)
+
+    async def _search_fetch(self, url: str, headers: dict, timeout: float) -> tuple:
+        """Transport for search providers: (status, body text)"""
+        return await self._get_text(url, timeout=timeout, headers=headers)
+
+    async def _search_cross_references_async(self, query: str) -> list:
+        print(f"🔍 Performing Google Search for: {query[:50]}...")
+        google_results = await self._google_search_async(query, num_results=10)
+        return self._cross_references_from(query, google_results)
+
+    # ------------------------------------------------------------------
+    # Gemini
+    # ------------------------------------------------------------------
+
+    async def _extract_key_claims_async(self, title: str, content: str) -> list:
+        claims = []
+        if gemini_model:
+            try:
+                response = await gemini_model.generate_content_async(self._key_claims_prompt(title, content))
+                claims = self._parse_key_claims(response.text)
+            except ValueError as e:
+                print(f"AI claim extraction failed (invalid response): {e}")
+            except Exception as e:
+                print(f"AI claim extraction failed: {e}")
+
+        return claims[:5] or self._fallback_key_claims(title, content)
+
+    async def _ai_verify_claim_async(self, text: str, fact_checks: list, key_claims: list,
+                                     cross_refs: list = None, hits=None) -> dict:
+        if not gemini_model:
+            print("⚠️ Gemini model not available - skipping AI verification")
+            return {'score': None, 'verdict': None, 'warnings': []}
+
+        try:
+            if hits is None:
+                hits = lexicon_registry.current().scan(text)
+            prompt, debunked_found = self._ai_verify_prompt(text, fact_checks, key_claims, cross_refs, hits)
+            response = await gemini_model.generate_content_async(
+                prompt, generation_config=AI_VERIFY_GENERATION_CONFIG
+            )
+            return self._parse_ai_verdict(response.text, text, debunked_found, hits)
+        except Exception as e:
+            print(f"⚠️ AI verification error: {e}")
+
+        return {'score': None, 'verdict': None, 'warnings': []}
+
+    # ------------------------------------------------------------------
+    # Verification
+    # ------------------------------------------------------------------
+
+    async def _gather_evidence_async(self, query: str, title: str, content: str) -> dict:
+        """
+        Async _gather_evidence: the same stage graph as tasks on the running loop
+        Returns: {key_claims, fact_checks, cross_references}
+        """
+        key_claims_task = asyncio.ensure_future(self._extract_key_claims_async(title, content))
+        query_fact_checks = asyncio.ensure_future(self._fact_check_query_async(query))
+        cross_references = asyncio.ensure_future(self._search_cross_references_async(query))
+        try:
+            key_claims = await key_claims_task
+            claim_fact_checks = await asyncio.gather(
+                *(self._fact_check_claim_async(claim) for claim in key_claims[:3])  # Top 3 claims
+            )
+            fact_checks = list(await query_fact_checks)
+            cross_refs = await cross_references
+        except BaseException:
+            for task in (key_claims_task, query_fact_checks, cross_references):
+                task.cancel()
+            raise
+
+        for checks in claim_fact_checks:
+            fact_checks.extend(checks)
+        fact_checks.extend(self._fact_check_search_links(query))
+
+        return {
+            'key_claims': key_claims,
+            'fact_checks': fact_checks,
+            'cross_references': cross_refs
+        }
+
+    async def verify_text_async(self, text: str) -> dict:
+        """Async verify_text"""
+        result, hits, fake_score, is_simple_factual = self._begin_text_verification(text)
+
+        evidence = await self._gather_evidence_async(text, text, text)
+        result.update(evidence)
+
+        ai_analysis = None
+        if gemini_model:
+            ai_analysis = await self._ai_verify_claim_async(text, evidence['fact_checks'], evidence['key_claims'],
+                                                            evidence['cross_references'], hits=hits)
+
+        return self._finish_text_verification(result, hits, fake_score, is_simple_factual, ai_analysis)
+
+    async def verify_url_async(self, url: str) -> dict:
+        """Async verify_url"""
+        result = self._new_url_result(url)
+
+        article = await self.scrape_article_async(url)
+        result['article'] = article
+
+        if not article['success']:
+            result['warnings'].append(f"Could not scrape article: {article.get('error', 'Unknown error')}")
+            return result
+
+        source_cred = self._check_source_credibility(article['domain'])
+        result['source_credibility'] = source_cred
+
+        evidence = await self._gather_evidence_async(article['title'], article['title'], article['content'])
+        result.update(evidence)
+
+        # An empty dict tells _calculate_verification not to call Gemini itself
+        ai_analysis = {}
+        article_text = article.get('content', '') + ' ' + article.get('title', '')
+        if gemini_model and article_text:
+            ai_analysis = await self._ai_verify_claim_async(article_text, evidence['fact_checks'], [])
+
+        result['verification'] = self._calculate_verification(source_cred, evidence['fact_checks'],
+                                                              evidence['cross_references'], article,
+                                                              ai_analysis=ai_analysis)
+        result['success'] = True
+        return result
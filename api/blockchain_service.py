@@ -3,20 +3,32 @@ RapidVerify Blockchain Service
 Handles blockchain integration for tamper-proof verification records on Polygon/Ethereum
 """
 import os
+import atexit
 import json
 import hashlib
+import queue
+import threading
 import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, asdict
 from dotenv import load_dotenv
 
+from cache import MISSING, TTLCache
+from chain_indexer import ChainIndexer
+from chain_writer import ChainWriter
+from merkle import MerkleTree, record_leaf, verify_proof
+from record_store import open_record_store
+from rpc_health import RpcHealthMonitor
+from transactions import GasPriceOracle, NonceManager
+
 load_dotenv()
 
 # Try importing web3, handle gracefully if not installed
 try:
     from web3 import Web3
     from web3.middleware import ExtraDataToPOAMiddleware
+    from web3.exceptions import ContractLogicError, TransactionNotFound
     from eth_account import Account
     WEB3_AVAILABLE = True
 except ImportError:
@@ -84,6 +96,8 @@ class BlockchainService:
         }
     }
     
+    FAILED_ANCHORS_META = 'merkle_failed_anchors'
+    
     # Minimal ABI for the RapidVerify contract
     CONTRACT_ABI = [
         {
@@ -146,18 +160,70 @@ class BlockchainService:
         self.w3: Optional[Web3] = None
         self.account = None
         self.contract = None
+        self._rpc: Optional[RpcHealthMonitor] = None
+        self._nonces: Optional[NonceManager] = None
+        self._gas: Optional[GasPriceOracle] = None
         self.network_name = os.getenv('BLOCKCHAIN_NETWORK', 'polygon_amoy')
         self.network_config = self.NETWORKS.get(self.network_name, self.NETWORKS['polygon_amoy'])
         
         # Local storage for demo mode (when blockchain is not configured)
-        # Using file-based storage for persistence across restarts
-        self._local_records: Dict[str, Dict] = {}
-        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-        os.makedirs(data_dir, exist_ok=True)
-        self._storage_file = os.path.join(data_dir, 'blockchain_records.json')
-        self._load_local_records()
+        # Persistent record store: SQLite (default) or append-only journal
+        data_dir = os.getenv('RECORD_STORE_DIR') or os.path.join(os.path.dirname(__file__), '..', 'data')
+        self._store = open_record_store(
+            os.getenv('RECORD_STORE_BACKEND', 'sqlite').lower(),
+            data_dir,
+            fsync_interval=float(os.getenv('RECORD_JOURNAL_FSYNC_INTERVAL', '0.2')),
+            compact_threshold=int(os.getenv('RECORD_JOURNAL_COMPACT_THRESHOLD', '10000'))
+        )
+        
+        # Read-through cache for contract getters. Confirmed records are immutable and
+        # never expire; "not found" answers and claim -> record mappings expire
+        self._reads = TTLCache('chain_reads', max_entries=int(os.getenv('BLOCKCHAIN_READ_CACHE_SIZE', '10000')),
+                               default_ttl=None)
+        self.negative_cache_seconds = float(os.getenv('BLOCKCHAIN_NEGATIVE_CACHE_SECONDS', '30'))
+        self.claim_cache_seconds = float(os.getenv('BLOCKCHAIN_CLAIM_CACHE_SECONDS', '300'))
+        
+        # Write mode: 'direct' sends one transaction per record, 'batch' anchors one Merkle root per batch
+        self.write_mode = os.getenv('BLOCKCHAIN_WRITE_MODE', 'direct').lower()
+        self.batch_size = int(os.getenv('BLOCKCHAIN_BATCH_SIZE', '64'))
+        self.batch_seconds = float(os.getenv('BLOCKCHAIN_BATCH_SECONDS', '30'))
+        self.batch_retry_seconds = float(os.getenv('BLOCKCHAIN_BATCH_RETRY_SECONDS', '60'))
+        self._batch: List[Dict[str, Any]] = []
+        self._batch_started = 0.0
+        self._batch_changed = threading.Condition()
+        # Roots whose anchor transaction failed, retried with backoff (persisted in the store's metadata)
+        self._failed_anchors: List[Dict[str, Any]] = []
+        if self.write_mode == 'batch':
+            self._failed_anchors = json.loads(self._store.get_meta(self.FAILED_ANCHORS_META) or '[]')
+        
+        # Direct mode sends from a background writer unless BLOCKCHAIN_WRITE_BEHIND=false
+        self.write_behind = os.getenv('BLOCKCHAIN_WRITE_BEHIND', 'true').lower() not in ('0', 'false', 'no')
+        self._writer = ChainWriter(
+            self,
+            receipt_timeout=float(os.getenv('BLOCKCHAIN_RECEIPT_TIMEOUT', '300')),
+            poll_interval=float(os.getenv('BLOCKCHAIN_RECEIPT_POLL_SECONDS', '2'))
+        )
         
         self._initialize()
+        
+        if self.write_mode == 'direct' and self.write_behind and self.is_fully_configured():
+            self._writer.start()
+        
+        # Event indexer: materializes every VerificationRecorded log (any node's) into the local store
+        self._indexer: Optional[ChainIndexer] = None
+        if self.contract is not None and os.getenv('BLOCKCHAIN_INDEXER', 'true').lower() not in ('0', 'false', 'no'):
+            start_block = os.getenv('BLOCKCHAIN_INDEXER_START_BLOCK')
+            self._indexer = ChainIndexer(
+                self,
+                poll_interval=float(os.getenv('BLOCKCHAIN_INDEXER_POLL_SECONDS', '15')),
+                reorg_depth=int(os.getenv('BLOCKCHAIN_REORG_DEPTH', '12')),
+                max_block_range=int(os.getenv('BLOCKCHAIN_INDEXER_BLOCK_RANGE', '2000')),
+                start_block=int(start_block) if start_block else None
+            )
+            self._indexer.start()
+        if self.write_mode == 'batch':
+            threading.Thread(target=self._batch_loop, name='merkle-batcher', daemon=True).start()
+            atexit.register(self.flush_batch)
     
     def _initialize(self):
         """Initialize Web3 connection and contract"""
@@ -167,22 +233,37 @@ class BlockchainService:
         
         private_key = os.getenv('BLOCKCHAIN_PRIVATE_KEY')
         contract_address = os.getenv('BLOCKCHAIN_CONTRACT_ADDRESS')
-        rpc_url = os.getenv('BLOCKCHAIN_RPC_URL') or self.network_config['rpc']
+        # Endpoints in priority order: BLOCKCHAIN_RPC_URLS, else BLOCKCHAIN_RPC_URL, else the network default
+        rpc_urls = [url.strip() for url in os.getenv('BLOCKCHAIN_RPC_URLS', '').split(',') if url.strip()]
+        rpc_urls = rpc_urls or [os.getenv('BLOCKCHAIN_RPC_URL') or self.network_config['rpc']]
         
         # Handle Infura URLs
-        if 'infura.io' in rpc_url and not rpc_url.endswith('/'):
-            infura_key = os.getenv('INFURA_API_KEY', '')
-            rpc_url = f"{rpc_url}{infura_key}"
+        infura_key = os.getenv('INFURA_API_KEY', '')
+        rpc_urls = [f"{url}{infura_key}" if 'infura.io' in url and url.endswith('/v3/') else url for url in rpc_urls]
         
         try:
+            # Probe every endpoint once; the monitor keeps probing in the background
+            probe_timeout = float(os.getenv('BLOCKCHAIN_RPC_PROBE_TIMEOUT', '5'))
+            self._rpc = RpcHealthMonitor(
+                rpc_urls,
+                make_client=lambda url: Web3(Web3.HTTPProvider(url, request_kwargs={'timeout': probe_timeout})),
+                on_switch=self._switch_rpc,
+                probe_interval=float(os.getenv('BLOCKCHAIN_RPC_PROBE_SECONDS', '15')),
+                failure_threshold=int(os.getenv('BLOCKCHAIN_RPC_FAILURE_THRESHOLD', '3')),
+                cooldown=float(os.getenv('BLOCKCHAIN_RPC_COOLDOWN_SECONDS', '30'))
+            )
+            self._rpc.probe_all()
+            
             # Connect to the blockchain
-            self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+            self.w3 = Web3(Web3.HTTPProvider(self._rpc.active.url))
             
             # Add PoA middleware for Polygon
             if 'polygon' in self.network_name:
                 self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
             
-            if self.w3.is_connected():
+            self._rpc.start()
+            
+            if self._rpc.is_healthy():
                 print(f"✅ Connected to {self.network_config['name']}")
                 
                 # Set up account if private key is provided
@@ -191,6 +272,14 @@ class BlockchainService:
                         private_key = private_key[2:]
                     self.account = Account.from_key(private_key)
                     print(f"✅ Wallet loaded: {self.account.address[:10]}...{self.account.address[-6:]}")
+                    self._nonces = NonceManager(self.w3, self.account.address)
+                    max_fee_gwei = os.getenv('BLOCKCHAIN_MAX_FEE_GWEI')
+                    self._gas = GasPriceOracle(
+                        self.w3,
+                        ttl=float(os.getenv('BLOCKCHAIN_GAS_PRICE_TTL', '10')),
+                        min_priority_fee_gwei=float(os.getenv('BLOCKCHAIN_MIN_PRIORITY_FEE_GWEI', '0')),
+                        max_fee_gwei=float(max_fee_gwei) if max_fee_gwei else None
+                    )
                 
                 # Set up contract if address is provided
                 if contract_address and Web3.is_address(contract_address):
@@ -208,9 +297,24 @@ class BlockchainService:
         except Exception as e:
             print(f"⚠️ Blockchain initialization error: {e}")
     
+    def _switch_rpc(self, url: str):
+        """Failover: point the shared Web3 client (and so the contract) at another endpoint"""
+        if self.w3 is not None:
+            self.w3.provider = Web3.HTTPProvider(url)
+    
+    def _rpc_error(self, error: Exception):
+        """Count a connection-level failure against the active endpoint's circuit breaker"""
+        if self._rpc is not None and isinstance(error, (OSError, TimeoutError)):
+            self._rpc.report_failure(error)
+    
+    def _rpc_ok(self):
+        """The active endpoint answered: reset its consecutive-failure count"""
+        if self._rpc is not None:
+            self._rpc.report_success()
+    
     def is_available(self) -> bool:
-        """Check if blockchain service is available"""
-        return WEB3_AVAILABLE and self.w3 is not None and self.w3.is_connected()
+        """Check if blockchain service is available (cached health state, no RPC call)"""
+        return WEB3_AVAILABLE and self.w3 is not None and self._rpc is not None and self._rpc.is_healthy()
     
     def is_fully_configured(self) -> bool:
         """Check if blockchain service is fully configured with contract"""
@@ -227,7 +331,16 @@ class BlockchainService:
             'explorer': self.network_config['explorer'],
             'contract_address': os.getenv('BLOCKCHAIN_CONTRACT_ADDRESS'),
             'wallet_address': self.account.address if self.account else None,
-            'mode': 'live' if self.is_fully_configured() else 'demo'
+            'mode': 'live' if self.is_fully_configured() else 'demo',
+            'write_mode': self.write_mode,
+            'write_behind': self.write_behind,
+            'pending_batch': len(self._batch),
+            'failed_anchors': len(self._failed_anchors),
+            'writer': self._writer.get_stats(),
+            'nonce': self._nonces.get_stats() if self._nonces else None,
+            'indexer': self._indexer.get_stats() if self._indexer else None,
+            'rpc': self._rpc.get_stats() if self._rpc else None,
+            'read_cache': self._reads.get_stats()
         }
     
     @staticmethod
@@ -282,41 +395,35 @@ class BlockchainService:
             'claim_snippet': claim_text[:100] + '...' if len(claim_text) > 100 else claim_text
         }
         
+        # Batch mode: the record is anchored later, as a leaf under a Merkle root
+        if self.write_mode == 'batch':
+            result['mode'] = 'batched'
+            result['merkle'] = {'status': 'pending'}
+            self._store.put(record_id, result)
+            self._enqueue_batch(result)
+            return result
+        
+        # Write-behind: store as pending and let the writer sign, send and track the receipt
+        if self.write_behind and self.is_fully_configured():
+            result.update({'mode': 'live', 'chain_status': 'pending'})
+            self._store.put(record_id, result)
+            try:
+                self._writer.submit(record_id)
+            except queue.Full:
+                result.update({'mode': 'demo_fallback', 'chain_status': 'failed',
+                               'error': 'Blockchain write queue is full'})
+                self._store.put(record_id, result)
+            return result
+        
         # If fully configured, submit to blockchain
-        if self.is_fully_configured():
+        if self.is_fully_configured() and not self.is_available():
+            result['error'] = 'Blockchain RPC unavailable'  # Circuit open: don't wait out a timeout
+            result['mode'] = 'demo_fallback'
+        elif self.is_fully_configured():
             try:
-                # Prepare transaction
                 score_wei = int(verification_score * 10000)  # Store as integer (0-10000)
-                claim_hash_bytes = bytes.fromhex(claim_hash[2:])
-                
-                tx = self.contract.functions.recordVerification(
-                    claim_hash_bytes,
-                    score_wei,
-                    status,
-                    verdict[:256]  # Limit verdict length
-                ).build_transaction({
-                    'from': self.account.address,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                    'gas': 300000,
-                    'gasPrice': self.w3.eth.gas_price
-                })
-                
-                # Sign and send transaction
-                signed_tx = self.w3.eth.account.sign_transaction(tx, self.account.key)
-                tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-                
-                # Wait for transaction receipt
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
-                
-                result.update({
-                    'mode': 'live',
-                    'transaction_hash': receipt['transactionHash'].hex(),
-                    'block_number': receipt['blockNumber'],
-                    'gas_used': receipt['gasUsed'],
-                    'explorer_url': f"{self.network_config['explorer']}/tx/{receipt['transactionHash'].hex()}" if self.network_config['explorer'] else None
-                })
-                
-                print(f"✅ Verification recorded on blockchain: {receipt['transactionHash'].hex()}")
+                result.update(self._send_record_transaction(claim_hash, score_wei, status, verdict))
+                result['mode'] = 'live'
                 
             except (ConnectionError, TimeoutError) as e:
                 print(f"⚠️ Blockchain transaction failed (connection): {e}")
@@ -334,11 +441,254 @@ class BlockchainService:
                 result['mode'] = 'demo_fallback'
         
         # Store locally for demo mode or as backup
-        self._local_records[record_id] = result
-        self._save_local_records()
+        self._store.put(record_id, result)
         
         return result
     
+    def _submit_record_transaction(self, claim_hash: str, score: int, status: str, verdict: str) -> str:
+        """Sign and send recordVerification without waiting for it to be mined. Returns the tx hash"""
+        claim_hash_bytes = bytes.fromhex(claim_hash[2:])
+        
+        # Nonce and fees come from local state: no RPC preamble per transaction
+        nonce = self._nonces.allocate()
+        try:
+            tx = self.contract.functions.recordVerification(
+                claim_hash_bytes,
+                score,
+                status,
+                verdict[:256]  # Limit verdict length
+            ).build_transaction({
+                'from': self.account.address,
+                'nonce': nonce,
+                'gas': 300000,
+                **self._gas.fees()
+            })
+            
+            # Sign and send transaction
+            signed_tx = self.w3.eth.account.sign_transaction(tx, self.account.key)
+            tx_hash = Web3.to_hex(self.w3.eth.send_raw_transaction(signed_tx.raw_transaction))
+        except Exception as e:
+            # The nonce may be unused (or the node disagrees): refetch the pending count next time
+            self._nonces.resync()
+            self._rpc_error(e)
+            if 'underpriced' in str(e).lower() or 'fee too low' in str(e).lower():
+                self._gas.invalidate()
+            raise
+        self._rpc_ok()
+        return tx_hash
+    
+    def _get_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """Receipt for a sent transaction, or None while it is not mined yet"""
+        try:
+            return self.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+    
+    def _receipt_fields(self, receipt) -> Dict[str, Any]:
+        """Record fields from a mined receipt: tx hash, block, gas, explorer link and on-chain record id"""
+        tx_hex = Web3.to_hex(receipt['transactionHash'])
+        fields = {
+            'transaction_hash': tx_hex,
+            'block_number': receipt['blockNumber'],
+            'gas_used': receipt['gasUsed'],
+            'explorer_url': f"{self.network_config['explorer']}/tx/{tx_hex}" if self.network_config['explorer'] else None
+        }
+        try:
+            events = self.contract.events.VerificationRecorded().process_receipt(receipt)
+            if events:
+                fields['onchain_record_id'] = Web3.to_hex(events[0]['args']['recordId'])
+        except Exception as e:
+            print(f"⚠️ Could not decode VerificationRecorded from {tx_hex}: {e}")
+        print(f"✅ Verification recorded on blockchain: {tx_hex}")
+        return fields
+    
+    def _send_record_transaction(self, claim_hash: str, score: int, status: str, verdict: str) -> Dict[str, Any]:
+        """
+        Send recordVerification and wait for the receipt
+        
+        Returns:
+            {transaction_hash, block_number, gas_used, explorer_url, onchain_record_id}; raises on failure
+        """
+        tx_hash = self._submit_record_transaction(claim_hash, score, status, verdict)
+        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
+        if receipt['status'] != 1:
+            raise ValueError(f"Transaction {tx_hash} reverted")
+        return self._receipt_fields(receipt)
+    
+    # ------------------------------------------------------------------
+    # Merkle batching
+    # ------------------------------------------------------------------
+    
+    def _enqueue_batch(self, record: Dict[str, Any]):
+        with self._batch_changed:
+            if not self._batch:
+                self._batch_started = time.time()
+            self._batch.append(dict(record))
+            # The first record arms the batch_seconds timer; a full batch flushes at once
+            if len(self._batch) == 1 or len(self._batch) >= self.batch_size:
+                self._batch_changed.notify()
+    
+    def _flush_delay(self, now: float) -> Optional[float]:
+        """Seconds until the buffered batch is due (0 = now), or None when nothing is buffered (lock held)"""
+        if not self._batch:
+            return None
+        if len(self._batch) >= self.batch_size:
+            return 0.0
+        return max(self._batch_started + self.batch_seconds - now, 0.0)
+    
+    def _retry_delay(self, now: float) -> Optional[float]:
+        """Seconds until a failed anchor is due for a retry (0 = now), or None when there are none (lock held)"""
+        if not self._failed_anchors:
+            return None
+        return max(min(entry['next_retry'] for entry in self._failed_anchors) - now, 0.0)
+    
+    def _batch_loop(self):
+        """
+        Flush when the batch reaches batch_size records or its oldest record is
+        batch_seconds old, and re-send anchors that failed once their retry is due
+        """
+        while True:
+            with self._batch_changed:
+                while True:
+                    now = time.time()
+                    flush_in, retry_in = self._flush_delay(now), self._retry_delay(now)
+                    if flush_in == 0 or retry_in == 0:
+                        break
+                    delays = [delay for delay in (flush_in, retry_in) if delay is not None]
+                    self._batch_changed.wait(min(delays) if delays else None)
+            try:
+                if flush_in == 0:
+                    self.flush_batch()
+                if retry_in == 0:
+                    self.retry_failed_anchors()
+            except Exception as e:
+                print(f"⚠️ Merkle batch flush failed: {e}")
+    
+    def _anchor_root(self, root: str, size: int) -> Dict[str, Any]:
+        """
+        Send one recordVerification carrying a Merkle root (status 'merkle_root')
+        
+        Returns:
+            {status: local|anchored|failed, transaction_hash, block_number,
+             explorer_url, onchain_record_id, error}
+        """
+        anchor = {
+            'status': 'local',  # Proofs are valid; the root just isn't on-chain
+            'transaction_hash': None,
+            'block_number': None,
+            'explorer_url': None,
+            'onchain_record_id': None
+        }
+        if self.is_fully_configured() and not self.is_available():
+            anchor['status'] = 'failed'
+            anchor['error'] = 'Blockchain RPC unavailable'
+        elif self.is_fully_configured():
+            try:
+                anchor.update(self._send_record_transaction(
+                    root, 0, 'merkle_root', f"Merkle root of {size} verification records"
+                ))
+                anchor['status'] = 'anchored'
+            except Exception as e:
+                print(f"⚠️ Merkle root anchoring failed: {e}")
+                anchor['status'] = 'failed'
+                anchor['error'] = str(e)
+        return anchor
+    
+    def flush_batch(self) -> Optional[Dict[str, Any]]:
+        """
+        Anchor the buffered records now: one recordVerification carrying the
+        Merkle root, then store each record with its inclusion proof. A root
+        whose transaction fails is kept for retry_failed_anchors()
+        
+        Returns:
+            The anchor details, or None if nothing was buffered
+        """
+        with self._batch_changed:
+            batch, self._batch = self._batch, []
+        if not batch:
+            return None
+        
+        tree = MerkleTree([record_leaf(record) for record in batch])
+        anchor = {
+            'root': tree.root,
+            'size': len(tree),
+            'anchored_at': int(time.time()),
+            **self._anchor_root(tree.root, len(tree))
+        }
+        
+        updated = []
+        for index, record in enumerate(batch):
+            record['merkle'] = {**anchor, 'leaf_index': index, 'proof': tree.proof(index)}
+            record['mode'] = 'live' if anchor['status'] == 'anchored' else 'batched'
+            for key in ('transaction_hash', 'block_number', 'explorer_url'):
+                record[key] = anchor[key]
+            updated.append((record['record_id'], record))
+        self._store.put_many(updated)
+        
+        if anchor['status'] == 'failed':
+            with self._batch_changed:
+                self._failed_anchors.append({
+                    'root': tree.root,
+                    'size': len(tree),
+                    'record_ids': [record['record_id'] for record in batch],
+                    'attempts': 1,
+                    'next_retry': time.time() + self.batch_retry_seconds,
+                    'error': anchor.get('error')
+                })
+                self._save_failed_anchors()
+                self._batch_changed.notify()
+        
+        print(f"✅ Merkle batch of {len(tree)} records: root {tree.root[:18]}... ({anchor['status']})")
+        return anchor
+    
+    def retry_failed_anchors(self, force: bool = False) -> int:
+        """
+        Re-send the anchor transaction for roots that failed (those due, or all
+        with force=True). The stored proofs stay valid: only the anchor fields
+        of the batch's records change. Retries back off exponentially up to an hour.
+        
+        Returns:
+            Number of roots anchored
+        """
+        now = time.time()
+        with self._batch_changed:
+            due = [entry for entry in self._failed_anchors if force or entry['next_retry'] <= now]
+        
+        anchored = 0
+        for entry in due:
+            anchor = self._anchor_root(entry['root'], entry['size'])
+            if anchor['status'] != 'anchored':
+                entry['attempts'] += 1
+                entry['next_retry'] = time.time() + min(self.batch_retry_seconds * 2 ** (entry['attempts'] - 1), 3600)
+                entry['error'] = anchor.get('error')
+                continue
+            
+            updated = []
+            for record_id in entry['record_ids']:
+                record = self._store.get(record_id)
+                if record is None or (record.get('merkle') or {}).get('root') != entry['root']:
+                    continue
+                merkle = {key: value for key, value in record['merkle'].items() if key != 'error'}
+                record['merkle'] = {**merkle, **anchor, 'anchored_at': int(time.time())}
+                record['mode'] = 'live'
+                for key in ('transaction_hash', 'block_number', 'explorer_url'):
+                    record[key] = anchor[key]
+                updated.append((record_id, record))
+            self._store.put_many(updated)
+            with self._batch_changed:
+                self._failed_anchors.remove(entry)
+            anchored += 1
+            print(f"✅ Merkle root {entry['root'][:18]}... anchored on retry {entry['attempts']}")
+        
+        if due:
+            with self._batch_changed:
+                self._save_failed_anchors()
+        return anchored
+    
+    def _save_failed_anchors(self):
+        """Persist the retry list so a restart keeps retrying (lock held)"""
+        self._store.set_meta(self.FAILED_ANCHORS_META, json.dumps(self._failed_anchors))
+    
     def get_verification(self, record_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a verification record from the blockchain
@@ -349,38 +699,125 @@ class BlockchainService:
         Returns:
             Dictionary with verification details or None if not found
         """
-        # Try blockchain first
-        if self.is_fully_configured():
-            try:
-                record_id_bytes = bytes.fromhex(record_id[2:] if record_id.startswith('0x') else record_id)
-                
-                result = self.contract.functions.getVerification(record_id_bytes).call()
-                
-                if result[4] > 0:  # timestamp > 0 means record exists
-                    return {
-                        'success': True,
-                        'mode': 'live',
-                        'record_id': record_id,
-                        'claim_hash': '0x' + result[0].hex(),
-                        'verification_score': result[1] / 10000,
-                        'status': result[2],
-                        'verdict': result[3],
-                        'timestamp': result[4],
-                        'timestamp_iso': datetime.fromtimestamp(result[4]).isoformat(),
-                        'verifier': result[5],
-                        'network': self.network_config['name']
-                    }
-            except Exception as e:
-                print(f"⚠️ Error fetching from blockchain: {e}")
+        # Writes still in flight (or failed) only exist locally
+        local = self._store.get(record_id)
+        if local is not None and local.get('chain_status') in ('pending', 'submitted', 'failed', 'orphaned'):
+            local['source'] = 'local_cache'
+            return local
+        
+        # Confirmed records seen by the event indexer are served without an RPC round trip
+        if local is not None and local.get('chain_status') == 'confirmed' and local.get('block_hash'):
+            local['source'] = 'indexer'
+            return local
+        
+        # Batched records are only on-chain through their Merkle root (see verify_record)
+        if local is not None and local.get('merkle'):
+            local['source'] = 'merkle_batch'
+            return local
+        
+        # Confirmed write-behind records know the id the contract assigned
+        chain_id = (local or {}).get('onchain_record_id') or record_id
+        record = self._read_onchain_record(chain_id)
+        if record is not None:
+            return {**record, 'record_id': record_id}
         
         # Fall back to local records
-        if record_id in self._local_records:
-            record = self._local_records[record_id].copy()
-            record['source'] = 'local_cache'
-            return record
+        if local is not None:
+            local['source'] = 'local_cache'
+            return local
         
         return None
     
+    def _read_onchain_record(self, chain_id: str) -> Optional[Dict[str, Any]]:
+        """getVerification through the read cache (hits need no connectivity check or RPC)"""
+        cache_key = f"record:{chain_id.lower()}"
+        cached = self._reads.get(cache_key)
+        if cached is not MISSING:
+            return cached
+        if not (self.is_fully_configured() and self.is_available()):
+            return None  # Not configured, or the RPC circuit is open: fail fast
+        
+        try:
+            record_id_bytes = bytes.fromhex(chain_id[2:] if chain_id.startswith('0x') else chain_id)
+            result = self.contract.functions.getVerification(record_id_bytes).call()
+        except ContractLogicError:
+            result = None  # Reverts with "record not found"
+        except Exception as e:
+            print(f"⚠️ Error fetching from blockchain: {e}")
+            self._rpc_error(e)
+            return None  # Transient: don't cache
+        self._rpc_ok()  # A revert is an answer too
+        
+        if not result or result[4] == 0:  # timestamp > 0 means record exists
+            self._reads.set(cache_key, None, ttl=self.negative_cache_seconds)
+            return None
+        
+        record = {
+            'success': True,
+            'mode': 'live',
+            'record_id': chain_id,
+            'claim_hash': '0x' + result[0].hex(),
+            'verification_score': result[1] / 10000,
+            'status': result[2],
+            'verdict': result[3],
+            'timestamp': result[4],
+            'timestamp_iso': datetime.fromtimestamp(result[4]).isoformat(),
+            'verifier': result[5],
+            'network': self.network_config['name'],
+            'chain_status': 'confirmed'
+        }
+        self._reads.set(cache_key, record)
+        return record
+    
+    def get_verification_by_claim_hash(self, claim_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Latest on-chain record for a claim hash (getVerificationByClaimHash)
+        
+        The claim -> record mapping moves when a claim is re-verified, so it
+        is cached for claim_cache_seconds; the record itself is cached for good.
+        """
+        cache_key = f"claim:{claim_hash.lower()}"
+        chain_id = self._reads.get(cache_key)
+        if chain_id is None:
+            return None  # Cached "no record for claim"
+        if chain_id is not MISSING:
+            return self._read_onchain_record(chain_id)
+        if not (self.is_fully_configured() and self.is_available()):
+            return self._store.find_by_claim_hash(claim_hash)
+        
+        try:
+            result = self.contract.functions.getVerificationByClaimHash(
+                bytes.fromhex(claim_hash[2:] if claim_hash.startswith('0x') else claim_hash)
+            ).call()
+        except ContractLogicError:
+            self._rpc_ok()
+            self._reads.set(cache_key, None, ttl=self.negative_cache_seconds)
+            return None
+        except Exception as e:
+            print(f"⚠️ Error fetching from blockchain: {e}")
+            self._rpc_error(e)
+            return self._store.find_by_claim_hash(claim_hash)
+        self._rpc_ok()
+        
+        chain_id = '0x' + result[0].hex()
+        self._reads.set(cache_key, chain_id, ttl=self.claim_cache_seconds)
+        record = {
+            'success': True,
+            'mode': 'live',
+            'record_id': chain_id,
+            'claim_hash': claim_hash,
+            'verification_score': result[1] / 10000,
+            'status': result[2],
+            'verdict': result[3],
+            'timestamp': result[4],
+            'timestamp_iso': datetime.fromtimestamp(result[4]).isoformat(),
+            'verifier': result[5],
+            'network': self.network_config['name'],
+            'chain_status': 'confirmed'
+        }
+        self._reads.set(f"record:{chain_id.lower()}", record)
+        return record
+    
     def verify_record(self, record_id: str, claim_text: str) -> Dict[str, Any]:
         """
         Verify that a record exists and matches the claim
@@ -411,6 +848,58 @@ class BlockchainService:
                 'actual_hash': record.get('claim_hash')
             }
         
+        # Batched records carry an inclusion proof, checked without any RPC call
+        merkle = record.get('merkle') or {}
+        if merkle.get('proof') is not None:
+            if not verify_proof(record_leaf(record), merkle['proof'], merkle.get('root', '')):
+                return {
+                    'verified': False,
+                    'reason': 'Merkle inclusion proof does not match the batch root - record may have been modified',
+                    'record_id': record_id,
+                    'merkle_root': merkle.get('root')
+                }
+            if merkle.get('status') != 'anchored':
+                # Internally consistent, but there is no on-chain commitment to check against yet
+                return {
+                    'verified': True,
+                    'record': record,
+                    'merkle': {'root': merkle['root'], 'included': True, 'anchored': False,
+                               'anchor_status': merkle.get('status')},
+                    'message': 'Record matches its Merkle inclusion proof; the batch root is not anchored on-chain yet'
+                }
+            
+            # The root must be what the anchor transaction actually recorded on-chain
+            anchor_id = merkle.get('onchain_record_id')
+            onchain = self._read_onchain_record(anchor_id) if anchor_id else None
+            if onchain is None:
+                return {
+                    'verified': False,
+                    'reason': 'Merkle root anchor could not be read on-chain',
+                    'record_id': record_id,
+                    'merkle_root': merkle['root'],
+                    'anchor_record_id': anchor_id
+                }
+            if onchain.get('claim_hash', '').lower() != merkle['root'].lower() or onchain.get('status') != 'merkle_root':
+                return {
+                    'verified': False,
+                    'reason': 'Merkle root does not match the on-chain anchor - record may have been modified',
+                    'record_id': record_id,
+                    'merkle_root': merkle['root'],
+                    'onchain_root': onchain.get('claim_hash')
+                }
+            return {
+                'verified': True,
+                'record': record,
+                'merkle': {
+                    'root': merkle['root'],
+                    'included': True,
+                    'anchored': True,
+                    'anchor_record_id': anchor_id,
+                    'transaction_hash': merkle.get('transaction_hash')
+                },
+                'message': 'Record verified - content matches record, Merkle inclusion proof and on-chain root'
+            }
+        
         return {
             'verified': True,
             'record': record,
@@ -419,9 +908,15 @@ class BlockchainService:
     
     def get_recent_records(self, limit: int = 10) -> list:
         """Get recent verification records from local cache"""
-        records = list(self._local_records.values())
-        records.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
-        return records[:limit]
+        return self._store.recent(limit)
+    
+    def get_record_stats(self) -> Dict[str, Any]:
+        """Exact record totals for the dashboard: {total, false, verified, by_status}"""
+        return self._store.stats()
+    
+    def get_hourly_stats(self, hours: int = 24) -> List[Dict[str, int]]:
+        """Per-hour {hour, total, false, verified} for the last `hours` hours"""
+        return self._store.hourly(hours)
     
     def anchor_hash(self, data: str) -> Dict[str, Any]:
         """
@@ -459,30 +954,8 @@ class BlockchainService:
             except Exception as e:
                 print(f"⚠️ Could not get block info: {e}")
         
-        self._local_records[anchor_id] = result
-        self._save_local_records()
+        self._store.put(anchor_id, result)
         return result
-    
-    def _load_local_records(self):
-        """Load local records from file"""
-        if os.path.exists(self._storage_file):
-            try:
-                with open(self._storage_file, 'r') as f:
-                    self._local_records = json.load(f)
-                print(f"✅ Loaded {len(self._local_records)} local blockchain records")
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"⚠️ Failed to load local records: {e}")
-                self._local_records = {}
-        else:
-            self._local_records = {}
-    
-    def _save_local_records(self):
-        """Save local records to file"""
-        try:
-            with open(self._storage_file, 'w') as f:
-                json.dump(self._local_records, f, indent=2)
-        except IOError as e:
-            print(f"⚠️ Failed to save local records: {e}")
 
 
 # Global instance
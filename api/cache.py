@@ -0,0 +1,193 @@
+"""
+RapidVerify Caching Utilities
+Thread-safe LRU caches with per-entry TTLs and an optional SQLite persistent tier
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+# Sentinel for "not in cache" so cached falsy values ([] / None) still count as hits
+MISSING = object()
+_DEFAULT_TTL = object()
+
+
+class TTLCache:
+    """
+    Bounded LRU cache with per-entry expiry
+
+    Safe to share across Flask worker threads. When persist_path is given,
+    entries are written through to a SQLite file and memory misses fall back
+    to it, so a restarted worker starts warm. Persisted values must be
+    JSON-serializable.
+    """
+
+    def __init__(self, name: str, max_entries: int = 1024, default_ttl: Optional[float] = 3600,
+                 persist_path: Optional[str] = None):
+        self.name = name
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl  # None = entries never expire
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'persistent_hits': 0, 'evictions': 0, 'expirations': 0}
+
+        self._db: Optional[sqlite3.Connection] = None
+        if persist_path:
+            try:
+                os.makedirs(os.path.dirname(persist_path) or '.', exist_ok=True)
+                self._db = sqlite3.connect(persist_path, check_same_thread=False)
+                self._db.execute(
+                    'CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)'
+                )
+                self._db.execute('DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at < ?', (time.time(),))
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ {name} cache: persistent tier disabled ({e})")
+                self._db = None
+
+    def _expiry(self, ttl) -> Optional[float]:
+        if ttl is _DEFAULT_TTL:
+            ttl = self.default_ttl
+        return None if ttl is None else time.time() + ttl
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """Return the cached value, or default if absent/expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return value
+                del self._entries[key]
+                self._stats['expirations'] += 1
+
+            if self._db is not None:
+                row = self._db.execute('SELECT value, expires_at FROM cache WHERE key = ?', (key,)).fetchone()
+                if row and (row[1] is None or row[1] > now):
+                    value = json.loads(row[0])
+                    self._store(key, value, row[1])
+                    self._stats['hits'] += 1
+                    self._stats['persistent_hits'] += 1
+                    return value
+
+            self._stats['misses'] += 1
+            return default
+
+    def set(self, key: str, value: Any, ttl=_DEFAULT_TTL):
+        """Cache a value; ttl in seconds (None = never expires, omitted = default_ttl)"""
+        expires_at = self._expiry(ttl)
+        with self._lock:
+            self._store(key, value, expires_at)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+                        (key, json.dumps(value), expires_at)
+                    )
+                    self._db.commit()
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    print(f"⚠️ {self.name} cache: failed to persist entry ({e})")
+
+    def _store(self, key: str, value: Any, expires_at: Optional[float]):
+        """Insert into the memory tier and evict least-recently-used entries (lock held)"""
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def delete(self, key: str):
+        """Drop a key from both tiers"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if self._db is not None:
+                self._db.execute('DELETE FROM cache WHERE key = ?', (key,))
+                self._db.commit()
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM cache')
+                self._db.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit-rate and size statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats.update({
+            'name': self.name,
+            'max_entries': self.max_entries,
+            'persistent': self._db is not None,
+            'hit_rate': round(stats['hits'] / lookups, 3) if lookups else 0.0
+        })
+        return stats
+
+
+class _Flight:
+    """One in-progress computation that followers wait on"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight block until it finishes and receive the same result (or
+    exception) instead of repeating the work.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._stats = {'leaders': 0, 'coalesced': 0}
+
+    def do(self, key: str, fn) -> tuple:
+        """Run fn() once per concurrent key. Returns (result, shared)"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+                self._stats['leaders'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = fn()
+            return flight.result, False
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.event.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Leader/follower counts and current in-flight keys"""
+        with self._lock:
+            return {**self._stats, 'in_flight': len(self._flights)}
@@ -0,0 +1,184 @@
+"""
+RapidVerify Chain Indexer
+Polls VerificationRecorded logs and materializes them into the local record store
+"""
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+def _hex(value) -> str:
+    """0x-prefixed hex for bytes/HexBytes values from web3"""
+    return '0x' + bytes(value).hex()
+
+
+class ChainIndexer:
+    """
+    Incremental, reorg-aware sync of contract events into the record store
+
+    Every record the contract emits - including those written by other
+    verifier nodes - becomes a local record keyed by its on-chain record id
+    (records this node sent are updated in place instead, matched by
+    transaction hash). Progress is checkpointed in the store by block number
+    and block hash. If the checkpoint block's hash changes, the chain has
+    reorganized: the indexer rewinds `reorg_depth` blocks, marks the records
+    it indexed from those blocks 'orphaned', and rescans; records whose
+    logs reappear on the new branch are confirmed again. Reorgs deeper than
+    `reorg_depth` are not detected.
+
+    Merkle-root anchors from batch mode are skipped: without the batch's
+    proofs they carry no record of their own.
+    """
+
+    def __init__(self, service, poll_interval: float = 15, reorg_depth: int = 12,
+                 max_block_range: int = 2000, start_block: Optional[int] = None):
+        self.service = service
+        self.poll_interval = poll_interval
+        self.reorg_depth = reorg_depth
+        self.max_block_range = max_block_range  # Providers cap eth_getLogs ranges
+        self.start_block = start_block  # First block for a fresh checkpoint (None = current head)
+        self.checkpoint_key = f"chain_indexer:{service.network_name}:{service.contract.address.lower()}"
+        self._checkpoint: Optional[Dict[str, Any]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {'indexed': 0, 'reorgs': 0, 'errors': 0, 'head': None, 'last_sync': None}
+
+    def start(self):
+        """Start the polling thread (idempotent)"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name='chain-indexer', daemon=True)
+        self._thread.start()
+
+    def get_stats(self) -> Dict[str, Any]:
+        checkpoint = self._checkpoint or {}
+        return {'block': checkpoint.get('block'), **self._stats}
+
+    def _loop(self):
+        while True:
+            try:
+                # Catch up in max_block_range steps before waiting
+                while self.sync_once():
+                    pass
+            except Exception as e:
+                self._stats['errors'] += 1
+                print(f"⚠️ Chain indexer sync failed: {e}")
+            time.sleep(self.poll_interval)
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def _load_checkpoint(self, head: int) -> Dict[str, Any]:
+        if self._checkpoint is None:
+            stored = self.service._store.get_meta(self.checkpoint_key)
+            if stored:
+                self._checkpoint = json.loads(stored)
+            else:
+                start = self.start_block if self.start_block is not None else head
+                self._checkpoint = {'block': start - 1, 'block_hash': None, 'recent': []}
+        return self._checkpoint
+
+    def _save_checkpoint(self):
+        self.service._store.set_meta(self.checkpoint_key, json.dumps(self._checkpoint))
+
+    def sync_once(self) -> bool:
+        """Index the next block range. Returns True if more blocks remain behind the head"""
+        w3 = self.service.w3
+        head = w3.eth.block_number
+        checkpoint = self._load_checkpoint(head)
+        self._stats['head'] = head
+
+        if checkpoint['block_hash'] and checkpoint['block'] >= 0:
+            current_hash = _hex(w3.eth.get_block(checkpoint['block'])['hash'])
+            if current_hash != checkpoint['block_hash']:
+                self._rewind(checkpoint)
+
+        from_block = checkpoint['block'] + 1
+        if from_block > head:
+            return False
+        to_block = min(head, from_block + self.max_block_range - 1)
+
+        logs = self.service.contract.events.VerificationRecorded().get_logs(
+            from_block=from_block, to_block=to_block
+        )
+        for log in logs:
+            record_id = self._materialize(log)
+            if record_id:
+                checkpoint['recent'].append([log['blockNumber'], record_id])
+
+        checkpoint['block'] = to_block
+        checkpoint['block_hash'] = _hex(w3.eth.get_block(to_block)['hash'])
+        checkpoint['recent'] = [entry for entry in checkpoint['recent'] if entry[0] > to_block - self.reorg_depth]
+        self._save_checkpoint()
+        self._stats['last_sync'] = datetime.now().isoformat()
+        return to_block < head
+
+    def _rewind(self, checkpoint: Dict[str, Any]):
+        """Step back reorg_depth blocks and orphan what was indexed from them"""
+        fork_block = max(checkpoint['block'] - self.reorg_depth, -1)
+        print(f"⚠️ Chain reorg detected at block {checkpoint['block']}; rescanning from {fork_block + 1}")
+        self._stats['reorgs'] += 1
+
+        for block_number, record_id in checkpoint['recent']:
+            if block_number > fork_block:
+                record = self.service._store.get(record_id)
+                if record is not None:
+                    record['chain_status'] = 'orphaned'
+                    self.service._store.put(record_id, record)
+
+        checkpoint['recent'] = [entry for entry in checkpoint['recent'] if entry[0] <= fork_block]
+        checkpoint['block'] = fork_block
+        checkpoint['block_hash'] = (_hex(self.service.w3.eth.get_block(fork_block)['hash'])
+                                    if fork_block >= 0 else None)
+
+    def _materialize(self, log) -> Optional[str]:
+        """Upsert the record for one VerificationRecorded log. Returns the local record id"""
+        args = log['args']
+        if args['status'] == 'merkle_root':
+            return None
+
+        store = self.service._store
+        onchain_id = _hex(args['recordId'])
+        claim_hash = _hex(args['claimHash'])
+        tx_hash = _hex(log['transactionHash'])
+        explorer = self.service.network_config['explorer']
+        chain_fields = {
+            'onchain_record_id': onchain_id,
+            'transaction_hash': tx_hash,
+            'block_number': log['blockNumber'],
+            'block_hash': _hex(log['blockHash']),
+            'explorer_url': f"{explorer}/tx/{tx_hash}" if explorer else None,
+            'chain_status': 'confirmed',
+            'mode': 'live'
+        }
+
+        # Our own write: same transaction, stored under the local record id
+        record_id = onchain_id
+        record = store.get(onchain_id)
+        if record is None:
+            local = store.find_by_transaction_hash(tx_hash)
+            if local is not None:
+                record_id, record = local['record_id'], local
+
+        if record is None:
+            timestamp = args['timestamp']
+            record = {
+                'success': True,
+                'record_id': onchain_id,
+                'claim_hash': claim_hash,
+                'verification_score': args['score'] / 10000,
+                'status': args['status'],
+                'verdict': None,  # Not in the event; getVerification has it
+                'timestamp': timestamp,
+                'timestamp_iso': datetime.fromtimestamp(timestamp).isoformat(),
+                'network': self.service.network_config['name'],
+                'gas_used': None,
+                'source': 'indexer'
+            }
+
+        record.update(chain_fields)
+        store.put(record_id, record)
+        self._stats['indexed'] += 1
+        return record_id
@@ -0,0 +1,144 @@
+"""
+RapidVerify Chain Writer
+Write-behind submission of verification records: sign and send off the request path, then track receipts
+"""
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Lifecycle of a record's on-chain write (record['chain_status'])
+CHAIN_STATUSES = ('pending', 'submitted', 'confirmed', 'failed')
+
+
+class ChainWriter:
+    """
+    Background writer for BlockchainService
+
+    record_verification stores the record as 'pending' and returns at once.
+    A sender thread signs and sends the transaction ('submitted', with its
+    hash); a receipt thread polls for the receipt and settles the record as
+    'confirmed' (block, gas, on-chain record id) or 'failed'. Every
+    transition is written through the record store, so the state survives
+    restarts and is what /api/blockchain/verify/<id> returns meanwhile.
+    Records still pending or submitted at startup are picked up again.
+    """
+
+    def __init__(self, service, receipt_timeout: float = 300, poll_interval: float = 2.0,
+                 max_pending: int = 10000):
+        self.service = service
+        self.receipt_timeout = receipt_timeout  # Submitted without a receipt for this long -> failed
+        self.poll_interval = poll_interval
+        self._outbox: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._submitted: Dict[str, Dict[str, Any]] = {}  # record_id -> {tx_hash, submitted_at}
+        self._lock = threading.Lock()
+        self._threads = []
+        self._counts = {'sent': 0, 'confirmed': 0, 'failed': 0}
+
+    def start(self):
+        """Start the sender and receipt threads (idempotent)"""
+        if self._threads:
+            return
+        for target, name in ((self._send_loop, 'chain-sender'), (self._receipt_loop, 'chain-receipts')):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, record_id: str):
+        """Queue a stored 'pending' record for sending (raises queue.Full when the backlog is at capacity)"""
+        self._outbox.put_nowait(record_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            submitted = len(self._submitted)
+        return {'queued': self._outbox.qsize(), 'awaiting_receipt': submitted, **self._counts}
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def _update(self, record_id: str, **fields) -> Optional[Dict[str, Any]]:
+        record = self.service._store.get(record_id)
+        if record is None:
+            return None
+        record.update(fields)
+        self.service._store.put(record_id, record)
+        return record
+
+    def _fail(self, record_id: str, error: str):
+        print(f"⚠️ Blockchain transaction failed for {record_id[:18]}...: {error}")
+        self._counts['failed'] += 1
+        self._update(record_id, chain_status='failed', mode='demo_fallback', error=error)
+
+    def _recover(self):
+        """Re-queue pending records and resume tracking submitted ones left by a previous run"""
+        for record_id, record in self.service._store.find_by_chain_status('pending', 'submitted'):
+            if record.get('chain_status') == 'pending':
+                self._outbox.put(record_id)
+            elif record.get('chain_status') == 'submitted' and record.get('transaction_hash'):
+                with self._lock:
+                    self._submitted[record_id] = {
+                        'tx_hash': record['transaction_hash'],
+                        'submitted_at': record.get('submitted_at') or time.time()
+                    }
+
+    def _send_loop(self):
+        try:
+            self._recover()
+        except Exception as e:
+            print(f"⚠️ Chain writer recovery failed: {e}")
+
+        while True:
+            record_id = self._outbox.get()
+            # Hold sends while the RPC circuit is open rather than failing them
+            while not self.service.is_available():
+                time.sleep(self.poll_interval)
+            record = self.service._store.get(record_id)
+            if record is None or record.get('chain_status') != 'pending':
+                continue
+            try:
+                tx_hash = self.service._submit_record_transaction(
+                    record['claim_hash'],
+                    int(record['verification_score'] * 10000),
+                    record['status'],
+                    record.get('verdict') or ''
+                )
+            except Exception as e:
+                self._fail(record_id, str(e))
+                continue
+
+            submitted_at = time.time()
+            self._update(record_id, chain_status='submitted', transaction_hash=tx_hash, submitted_at=submitted_at)
+            with self._lock:
+                self._submitted[record_id] = {'tx_hash': tx_hash, 'submitted_at': submitted_at}
+            self._counts['sent'] += 1
+
+    def _receipt_loop(self):
+        while True:
+            time.sleep(self.poll_interval)
+            if not self.service.is_available():
+                continue
+            with self._lock:
+                tracked = list(self._submitted.items())
+
+            for record_id, entry in tracked:
+                try:
+                    receipt = self.service._get_receipt(entry['tx_hash'])
+                except Exception as e:
+                    print(f"⚠️ Receipt lookup failed for {entry['tx_hash']}: {e}")
+                    continue
+
+                if receipt is None:
+                    if time.time() - entry['submitted_at'] < self.receipt_timeout:
+                        continue
+                    error = f"No receipt after {self.receipt_timeout:.0f}s"
+                    self._fail(record_id, error)
+                elif receipt['status'] != 1:
+                    self._fail(record_id, 'Transaction reverted')
+                else:
+                    self._update(record_id, chain_status='confirmed', mode='live',
+                                 **self.service._receipt_fields(receipt))
+                    self._counts['confirmed'] += 1
+
+                with self._lock:
+                    self._submitted.pop(record_id, None)
@@ -0,0 +1,83 @@
+"""
+RapidVerify Domain Index
+Reversed-label trie for source credibility lookups (exact domain or any subdomain of it)
+"""
+import json
+import os
+from typing import Any, Dict, Optional
+
+DEFAULT_CREDIBILITY_PATH = os.path.join(os.path.dirname(__file__), 'datasets', 'credibility.json')
+
+_ENTRY = '\0'  # Trie key holding the value stored at a node (never a valid label)
+
+
+class DomainIndex:
+    """
+    Maps registered domains to values with label-boundary matching
+
+    Lookups walk the host's labels right to left (com → reuters → www), so
+    cost is O(labels) regardless of index size. `www.reuters.com` and
+    `uk.reuters.com` match `reuters.com`; `notreuters.com.evil.io` does not.
+    """
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+        self.size = 0
+
+    @staticmethod
+    def normalize(host: str) -> str:
+        """Lowercase a host/netloc and strip credentials, port and trailing dot"""
+        host = (host or '').strip().lower()
+        host = host.rsplit('@', 1)[-1]
+        if host.startswith('['):  # IPv6 literal
+            return host
+        return host.split(':', 1)[0].rstrip('.')
+
+    def add(self, domain: str, value: Any):
+        node = self._root
+        for label in reversed(self.normalize(domain).split('.')):
+            node = node.setdefault(label, {})
+        if _ENTRY not in node:
+            self.size += 1
+        node[_ENTRY] = value
+
+    def lookup(self, host: str) -> Optional[Any]:
+        """Value for the most specific registered domain covering host, or None"""
+        node = self._root
+        found = None
+        for label in reversed(self.normalize(host).split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get(_ENTRY, found)
+        return found
+
+
+class CredibilityIndex:
+    """Source credibility dataset compiled into a DomainIndex"""
+
+    def __init__(self, document: Dict[str, Any]):
+        self.version = str(document.get('version', 'unknown'))
+        self.tiers: Dict[str, Dict[str, Any]] = document.get('tiers', {})
+        self.index = DomainIndex()
+        for domain, entry in document.get('domains', {}).items():
+            if entry.get('tier') not in self.tiers:
+                raise ValueError(f"Domain '{domain}' has unknown tier {entry.get('tier')!r}")
+            self.index.add(domain, {'domain': domain, **entry})
+
+    def lookup(self, host: str) -> Optional[Dict[str, Any]]:
+        """Dataset entry ({domain, tier, name?}) covering host, or None"""
+        return self.index.lookup(host)
+
+    def tier_score(self, tier: str) -> Optional[float]:
+        return self.tiers.get(tier, {}).get('score')
+
+
+def load_credibility_index(path: str) -> CredibilityIndex:
+    """Read and compile a credibility dataset file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return CredibilityIndex(json.load(f))
+
+
+# Global instance, shared by NewsScraper and NewsVerifier
+credibility_index = load_credibility_index(os.getenv('CREDIBILITY_DATASET_PATH') or DEFAULT_CREDIBILITY_PATH)
@@ -0,0 +1,252 @@
+"""
+RapidVerify Host Scheduler
+Per-host token buckets and in-flight limits for outbound fetches, with deadline-bounded queueing
+"""
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from domain_index import DomainIndex
+
+_ASYNC_POLL_SECONDS = 0.05  # Async waiters re-check a full host this often
+_MAX_IDLE_HOSTS = 1024  # Idle per-host state beyond this is dropped
+
+# Google search scraping gets CAPTCHAs quickly; the Fact Check API is built for volume
+DEFAULT_HOST_LIMITS = 'google.com=0.5:2:2,factchecktools.googleapis.com=20:40:16'
+
+
+class HostQueueTimeout(requests.RequestException):
+    """A request waited past its deadline for a per-host slot"""
+
+
+class HostLimits:
+    """rate (requests/second refill), burst (bucket size) and max_in_flight for one host"""
+
+    def __init__(self, rate: float, burst: float, max_in_flight: int):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.max_in_flight = max(max_in_flight, 1)
+
+    @classmethod
+    def parse(cls, spec: str, default: 'HostLimits') -> 'HostLimits':
+        """'rate:burst:max_in_flight', trailing parts optional (e.g. '0.5:2:1' or '10')"""
+        parts = [part.strip() for part in spec.split(':')]
+        rate = float(parts[0]) if parts[0] else default.rate
+        burst = float(parts[1]) if len(parts) > 1 and parts[1] else max(default.burst, rate)
+        max_in_flight = int(parts[2]) if len(parts) > 2 and parts[2] else default.max_in_flight
+        return cls(rate, burst, max_in_flight)
+
+    def describe(self) -> Dict[str, Any]:
+        return {'rate': self.rate, 'burst': self.burst, 'max_in_flight': self.max_in_flight}
+
+
+class _HostState:
+    """Bucket, in-flight count and wait statistics for one host (guarded by the scheduler lock)"""
+
+    def __init__(self, limits: HostLimits):
+        self.limits = limits
+        self.tokens = limits.burst
+        self.updated = time.monotonic()
+        self.in_flight = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def try_acquire(self, now: float) -> float:
+        """Take a slot and a token, returning 0; or the seconds until one may be free"""
+        limits = self.limits
+        self.tokens = min(limits.burst, self.tokens + (now - self.updated) * limits.rate)
+        self.updated = now
+        if self.in_flight >= limits.max_in_flight:
+            return float('inf')  # Woken by release()
+        if self.tokens < 1:
+            return (1 - self.tokens) / limits.rate if limits.rate > 0 else float('inf')
+        self.tokens -= 1
+        self.in_flight += 1
+        return 0.0
+
+    def idle(self, now: float) -> bool:
+        refilled = self.tokens + (now - self.updated) * self.limits.rate
+        return not self.in_flight and not self.waiting and refilled >= self.limits.burst
+
+
+class HostScheduler:
+    """
+    Politeness gate every outbound fetch passes through
+
+    Each host gets a token bucket (refilled at `rate` per second up to
+    `burst`) and a cap on concurrent requests. A request that finds its host
+    out of tokens or slots queues until one frees up or its deadline passes,
+    then raises HostQueueTimeout instead of adding to a burst that would
+    earn 429s or CAPTCHAs. Overrides apply to a domain and its subdomains
+    (google.com also covers www.google.com). Usable from threads (slot) and
+    from asyncio (slot_async).
+    """
+
+    def __init__(self, default: HostLimits, overrides: Optional[Dict[str, HostLimits]] = None,
+                 queue_timeout: float = 10.0):
+        self.default = default
+        self.queue_timeout = queue_timeout
+        self._overrides = DomainIndex()
+        for domain, limits in (overrides or {}).items():
+            self._overrides.add(domain, limits)
+        self._hosts: Dict[str, _HostState] = {}
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return DomainIndex.normalize(urlsplit(url).netloc)
+
+    @contextmanager
+    def slot(self, url: str, timeout: Optional[float] = None):
+        """Hold one of url's host slots for the duration of the block (blocks while queued)"""
+        host = self.host_of(url)
+        self._acquire(host, self.queue_timeout if timeout is None else timeout)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    @asynccontextmanager
+    async def slot_async(self, url: str, timeout: Optional[float] = None):
+        """slot() for coroutines: waits with asyncio.sleep instead of blocking the loop"""
+        host = self.host_of(url)
+        await self._acquire_async(host, self.queue_timeout if timeout is None else timeout)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-host queue depth, in-flight count and wait times"""
+        with self._cond:
+            hosts = {}
+            for host, state in self._hosts.items():
+                hosts[host] = {
+                    **state.limits.describe(),
+                    'in_flight': state.in_flight,
+                    'queue_depth': state.waiting,
+                    'max_queue_depth': state.max_waiting,
+                    'acquired': state.acquired,
+                    'timeouts': state.timeouts,
+                    'avg_wait_ms': round(state.wait_total / state.acquired * 1000, 1) if state.acquired else 0.0,
+                    'max_wait_ms': round(state.wait_max * 1000, 1)
+                }
+        return {
+            'default': self.default.describe(),
+            'queue_timeout': self.queue_timeout,
+            'queued': sum(h['queue_depth'] for h in hosts.values()),
+            'in_flight': sum(h['in_flight'] for h in hosts.values()),
+            'hosts': hosts
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _state(self, host: str, now: float) -> _HostState:
+        """Per-host state, created on first use (condition lock held)"""
+        state = self._hosts.get(host)
+        if state is None:
+            if len(self._hosts) >= _MAX_IDLE_HOSTS:
+                for idle_host in [h for h, s in self._hosts.items() if s.idle(now)]:
+                    del self._hosts[idle_host]
+            state = _HostState(self._overrides.lookup(host) or self.default)
+            self._hosts[host] = state
+        return state
+
+    def _begin(self, host: str) -> Tuple[_HostState, float, float]:
+        """Try once; if the host is busy, register as a waiter (condition lock held)"""
+        started = time.monotonic()
+        state = self._state(host, started)
+        wait = state.try_acquire(started)
+        if wait:
+            state.waiting += 1
+            state.max_waiting = max(state.max_waiting, state.waiting)
+        return state, started, wait
+
+    def _granted(self, state: _HostState, started: float, queued: bool):
+        waited = time.monotonic() - started
+        if queued:
+            state.waiting -= 1
+        state.acquired += 1
+        state.wait_total += waited
+        state.wait_max = max(state.wait_max, waited)
+
+    def _timed_out(self, state: _HostState, host: str, timeout: float):
+        state.waiting -= 1
+        state.timeouts += 1
+        raise HostQueueTimeout(f"Waited {timeout:.1f}s for a request slot to {host}")
+
+    def _acquire(self, host: str, timeout: float):
+        with self._cond:
+            state, started, wait = self._begin(host)
+            deadline = started + timeout
+            queued = bool(wait)
+            while wait:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timed_out(state, host, timeout)
+                self._cond.wait(min(wait, remaining))
+                wait = state.try_acquire(time.monotonic())
+            self._granted(state, started, queued)
+
+    async def _acquire_async(self, host: str, timeout: float):
+        with self._cond:
+            state, started, wait = self._begin(host)
+        deadline = started + timeout
+        queued = bool(wait)
+        while wait:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                with self._cond:
+                    self._timed_out(state, host, timeout)
+            pause = _ASYNC_POLL_SECONDS if wait == float('inf') else wait  # No cross-thread wakeup for slots
+            try:
+                await asyncio.sleep(min(pause, remaining))
+            except asyncio.CancelledError:
+                with self._cond:
+                    state.waiting -= 1
+                raise
+            with self._cond:
+                wait = state.try_acquire(time.monotonic())
+        with self._cond:
+            self._granted(state, started, queued)
+
+    def _release(self, host: str):
+        with self._cond:
+            state = self._hosts.get(host)
+            if state is not None:
+                state.in_flight -= 1
+            self._cond.notify_all()
+
+
+def _load_host_scheduler() -> HostScheduler:
+    default = HostLimits(
+        rate=float(os.getenv('HOST_RATE_PER_SECOND', '5')),
+        burst=float(os.getenv('HOST_BURST', '10')),
+        max_in_flight=int(os.getenv('HOST_MAX_IN_FLIGHT', '4'))
+    )
+    overrides = {}
+    # e.g. HOST_LIMITS=google.com=0.5:2:1,factchecktools.googleapis.com=20:40:16
+    for item in os.getenv('HOST_LIMITS', DEFAULT_HOST_LIMITS).split(','):
+        domain, _, spec = item.partition('=')
+        if domain.strip() and spec.strip():
+            try:
+                overrides[domain.strip()] = HostLimits.parse(spec, default)
+            except ValueError:
+                print(f"⚠️ Ignoring malformed HOST_LIMITS entry: {item!r}")
+    return HostScheduler(default, overrides, queue_timeout=float(os.getenv('HOST_QUEUE_TIMEOUT', '10')))
+
+
+# Global instance, shared by http_client and the async verifier
+host_scheduler = _load_host_scheduler()
@@ -0,0 +1,226 @@
+"""
+RapidVerify Outbound HTTP Client
+Shared pooled session for every outbound fetch (keep-alive, per-host pools, retries)
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+from host_scheduler import host_scheduler
+from page_reader import SCRAPE_CHUNK_SIZE, PageReader
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+
+class PoolStats:
+    """Thread-safe per-host counters for connection pool reuse"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, int]] = {}
+
+    def _bump(self, host: str, field: str):
+        with self._lock:
+            counters = self._hosts.setdefault(host, {'requests': 0, 'misses': 0})
+            counters[field] += 1
+
+    def checkout(self, host: str):
+        self._bump(host, 'requests')
+
+    def new_connection(self, host: str):
+        self._bump(host, 'misses')
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            hosts = {}
+            for host, counters in self._hosts.items():
+                hits = max(counters['requests'] - counters['misses'], 0)
+                hosts[host] = {
+                    'requests': counters['requests'],
+                    'hits': hits,
+                    'misses': counters['misses'],
+                    'hit_rate': round(hits / counters['requests'], 3) if counters['requests'] else 0.0
+                }
+        total_requests = sum(h['requests'] for h in hosts.values())
+        total_hits = sum(h['hits'] for h in hosts.values())
+        return {
+            'requests': total_requests,
+            'hits': total_hits,
+            'misses': total_requests - total_hits,
+            'hit_rate': round(total_hits / total_requests, 3) if total_requests else 0.0,
+            'hosts': hosts
+        }
+
+
+def _counting_pool(base):
+    """Build a connection pool class that reports checkouts and new connections"""
+
+    class CountingPool(base):
+        stats: PoolStats = None
+
+        def _get_conn(self, *args, **kwargs):
+            if self.stats:
+                self.stats.checkout(self.host)
+            return super()._get_conn(*args, **kwargs)
+
+        def _new_conn(self, *args, **kwargs):
+            if self.stats:
+                self.stats.new_connection(self.host)
+            return super()._new_conn(*args, **kwargs)
+
+    CountingPool.__name__ = f"Counting{base.__name__}"
+    return CountingPool
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose per-host pools feed a PoolStats instance"""
+
+    def __init__(self, stats: PoolStats, **kwargs):
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        pool_classes = {}
+        for scheme, base in (('http', HTTPConnectionPool), ('https', HTTPSConnectionPool)):
+            pool_class = _counting_pool(base)
+            pool_class.stats = self._stats
+            pool_classes[scheme] = pool_class
+        self.poolmanager.pool_classes_by_scheme = pool_classes
+
+
+class HTTPClient:
+    """
+    Thread-safe outbound HTTP client
+
+    One requests.Session is shared by all Flask worker threads. urllib3 keeps
+    a separate keep-alive pool per host, so repeated calls to the same host
+    (e.g. the per-claim Fact Check API loop) reuse an open TLS connection.
+    """
+
+    def __init__(self):
+        self.pool_connections = int(os.getenv('HTTP_POOL_CONNECTIONS', '32'))  # Number of host pools kept
+        self.pool_maxsize = int(os.getenv('HTTP_POOL_MAXSIZE', '16'))  # Connections kept per host
+        self.max_retries = int(os.getenv('HTTP_MAX_RETRIES', '2'))
+        self.backoff_factor = float(os.getenv('HTTP_BACKOFF_FACTOR', '0.3'))
+        self.backoff_max = float(os.getenv('HTTP_BACKOFF_MAX', '2'))
+        # `timeout` bounds each socket read; a page must also arrive in full within this many seconds
+        self.page_deadline = float(os.getenv('HTTP_PAGE_DEADLINE', '20'))
+        self.stats = PoolStats()
+
+        # Retries run while the caller holds a host scheduler slot, so every wait is bounded:
+        # no retry after a read timeout (that would repeat the full timeout), no Retry-After
+        # sleeps, and 429s go straight back to the caller instead of being retried
+        retry = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=0,
+            status=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            backoff_max=self.backoff_max,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=False,
+            raise_on_status=False  # Hand the final response back to the caller
+        )
+        adapter = PooledAdapter(
+            self.stats,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+            pool_block=False
+        )
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the shared session, once the host scheduler grants a slot"""
+        kwargs.setdefault('timeout', 15)
+        with host_scheduler.slot(url):
+            return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the shared session"""
+        return self.request('GET', url, **kwargs)
+
+    def fetch_page(self, url: str, deadline: Optional[float] = None, **kwargs) -> Tuple[requests.Response, str]:
+        """
+        Streaming GET of an HTML page, read through a PageReader: raises for
+        HTTP errors and PageRejected for non-HTML or oversized responses, and
+        stops downloading at the byte cap or once enough body text arrived.
+        The whole request must finish within `deadline` seconds (default
+        page_deadline), however slowly the server trickles bytes; a late page
+        raises requests.Timeout. Returns (response, text); the body is not
+        available on the response.
+        """
+        reader_options = {
+            key: kwargs.pop(key) for key in ('max_bytes', 'body_text_limit', 'max_content_length') if key in kwargs
+        }
+        kwargs.setdefault('timeout', 15)
+        # The host slot is held until the body is read, not just until the headers arrive
+        with host_scheduler.slot(url):
+            expires = time.monotonic() + (self.page_deadline if deadline is None else deadline)
+            with self.session.get(url, stream=True, **kwargs) as response:
+                response.raise_for_status()
+                reader = PageReader(
+                    response.headers.get('Content-Type'), response.headers.get('Content-Length'), **reader_options
+                )
+                for chunk in self._iter_body(response, expires):
+                    if reader.feed(chunk):
+                        break  # Closing the unread response drops the connection instead of draining it
+                return response, reader.finish()
+
+    @staticmethod
+    def _iter_body(response: requests.Response, expires: float) -> Iterator[bytes]:
+        """
+        response.iter_content() with a wall-clock deadline. read1() returns
+        whatever has arrived (up to a chunk) instead of blocking until a full
+        chunk does, so a slow-dripping body can't hold the loop past `expires`
+        by more than one read timeout. urllib3 errors map to the same requests
+        exceptions iter_content raises.
+        """
+        try:
+            while True:
+                if time.monotonic() >= expires:
+                    raise requests.Timeout(f"Page not received within its deadline: {response.url}")
+                chunk = response.raw.read1(SCRAPE_CHUNK_SIZE, decode_content=True)
+                if not chunk:
+                    return
+                yield chunk
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e)
+        except ReadTimeoutError as e:
+            raise requests.ConnectionError(e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool configuration plus per-host hit/miss counters"""
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'max_retries': self.max_retries,
+            'backoff_factor': self.backoff_factor,
+            'backoff_max': self.backoff_max,
+            'page_deadline': self.page_deadline,
+            **self.stats.snapshot(),
+            'scheduler': host_scheduler.get_stats()
+        }
+
+
+# Global instance
+http_client = HTTPClient()
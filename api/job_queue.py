@@ -0,0 +1,337 @@
+"""
+RapidVerify Job Queue
+SQLite-backed background jobs on a bounded worker pool (submit / poll / long-poll)
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from cache import DATA_DIR
+
+DEFAULT_JOB_DB_PATH = os.path.join(DATA_DIR, 'jobs.sqlite3')
+
+JOB_STATUSES = ('queued', 'running', 'done', 'failed')
+
+
+class QueueFull(Exception):
+    """Raised by submit() when the pending backlog is at capacity"""
+
+
+class JobQueue:
+    """
+    Persistent job queue
+
+    Jobs are rows in a SQLite file, so a restart (or a crashed worker
+    process) doesn't lose them: queued jobs are picked up when the workers
+    start. A running job holds a short lease that its process renews while
+    alive; jobs left running by a process that is gone are requeued at
+    start(), and any job whose lease lapses is handed to the next free
+    worker. Several processes (e.g. gunicorn workers) can share one queue
+    file; claiming a job is a single atomic UPDATE.
+
+    Nothing touches the database or starts threads until first use, so
+    importing the module is free.
+
+    Handlers are registered per job kind and return (result, http_status).
+    """
+
+    def __init__(self, path: str, workers: int = 4, max_pending: int = 1000,
+                 lease_seconds: float = 30, max_attempts: int = 3, retention_seconds: float = 86400):
+        self.path = path
+        self.workers = workers
+        self.max_pending = max_pending
+        self.lease_seconds = lease_seconds  # Renewed every lease_seconds / 3 while the owner is alive
+        self.max_attempts = max_attempts
+        self.retention_seconds = retention_seconds  # Finished jobs are purged after this long
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], tuple]] = {}
+        self._lock = threading.Lock()  # Guards the shared connection
+        self._start_lock = threading.Lock()
+        self._changed = threading.Condition()  # Wakes idle workers and long-pollers
+        self._threads = []
+        self._stopping = False
+        self._last_purge = 0.0
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _conn(self) -> sqlite3.Connection:
+        """The shared connection, opened (and the schema created) on first use (lock held)"""
+        if self._db is not None:
+            return self._db
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        db = sqlite3.connect(self.path, check_same_thread=False, timeout=30, isolation_level=None)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                http_status INTEGER,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                owner TEXT,
+                lease_until REAL,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )
+        ''')
+        db.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at)')
+        self._db = db
+        return db
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def register(self, kind: str, handler: Callable[[Dict[str, Any]], tuple]):
+        """Register the handler for a job kind: handler(payload) -> (result, http_status)"""
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Enqueue a job and return its (queued) description"""
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            pending = self._conn().execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'running')"
+            ).fetchone()[0]
+            if pending >= self.max_pending:
+                raise QueueFull(f"Job queue is full ({pending} pending)")
+            self._conn().execute(
+                "INSERT INTO jobs (id, kind, payload, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, kind, json.dumps(payload), time.time())
+            )
+        self._notify()
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job description (with result once finished), or None if unknown/purged"""
+        with self._lock:
+            row = self._conn().execute(
+                'SELECT id, kind, status, result, http_status, error, attempts, created_at, started_at, finished_at '
+                'FROM jobs WHERE id = ?', (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        job_id, kind, status, result, http_status, error, attempts, created_at, started_at, finished_at = row
+        job = {
+            'job_id': job_id,
+            'kind': kind,
+            'status': status,
+            'attempts': attempts,
+            'created_at': _iso(created_at),
+            'started_at': _iso(started_at),
+            'finished_at': _iso(finished_at)
+        }
+        if status in ('done', 'failed'):
+            job['http_status'] = http_status
+            job['result'] = json.loads(result) if result else None
+            job['error'] = error
+        return job
+
+    def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Long-poll: return the job once finished or when timeout elapses"""
+        deadline = time.time() + max(timeout, 0)
+        while True:
+            job = self.get(job_id)
+            remaining = deadline - time.time()
+            if job is None or job['status'] in ('done', 'failed') or remaining <= 0:
+                return job
+            with self._changed:
+                # Re-check at least every second: the job may finish in another process
+                self._changed.wait(min(remaining, 1.0))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-status job counts and pool configuration"""
+        with self._lock:
+            rows = self._conn().execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update(dict(rows))
+        return {
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            'running_here': sum(1 for t in self._threads if t.is_alive() and t.name.startswith('job-worker')),
+            **counts
+        }
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Requeue jobs orphaned by a previous run, then start the workers and lease renewal (idempotent)"""
+        with self._start_lock:
+            if self._threads:
+                return
+            try:
+                self._requeue_orphans()
+            except sqlite3.Error as e:
+                print(f"⚠️ Job queue: could not requeue orphaned jobs ({e})")
+            targets = [(self._work, f"job-worker-{i}") for i in range(self.workers)]
+            targets.append((self._renew_leases, 'job-leases'))
+            for target, name in targets:
+                thread = threading.Thread(target=target, name=name, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float = 5):
+        with self._start_lock:
+            self._stopping = True
+            self._notify()
+            for thread in self._threads:
+                thread.join(timeout)
+            self._threads = []
+            self._stopping = False
+
+    def _notify(self):
+        with self._changed:
+            self._changed.notify_all()
+
+    @staticmethod
+    def _owner_alive(owner: Optional[str]) -> bool:
+        """Whether the process that claimed a job still runs (owners on other hosts are assumed alive)"""
+        host, _, rest = (owner or '').partition(':')
+        pid = rest.partition(':')[0]
+        if host != socket.gethostname() or not pid.isdigit():
+            return True  # Not ours to judge: its lease decides
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return False
+        except OSError:
+            pass  # Exists, owned by another user
+        return True
+
+    def _requeue_orphans(self):
+        """Running jobs whose owning process is gone go back to the queue (no lease wait after a restart)"""
+        with self._lock:
+            db = self._conn()
+            rows = db.execute("SELECT id, owner FROM jobs WHERE status = 'running'").fetchall()
+            orphans = [job_id for job_id, owner in rows if owner != self.owner and not self._owner_alive(owner)]
+            for job_id in orphans:
+                db.execute(
+                    "UPDATE jobs SET status = 'queued', owner = NULL, lease_until = NULL "
+                    "WHERE id = ? AND status = 'running'", (job_id,)
+                )
+        if orphans:
+            print(f"✅ Job queue: requeued {len(orphans)} job(s) interrupted by a restart")
+
+    def _renew_leases(self):
+        """Heartbeat: extend the lease on every job this process is running"""
+        while not self._stopping:
+            time.sleep(self.lease_seconds / 3)
+            try:
+                with self._lock:
+                    self._conn().execute(
+                        "UPDATE jobs SET lease_until = ? WHERE status = 'running' AND owner = ?",
+                        (time.time() + self.lease_seconds, self.owner)
+                    )
+            except sqlite3.Error as e:
+                print(f"⚠️ Job queue: lease renewal failed ({e})")
+
+    def _claim(self) -> Optional[tuple]:
+        """Atomically take the oldest runnable job (queued, or running with an expired lease)"""
+        now = time.time()
+        with self._lock:
+            db = self._conn()
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                row = db.execute(
+                    "SELECT id, kind, payload, attempts FROM jobs "
+                    "WHERE status = 'queued' OR (status = 'running' AND lease_until < ?) "
+                    "ORDER BY created_at LIMIT 1", (now,)
+                ).fetchone()
+                if row is None:
+                    db.execute('COMMIT')
+                    return None
+                job_id, kind, payload, attempts = row
+                db.execute(
+                    "UPDATE jobs SET status = 'running', owner = ?, lease_until = ?, started_at = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (self.owner, now + self.lease_seconds, now, job_id)
+                )
+                db.execute('COMMIT')
+            except sqlite3.Error:
+                db.execute('ROLLBACK')
+                raise
+        return job_id, kind, json.loads(payload), attempts + 1
+
+    def _finish(self, job_id: str, status: str, result: Any = None, http_status: int = None, error: str = None):
+        with self._lock:
+            self._conn().execute(
+                'UPDATE jobs SET status = ?, result = ?, http_status = ?, error = ?, finished_at = ?, '
+                'lease_until = NULL WHERE id = ? AND owner = ?',
+                (status, json.dumps(result) if result is not None else None, http_status, error,
+                 time.time(), job_id, self.owner)
+            )
+        self._notify()
+
+    def _purge(self):
+        """Drop finished jobs past the retention window (at most once a minute)"""
+        now = time.time()
+        if now - self._last_purge < 60:
+            return
+        self._last_purge = now
+        with self._lock:
+            self._conn().execute(
+                "DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?",
+                (now - self.retention_seconds,)
+            )
+
+    def _work(self):
+        while not self._stopping:
+            try:
+                claimed = self._claim()
+                self._purge()
+            except sqlite3.Error as e:
+                print(f"⚠️ Job queue: claim failed ({e})")
+                claimed = None
+
+            if claimed is None:
+                with self._changed:
+                    self._changed.wait(1.0)  # Also picks up jobs submitted by other processes
+                continue
+
+            job_id, kind, payload, attempt = claimed
+            handler = self._handlers.get(kind)
+            if handler is None:
+                self._finish(job_id, 'failed', http_status=500, error=f"No handler for job kind '{kind}'")
+                continue
+            if attempt > self.max_attempts:
+                self._finish(job_id, 'failed', http_status=500, error=f"Gave up after {self.max_attempts} attempts")
+                continue
+
+            try:
+                result, http_status = handler(payload)
+                self._finish(job_id, 'done' if http_status < 400 else 'failed', result, http_status)
+            except Exception as e:
+                print(f"❌ Job {job_id} ({kind}) failed: {e}")
+                import traceback
+                traceback.print_exc()
+                self._finish(job_id, 'failed', http_status=500, error=str(e))
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+
+# Global instance (the database is opened and workers started on first use)
+job_queue = JobQueue(
+    os.getenv('JOB_QUEUE_PATH') or DEFAULT_JOB_DB_PATH,
+    workers=int(os.getenv('JOB_QUEUE_WORKERS', '4')),
+    max_pending=int(os.getenv('JOB_QUEUE_MAX_PENDING', '1000')),
+    lease_seconds=float(os.getenv('JOB_QUEUE_LEASE_SECONDS', '30')),
+    retention_seconds=float(os.getenv('JOB_QUEUE_RETENTION_SECONDS', '86400'))
+)
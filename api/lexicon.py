@@ -0,0 +1,143 @@
+"""
+RapidVerify Pattern Lexicon
+Loads the versioned phrase lexicon from disk, compiles it, and hot-swaps it at runtime
+"""
+import hashlib
+import json
+import os
+import signal
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pattern_engine import PatternEngine, PatternHits
+
+DEFAULT_LEXICON_PATH = os.path.join(os.path.dirname(__file__), 'datasets', 'lexicon.json')
+# Lexicons pushed through the admin API are saved here, never over the shipped file
+PUSHED_LEXICON_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'lexicon.json')
+LEXICON_FORMAT = 1
+
+# Families the verifier reads directly - a lexicon missing any of them is rejected
+REQUIRED_FAMILIES = (
+    'scam', 'urgency', 'sensational', 'health', 'forward', 'money_words',
+    'ai_scam', 'ai_urgency', 'ai_forward', 'ai_money_words', 'credible',
+    'factual_scam_words', 'factual_indicators', 'positional'
+)
+
+
+class Lexicon:
+    """An immutable, compiled lexicon version"""
+
+    def __init__(self, document: Dict[str, Any], source: str = None):
+        if not isinstance(document, dict):
+            raise ValueError(f"Lexicon must be a JSON object, not {type(document).__name__}")
+        if document.get('format') != LEXICON_FORMAT:
+            raise ValueError(f"Unsupported lexicon format: {document.get('format')!r}")
+        if not document.get('version'):
+            raise ValueError("Lexicon version is required")
+
+        if not isinstance(document.get('families') or {}, dict):
+            raise ValueError("Lexicon 'families' must be an object mapping family names to phrase lists")
+        families = {}
+        for name, family in (document.get('families') or {}).items():
+            phrases = family.get('phrases') if isinstance(family, dict) else family
+            if not isinstance(phrases, list) or not all(isinstance(p, str) and p for p in phrases):
+                raise ValueError(f"Lexicon family '{name}' must be a list of non-empty strings")
+            families[name] = phrases
+
+        missing = [name for name in REQUIRED_FAMILIES if name not in families]
+        if missing:
+            raise ValueError(f"Lexicon is missing required families: {', '.join(missing)}")
+
+        self.version = str(document['version'])
+        self.source = source
+        self.checksum = hashlib.sha256(json.dumps(document, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        self.loaded_at = datetime.now().isoformat()
+        self.phrase_count = sum(len(p) for p in families.values())
+        self.engine = PatternEngine(families)
+
+    def scan(self, text: str) -> PatternHits:
+        return self.engine.scan(text)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'version': self.version,
+            'checksum': self.checksum,
+            'source': self.source,
+            'loaded_at': self.loaded_at,
+            'families': len(self.engine.families),
+            'phrases': self.phrase_count
+        }
+
+
+def load_lexicon(path: str) -> Lexicon:
+    """Read and compile a lexicon file (raises ValueError/IOError on bad input)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return Lexicon(json.load(f), source=path)
+
+
+class LexiconRegistry:
+    """
+    Holds the active compiled lexicon
+
+    Readers grab current() once per verification and keep using that
+    snapshot, so a reload never pauses or mixes versions inside an
+    in-flight request. Reloads compile fully before the reference is
+    swapped; a bad file leaves the previous version active. A pushed
+    lexicon is saved to pushed_path and takes precedence over `path` from
+    then on (delete it to go back to the shipped file).
+    """
+
+    def __init__(self, path: str, pushed_path: str = PUSHED_LEXICON_PATH):
+        self.base_path = path
+        self.pushed_path = pushed_path
+        self._lock = threading.Lock()  # Serializes reloads, not reads
+        self._current: Lexicon = load_lexicon(self.path)
+        print(f"✅ Loaded pattern lexicon v{self._current.version} ({self._current.phrase_count} phrases)")
+
+    @property
+    def path(self) -> str:
+        """The lexicon file in effect: the last pushed version if there is one"""
+        return self.pushed_path if os.path.exists(self.pushed_path) else self.base_path
+
+    def current(self) -> Lexicon:
+        return self._current
+
+    def reload(self, document: Optional[Dict[str, Any]] = None) -> Lexicon:
+        """
+        Recompile from disk, or from a pushed document which is then written
+        to pushed_path so restarts pick it up
+        """
+        with self._lock:
+            if document is None:
+                lexicon = load_lexicon(self.path)
+            else:
+                lexicon = Lexicon(document, source=self.pushed_path)
+                os.makedirs(os.path.dirname(self.pushed_path), exist_ok=True)
+                tmp_path = f"{self.pushed_path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(document, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self.pushed_path)
+
+            previous = self._current
+            self._current = lexicon
+        print(f"✅ Pattern lexicon swapped: v{previous.version} → v{lexicon.version}")
+        return lexicon
+
+    def install_signal_handler(self, signum: int = getattr(signal, 'SIGHUP', None)):
+        """Reload on a signal (main thread only); compilation runs off the signal handler"""
+        if signum is None or threading.current_thread() is not threading.main_thread():
+            return False
+
+        def _reload_in_background():
+            try:
+                self.reload()
+            except (ValueError, IOError) as e:
+                print(f"⚠️ Lexicon reload failed, keeping v{self._current.version}: {e}")
+
+        signal.signal(signum, lambda *_: threading.Thread(target=_reload_in_background, daemon=True).start())
+        return True
+
+
+# Global instance
+lexicon_registry = LexiconRegistry(os.getenv('LEXICON_PATH') or DEFAULT_LEXICON_PATH)
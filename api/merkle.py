@@ -0,0 +1,90 @@
+"""
+RapidVerify Merkle Trees
+Batch commitments for verification records: one on-chain root, one inclusion proof per record
+"""
+import hashlib
+import json
+from typing import Any, Dict, List
+
+_LEAF_PREFIX = b'\x00'  # Domain separation: a leaf can never be mistaken for an inner node
+_NODE_PREFIX = b'\x01'
+
+
+def _hex(digest: bytes) -> str:
+    return '0x' + digest.hex()
+
+
+def _unhex(value: str) -> bytes:
+    return bytes.fromhex(value[2:] if value.startswith('0x') else value)
+
+
+def record_leaf(record: Dict[str, Any]) -> str:
+    """
+    Leaf hash for a verification record
+
+    Commits to the claim hash and to the verdict fields, so a proof fails if
+    the locally stored score or status is altered after anchoring.
+    """
+    payload = json.dumps({
+        'record_id': record.get('record_id'),
+        'claim_hash': record.get('claim_hash'),
+        'verification_score': record.get('verification_score'),
+        'status': record.get('status'),
+        'timestamp': record.get('timestamp')
+    }, sort_keys=True, separators=(',', ':'))
+    return _hex(hashlib.sha256(_LEAF_PREFIX + payload.encode('utf-8')).digest())
+
+
+def _parent(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+class MerkleTree:
+    """
+    Binary SHA-256 Merkle tree over hex leaf hashes
+
+    An odd node at the end of a level is promoted unchanged (not duplicated),
+    so proofs for the last leaf are simply shorter.
+    """
+
+    def __init__(self, leaves: List[str]):
+        if not leaves:
+            raise ValueError("Merkle tree needs at least one leaf")
+        self.levels: List[List[bytes]] = [[_unhex(leaf) for leaf in leaves]]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            self.levels.append([
+                _parent(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ])
+
+    @property
+    def root(self) -> str:
+        return _hex(self.levels[-1][0])
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def proof(self, index: int) -> List[Dict[str, str]]:
+        """Sibling path for leaf `index`, bottom-up: [{position: left|right, hash}]"""
+        if not 0 <= index < len(self):
+            raise IndexError(f"Leaf index {index} out of range")
+        path = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append({'position': 'left' if sibling < index else 'right', 'hash': _hex(level[sibling])})
+            index //= 2
+        return path
+
+
+def verify_proof(leaf: str, proof: List[Dict[str, str]], root: str) -> bool:
+    """Check that `leaf` is included under `root` via `proof` (as returned by MerkleTree.proof)"""
+    try:
+        node = _unhex(leaf)
+        for step in proof:
+            sibling = _unhex(step['hash'])
+            node = _parent(sibling, node) if step['position'] == 'left' else _parent(node, sibling)
+        return node == _unhex(root)
+    except (KeyError, TypeError, ValueError):
+        return False
@@ -5,14 +5,53 @@ Extracts news content from URLs and verifies against trusted sources
 import os
 import re
 import json
+import sqlite3
 import requests
 from datetime import datetime
 from urllib.parse import urlparse, quote_plus
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
+from article_cache import ArticleCache, article_cache
+from article_extractor import ArticleExtractor, LXML_AVAILABLE
+from cache import TTLCache, MISSING, DATA_DIR
+from domain_index import credibility_index
+from http_client import http_client
+from lexicon import lexicon_registry
+from pipeline import StageGraph
+from search_providers import search_service
+from structured_data import extract_structured_data
+
 load_dotenv()
 
+FACT_CHECK_API_URL = 'https://factchecktools.googleapis.com/v1alpha1/claims:search'
+
+# Fact Check API responses, keyed by normalized query - viral claims repeat constantly
+fact_check_cache = TTLCache(
+    'fact_check',
+    max_entries=int(os.getenv('FACT_CHECK_CACHE_SIZE', '4096')),
+    default_ttl=float(os.getenv('FACT_CHECK_CACHE_TTL', '21600')),
+    persist_path=os.path.join(DATA_DIR, 'fact_check_cache.sqlite3')
+    if os.getenv('FACT_CHECK_CACHE_PERSIST', 'false').lower() == 'true' else None
+)
+FACT_CHECK_NEGATIVE_TTL = float(os.getenv('FACT_CHECK_CACHE_NEGATIVE_TTL', '900'))
+
+# Extracted fields kept in the article cache (domain/source are recomputed per request)
+CACHED_ARTICLE_FIELDS = ('title', 'content', 'summary', 'author', 'date', 'images')
+
+# Fields that must all be declared in JSON-LD/meta tags for scrape_article to skip DOM parsing
+STRUCTURED_REQUIRED_FIELDS = ('title', 'content', 'author', 'date')
+
+def _ignore_stage(stage: str, payload):
+    """Default on_stage callback"""
+
+
+AI_VERIFY_GENERATION_CONFIG = {
+    "temperature": 0.1,  # Low temperature for consistent, strict results
+    "top_p": 0.8,
+    "top_k": 40
+}
+
 # Try to import Google Generative AI
 try:
     import google.generativeai as genai
@@ -36,25 +75,17 @@ class NewsScraper:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         }
+        # Single-pass lxml engine; ARTICLE_EXTRACTOR=soup (or no lxml) keeps the BeautifulSoup cascade
+        use_lxml = LXML_AVAILABLE and os.getenv('ARTICLE_EXTRACTOR', 'lxml').lower() == 'lxml'
+        self.extractor = ArticleExtractor() if use_lxml else None
+        self.use_structured_data = os.getenv('ARTICLE_STRUCTURED_DATA', 'true').lower() == 'true'
     
     def scrape_article(self, url: str) -> dict:
         """
         Scrape news article from URL
         Returns: {title, content, author, date, source, images, url}
         """
-        result = {
-            'url': url,
-            'success': False,
-            'title': '',
-            'content': '',
-            'summary': '',
-            'author': '',
-            'date': '',
-            'source': '',
-            'domain': '',
-            'images': [],
-            'error': None
-        }
+        result = self._new_article_result(url)
         
         try:
             # Parse domain
@@ -62,32 +93,26 @@ class NewsScraper:
             result['domain'] = parsed.netloc.replace('www.', '')
             result['source'] = self._get_source_name(result['domain'])
             
-            # Fetch the page
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract title
-            result['title'] = self._extract_title(soup)
-            
-            # Extract content
-            result['content'] = self._extract_content(soup)
+            # Served from the article cache while fresh, otherwise revalidated with a conditional GET
+            entry = article_cache.lookup(url) if article_cache else None
+            if entry and article_cache.is_fresh(entry) and self._restore_cached_article(entry, result):
+                article_cache.record_hit()
+                return result
             
-            # Extract author
-            result['author'] = self._extract_author(soup)
-            
-            # Extract date
-            result['date'] = self._extract_date(soup)
-            
-            # Extract images
-            result['images'] = self._extract_images(soup, url)
-            
-            # Generate summary
-            if result['content']:
-                result['summary'] = result['content'][:500] + '...' if len(result['content']) > 500 else result['content']
+            # Fetch the page (streamed, size-capped, stops once enough body text arrived)
+            headers = {**self.headers, **ArticleCache.conditional_headers(entry)}
+            response, html = http_client.fetch_page(url, headers=headers, timeout=15)
+            if response.status_code == 304:
+                if entry and self._restore_cached_article(entry, result):
+                    article_cache.revalidated(entry)
+                    article_cache.record_hit(revalidated=True)
+                    return result
+                # Nothing usable cached after all: fetch unconditionally
+                response, html = http_client.fetch_page(url, headers=self.headers, timeout=15)
             
+            self._parse_article(html, url, result)
             result['success'] = True
+            self._cache_article(url, html, result, response.headers)
             
         except requests.RequestException as e:
             result['error'] = f"Failed to fetch URL: {str(e)}"
@@ -100,29 +125,136 @@ class NewsScraper:
         
         return result
     
+    def _restore_cached_article(self, entry: dict, result: dict) -> bool:
+        """Fill result from an article cache entry (re-extracting stale-version entries from their HTML)"""
+        article = entry['article']
+        if article is None:
+            html = article_cache.load_html(entry)
+            if html is None:
+                return False
+            article = self._parse_article(html, entry['url'], self._new_article_result(entry['url']))
+            article = {field: article[field] for field in CACHED_ARTICLE_FIELDS}
+            article_cache.update_article(entry, article)
+        
+        for field in CACHED_ARTICLE_FIELDS:
+            result[field] = article.get(field, result[field])
+        result['success'] = True
+        return True
+    
+    def _cache_article(self, url: str, html: str, result: dict, headers):
+        """Store a freshly extracted article with the response's validators"""
+        if article_cache is None or not (result['title'] or result['content']):
+            return
+        try:
+            article_cache.store(
+                url, html, {field: result[field] for field in CACHED_ARTICLE_FIELDS},
+                etag=headers.get('ETag'), last_modified=headers.get('Last-Modified')
+            )
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Article cache: failed to store {url} ({e})")
+    
+    def _new_article_result(self, url: str) -> dict:
+        """Empty article result"""
+        return {
+            'url': url,
+            'success': False,
+            'title': '',
+            'content': '',
+            'summary': '',
+            'author': '',
+            'date': '',
+            'source': '',
+            'domain': '',
+            'images': [],
+            'error': None
+        }
+    
+    def _parse_article(self, html: str, url: str, result: dict) -> dict:
+        """Extract article fields from fetched HTML into result"""
+        data = extract_structured_data(html) if self.use_structured_data else {}
+        if all(data.get(field) for field in STRUCTURED_REQUIRED_FIELDS) and len(data['content']) > 100:
+            # JSON-LD/meta declared everything: no DOM tree at all
+            result['title'] = data['title']
+            result['content'] = self._clean_text(data['content'])
+            result['author'] = data['author']
+            result['date'] = data['date']
+            result['images'] = []
+        else:
+            self._parse_article_dom(html, url, result)
+            # Declared fields only fill gaps: a short articleBody is often a paywall teaser
+            for field in ('title', 'author', 'date'):
+                if data.get(field) and not result[field]:
+                    result[field] = data[field]
+            content = self._clean_text(data.get('content') or '')
+            if len(content) > 100 and len(content) > len(result['content']):
+                result['content'] = content
+        
+        # Declared images (og:image, JSON-LD image) lead; DOM candidates follow
+        images = []
+        for src in [self._absolute_url(src, url) for src in data.get('images', [])[:3]] + result['images']:
+            if src not in images:
+                images.append(src)
+        result['images'] = images
+        
+        self._summarize(result)
+        return result
+    
+    def _parse_article_dom(self, html: str, url: str, result: dict) -> dict:
+        """Selector-cascade extraction, with lxml when available"""
+        if self.extractor is None:
+            return self._parse_article_soup(html, url, result)
+        return self._parse_article_lxml(html, url, result)
+    
+    def _parse_article_lxml(self, html: str, url: str, result: dict) -> dict:
+        """Single-pass lxml extraction path"""
+        fields = self.extractor.extract(html)
+        result['title'] = fields['title']
+        result['content'] = self._clean_text(fields['content'])
+        result['author'] = fields['author']
+        result['date'] = fields['date']
+        result['images'] = []
+        for src in fields['image_sources']:
+            src = self._absolute_url(src, url)
+            if src not in result['images']:
+                result['images'].append(src)
+        
+        self._summarize(result)
+        return result
+    
+    def _parse_article_soup(self, html: str, url: str, result: dict) -> dict:
+        """BeautifulSoup extraction path: one selector cascade (and tree search) per field"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Extract title
+        result['title'] = self._extract_title(soup)
+        
+        # Extract content
+        result['content'] = self._extract_content(soup)
+        
+        # Extract author
+        result['author'] = self._extract_author(soup)
+        
+        # Extract date
+        result['date'] = self._extract_date(soup)
+        
+        # Extract images
+        result['images'] = self._extract_images(soup, url)
+        
+        self._summarize(result)
+        return result
+    
+    @staticmethod
+    def _summarize(result: dict):
+        """Generate summary"""
+        if result['content']:
+            result['summary'] = result['content'][:500] + '...' if len(result['content']) > 500 else result['content']
+    
     def _get_source_name(self, domain: str) -> str:
         """Get human-readable source name from domain"""
-        source_map = {
-            'ndtv.com': 'NDTV',
-            'timesofindia.indiatimes.com': 'Times of India',
-            'hindustantimes.com': 'Hindustan Times',
-            'thehindu.com': 'The Hindu',
-            'indianexpress.com': 'Indian Express',
-            'news18.com': 'News18',
-            'indiatoday.in': 'India Today',
-            'bbc.com': 'BBC News',
-            'bbc.co.uk': 'BBC News',
-            'reuters.com': 'Reuters',
-            'apnews.com': 'Associated Press',
-            'theguardian.com': 'The Guardian',
-            'nytimes.com': 'New York Times',
-            'washingtonpost.com': 'Washington Post',
-            'cnn.com': 'CNN',
-            'aljazeera.com': 'Al Jazeera',
-            'pib.gov.in': 'Press Information Bureau (Government)',
-            'who.int': 'World Health Organization',
-        }
-        return source_map.get(domain, domain.split('.')[0].title())
+        entry = credibility_index.lookup(domain)
+        if entry and entry.get('name'):
+            return entry['name']
+        return domain.split('.')[0].title()
     
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract article title"""
@@ -226,18 +358,22 @@ class NewsScraper:
             for img in soup.select(selector)[:3]:  # Max 3 images
                 src = img.get('src') or img.get('data-src')
                 if src:
-                    # Make absolute URL
-                    if src.startswith('//'):
-                        src = 'https:' + src
-                    elif src.startswith('/'):
-                        parsed = urlparse(base_url)
-                        src = f"{parsed.scheme}://{parsed.netloc}{src}"
-                    
+                    src = self._absolute_url(src, base_url)
                     if src not in images:
                         images.append(src)
         
         return images
     
+    @staticmethod
+    def _absolute_url(src: str, base_url: str) -> str:
+        """Make an image URL absolute"""
+        if src.startswith('//'):
+            return 'https:' + src
+        if src.startswith('/'):
+            parsed = urlparse(base_url)
+            return f"{parsed.scheme}://{parsed.netloc}{src}"
+        return src
+    
     def _clean_text(self, text: str) -> str:
         """Clean extracted text"""
         # Remove extra whitespace
@@ -293,26 +429,10 @@ class NewsVerifier:
             }
         ]
         
-        # Trusted news sources by credibility tier
-        self.trusted_sources = {
-            'tier1': [  # Highly credible - official/wire services
-                'pib.gov.in', 'who.int', 'cdc.gov', 'reuters.com', 
-                'apnews.com', 'afp.com', 'pti.in'
-            ],
-            'tier2': [  # Major credible news organizations
-                'bbc.com', 'bbc.co.uk', 'nytimes.com', 'washingtonpost.com',
-                'theguardian.com', 'economist.com', 'thehindu.com',
-                'indianexpress.com', 'ndtv.com', 'livemint.com'
-            ],
-            'tier3': [  # Generally reliable
-                'hindustantimes.com', 'timesofindia.indiatimes.com',
-                'news18.com', 'indiatoday.in', 'cnn.com', 'aljazeera.com',
-                'firstpost.com', 'moneycontrol.com', 'businesstoday.in',
-                'deccanherald.com', 'scroll.in', 'thewire.in', 'theprint.in'
-            ]
-        }
+        # Trusted news sources by credibility tier (see datasets/credibility.json)
+        self.credibility = credibility_index
     
-    def verify_url(self, url: str) -> dict:
+    def verify_url(self, url: str, on_stage=None) -> dict:
         """
         Verify a news article by its URL
         1. Scrape the article
@@ -320,8 +440,55 @@ class NewsVerifier:
         3. Search fact-check sources
         4. Cross-reference with trusted sources
         5. Return verification with citations
+        
+        on_stage(stage, payload) is called as each stage completes (see verify_text);
+        it may raise VerificationCancelled to stop the remaining work
         """
-        result = {
+        on_stage = on_stage or _ignore_stage
+        result = self._new_url_result(url)
+        
+        # Step 1: Scrape the article
+        article = self.scraper.scrape_article(url)
+        result['article'] = article
+        on_stage('article', article)
+        
+        if not article['success']:
+            result['warnings'].append(f"Could not scrape article: {article.get('error', 'Unknown error')}")
+            return result
+        
+        # Step 2: Check source credibility
+        source_cred = self._check_source_credibility(article['domain'])
+        result['source_credibility'] = source_cred
+        on_stage('source_credibility', source_cred)
+        
+        # Steps 3-5: Extract key claims, search fact-check sources and
+        # cross-reference trusted sources (independent stages run concurrently)
+        evidence = self._gather_evidence(article['title'], article['title'], article['content'], on_stage)
+        result.update(evidence)
+        
+        # AI analysis of the article text (empty when Gemini is unavailable or fails)
+        ai_analysis = {}
+        article_text = article.get('content', '') + ' ' + article.get('title', '')
+        if gemini_model and article_text:
+            try:
+                ai_analysis = self._ai_verify_claim(article_text, evidence['fact_checks'], [])
+            except Exception as e:
+                print(f"⚠️ AI verification failed: {e}")
+        on_stage('ai_analysis', ai_analysis)
+        
+        # Step 6: Calculate final verification score
+        verification = self._calculate_verification(source_cred, evidence['fact_checks'],
+                                                    evidence['cross_references'], article,
+                                                    ai_analysis=ai_analysis)
+        result['verification'] = verification
+        on_stage('verification', verification)
+        
+        result['success'] = True
+        return result
+    
+    def _new_url_result(self, url: str) -> dict:
+        """Empty URL verification result"""
+        return {
             'success': False,
             'url': url,
             'article': None,
@@ -342,40 +509,47 @@ class NewsVerifier:
             'warnings': [],
             'timestamp': datetime.now().isoformat()
         }
+    
+    def verify_text(self, text: str, on_stage=None) -> dict:
+        """
+        Verify a text claim (message, etc.) - PRODUCTION VERSION
         
-        # Step 1: Scrape the article
-        article = self.scraper.scrape_article(url)
-        result['article'] = article
-        
-        if not article['success']:
-            result['warnings'].append(f"Could not scrape article: {article.get('error', 'Unknown error')}")
-            return result
-        
-        # Step 2: Check source credibility
-        source_cred = self._check_source_credibility(article['domain'])
-        result['source_credibility'] = source_cred
-        
-        # Step 3: Extract key claims using AI (if available) or keywords
-        key_claims = self._extract_key_claims(article['title'], article['content'])
-        result['key_claims'] = key_claims
+        on_stage(stage, payload) is called as each stage completes:
+        patterns, key_claims, fact_checks (new entries only), cross_references,
+        ai_analysis, verification. It may raise VerificationCancelled to stop
+        the remaining work.
+        """
+        on_stage = on_stage or _ignore_stage
         
-        # Step 4: Search fact-check sources
-        fact_checks = self._search_fact_checks(article['title'], key_claims)
-        result['fact_checks'] = fact_checks
+        # Step 1: Check for fake news patterns FIRST (heavily weighted)
+        result, hits, fake_score, is_simple_factual = self._begin_text_verification(text)
+        on_stage('patterns', {'warnings': list(result['warnings']), 'is_simple_factual': is_simple_factual})
         
-        # Step 5: Search for cross-references in trusted sources
-        cross_refs = self._search_cross_references(article['title'], key_claims)
-        result['cross_references'] = cross_refs
+        # Steps 2-4: Extract claims using AI, search fact-checks and
+        # cross-references (includes Google Search scraping) - run as a stage graph
+        evidence = self._gather_evidence(text, text, text, on_stage)
+        result.update(evidence)
         
-        # Step 6: Calculate final verification score
-        verification = self._calculate_verification(source_cred, fact_checks, cross_refs, article)
-        result['verification'] = verification
+        # Step 5: Use Gemini AI for proper fact-checking analysis (with Google search results)
+        ai_analysis = None
+        if gemini_model:
+            try:
+                # Pass Google search results to AI for better context
+                ai_analysis = self._ai_verify_claim(text, evidence['fact_checks'], evidence['key_claims'],
+                                                    evidence['cross_references'], hits=hits)
+            except Exception as e:
+                print(f"⚠️ AI verification failed: {e}")
+        on_stage('ai_analysis', ai_analysis)
         
-        result['success'] = True
+        result = self._finish_text_verification(result, hits, fake_score, is_simple_factual, ai_analysis)
+        on_stage('verification', result['verification'])
         return result
     
-    def verify_text(self, text: str) -> dict:
-        """Verify a text claim (message, etc.) - PRODUCTION VERSION"""
+    def _begin_text_verification(self, text: str) -> tuple:
+        """
+        Local heuristics that need no network calls
+        Returns: (result, hits, fake_score, is_simple_factual)
+        """
         result = {
             'success': True,
             'text': text,
@@ -392,55 +566,39 @@ class NewsVerifier:
             'timestamp': datetime.now().isoformat()
         }
         
-        # Step 1: Check for fake news patterns FIRST (heavily weighted)
-        fake_score, warnings = self._check_fake_patterns(text)
+        # One scan of the text (against one lexicon snapshot) serves every phrase check below
+        hits = lexicon_registry.current().scan(text)
+        fake_score, warnings = self._check_fake_patterns(text, hits)
         result['warnings'] = warnings
         
         # DEBUG: Check if this is a simple factual statement
-        is_simple_factual = self._is_simple_factual_statement(text)
+        is_simple_factual = self._is_simple_factual_statement(text, hits)
         if is_simple_factual:
             print(f"✅ Detected simple factual statement: '{text[:50]}...'")
         
-        # Step 2: Extract claims using AI
-        key_claims = self._extract_key_claims(text, text)
-        result['key_claims'] = key_claims
-        
-        # Step 3: Search fact-checks
-        fact_checks = self._search_fact_checks(text, key_claims)
-        result['fact_checks'] = fact_checks
-        
-        # Step 4: Search cross-references (includes Google Search scraping)
-        cross_refs = self._search_cross_references(text, key_claims)
-        result['cross_references'] = cross_refs
+        return result, hits, fake_score, is_simple_factual
+    
+    def _finish_text_verification(self, result: dict, hits, fake_score: float,
+                                  is_simple_factual: bool, ai_analysis: dict = None) -> dict:
+        """Combine heuristics, fact-checks, cross-references and the AI verdict into the final score"""
+        text = result['text']
+        fact_checks = result['fact_checks']
+        cross_refs = result['cross_references']
         
-        # Step 5: Use Gemini AI for proper fact-checking analysis (with Google search results)
         ai_score = None
         ai_verdict = None
-        if gemini_model:
-            try:
-                # Pass Google search results to AI for better context
-                ai_analysis = self._ai_verify_claim(text, fact_checks, key_claims, cross_refs)
-                ai_score = ai_analysis.get('score')
-                ai_verdict = ai_analysis.get('verdict')
-                if ai_analysis.get('warnings'):
-                    result['warnings'].extend(ai_analysis['warnings'])
-            except Exception as e:
-                print(f"⚠️ AI verification failed: {e}")
+        if ai_analysis:
+            ai_score = ai_analysis.get('score')
+            ai_verdict = ai_analysis.get('verdict')
+            if ai_analysis.get('warnings'):
+                result['warnings'].extend(ai_analysis['warnings'])
         
         # Step 6: Calculate final score (PRODUCTION - ULTRA STRICT)
         # CRITICAL RULE: Fake patterns and fact-check debunks have ABSOLUTE PRIORITY
         
-        # CRITICAL FIX: Check for simple factual statements FIRST (before defaulting to suspicious)
-        is_simple_factual = self._is_simple_factual_statement(text)
-        
         # Start with LOW score for unknown source (default suspicious)
         # But check if content seems legitimate first
-        text_lower = text.lower()
-        has_credible_indicators = any(phrase in text_lower for phrase in [
-            'according to', 'official statement', 'press release', 'government announced',
-            'ministry said', 'confirmed by', 'study shows', 'research indicates', 'experts say',
-            'reuters', 'ap news', 'associated press', 'bbc', 'reported by'
-        ])
+        has_credible_indicators = hits.any('credible')
         
         # STEP 1: HEAVILY penalize fake patterns FIRST (ABSOLUTE PRIORITY)
         # BUT: Simple factual statements are EXEMPT from fake pattern penalties (unless severe)
@@ -597,23 +755,21 @@ class NewsVerifier:
     def _check_source_credibility(self, domain: str) -> dict:
         """Check if source domain is credible"""
         domain = domain.lower().replace('www.', '')
+        entry = self.credibility.lookup(domain)
         
-        for tier, sources in self.trusted_sources.items():
-            if any(s in domain for s in sources):
-                tier_scores = {'tier1': 0.95, 'tier2': 0.85, 'tier3': 0.75}
-                return {
-                    'tier': tier,
-                    'score': tier_scores[tier],
-                    'is_known_source': True,
-                    'source_name': self.scraper._get_source_name(domain)
-                }
+        if entry and entry['tier'] in ('tier1', 'tier2', 'tier3'):
+            return {
+                'tier': entry['tier'],
+                'score': self.credibility.tier_score(entry['tier']),
+                'is_known_source': True,
+                'source_name': self.scraper._get_source_name(domain)
+            }
         
         # Check for suspicious patterns
-        suspicious = ['blogspot', 'wordpress.com', 'medium.com', 'substack']
-        if any(s in domain for s in suspicious):
+        if entry and entry['tier'] == 'unverified':
             return {
                 'tier': 'unverified',
-                'score': 0.4,
+                'score': self.credibility.tier_score('unverified'),
                 'is_known_source': False,
                 'warning': 'User-generated content platform'
             }
@@ -633,7 +789,20 @@ class NewsVerifier:
         # Use Gemini if available
         if gemini_model:
             try:
-                prompt = f"""Extract the main factual claims from this news article that can be fact-checked.
+                response = gemini_model.generate_content(self._key_claims_prompt(title, content))
+                claims = self._parse_key_claims(response.text)
+            except ValueError as e:
+                print(f"AI claim extraction failed (invalid response): {e}")
+            except Exception as e:
+                print(f"AI claim extraction failed: {e}")
+                import traceback
+                traceback.print_exc()
+        
+        return claims[:5] or self._fallback_key_claims(title, content)
+    
+    @staticmethod
+    def _key_claims_prompt(title: str, content: str) -> str:
+        return f"""Extract the main factual claims from this news article that can be fact-checked.
                 
 Title: {title}
 Content: {content[:2000]}
@@ -645,268 +814,212 @@ Return as JSON array of strings, max 5 claims. Focus on:
 - Policy announcements
 
 Return ONLY the JSON array, no other text."""
-
-                response = gemini_model.generate_content(prompt)
-                json_match = re.search(r'\[[\s\S]*\]', response.text)
-                if json_match:
-                    claims = json.loads(json_match.group())[:5]
-            except ValueError as e:
-                print(f"AI claim extraction failed (invalid response): {e}")
-            except Exception as e:
-                print(f"AI claim extraction failed: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        # Fallback: Use title and first sentences
-        if not claims:
-            claims = [title] if title else []
-            sentences = re.split(r'[.!?]', content[:500])
-            for sent in sentences[:3]:
-                sent = sent.strip()
-                if len(sent) > 30 and sent not in claims:
-                    claims.append(sent)
-        
+    
+    @staticmethod
+    def _parse_key_claims(response_text: str) -> list:
+        """Claims from the model's JSON array (raises ValueError on malformed JSON)"""
+        json_match = re.search(r'\[[\s\S]*\]', response_text)
+        if json_match:
+            return json.loads(json_match.group())[:5]
+        return []
+    
+    @staticmethod
+    def _fallback_key_claims(title: str, content: str) -> list:
+        """Fallback: Use title and first sentences"""
+        claims = [title] if title else []
+        sentences = re.split(r'[.!?]', content[:500])
+        for sent in sentences[:3]:
+            sent = sent.strip()
+            if len(sent) > 30 and sent not in claims:
+                claims.append(sent)
         return claims[:5]
     
     def _search_fact_checks(self, query: str, claims: list) -> list:
         """Search fact-checking websites for related checks - PRODUCTION VERSION"""
-        fact_checks = []
+        fact_checks = self._fact_check_query(query)
         
-        # CRITICAL: Try Google Fact Check API first (most reliable)
-        google_api_key = os.getenv('GOOGLE_API_KEY')
-        if google_api_key:
-            try:
-                api_url = 'https://factchecktools.googleapis.com/v1alpha1/claims:search'
-                
-                # Search main query
-                params = {
-                    'key': google_api_key,
-                    'query': query[:200],
-                    'languageCode': 'en',
-                    'maxAgeDays': 365  # Check last year
-                }
-                response = requests.get(api_url, params=params, timeout=15)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    for claim in data.get('claims', [])[:10]:  # Get more results
-                        reviews = claim.get('claimReview', [])
-                        if reviews:
-                            for review in reviews[:2]:  # Get up to 2 reviews per claim
-                                rating = review.get('textualRating', '').lower()
-                                publisher = review.get('publisher', {})
-                                
-                                fact_checks.append({
-                                    'claim': claim.get('text', ''),
-                                    'claimant': claim.get('claimant', 'Unknown'),
-                                    'rating': review.get('textualRating', 'Unknown'),
-                                    'source': publisher.get('name', 'Unknown'),
-                                    'url': review.get('url', ''),
-                                    'date': review.get('reviewDate', ''),
-                                    'type': 'api_verified',
-                                    'relevance': 'high'
-                                })
-                
-                # Also search individual claims if available
-                if claims:
-                    for claim_text in claims[:3]:  # Check top 3 claims
-                        params['query'] = claim_text[:200]
-                        try:
-                            response = requests.get(api_url, params=params, timeout=10)
-                            if response.status_code == 200:
-                                data = response.json()
-                                for claim in data.get('claims', [])[:3]:
-                                    reviews = claim.get('claimReview', [])
-                                    if reviews:
-                                        review = reviews[0]
-                                        rating = review.get('textualRating', '').lower()
-                                        if rating in ['false', 'fake', 'debunked', 'hoax', 'pants on fire']:
-                                            fact_checks.append({
-                                                'claim': claim.get('text', ''),
-                                                'rating': review.get('textualRating', 'Unknown'),
-                                                'source': review.get('publisher', {}).get('name', 'Unknown'),
-                                                'url': review.get('url', ''),
-                                                'type': 'api_verified',
-                                                'relevance': 'very_high'
-                                            })
-                        except:
-                            pass  # Continue if one claim search fails
-                            
-            except Exception as e:
-                print(f"⚠️ Google Fact Check API error: {e}")
-        
-        # Add manual search links (for user verification)
-        search_query = quote_plus(query[:100])
-        for source in self.fact_check_sources[:6]:  # Include all major sources
-            fact_checks.append({
-                'source': source['name'],
-                'search_url': source['search_url'].format(query=search_query),
-                'type': 'manual_search',
-                'note': f"Search {source['name']} for related fact-checks"
-            })
+        # Also search individual claims if available
+        for claim_text in (claims or [])[:3]:  # Check top 3 claims
+            fact_checks.extend(self._fact_check_claim(claim_text))
         
+        fact_checks.extend(self._fact_check_search_links(query))
         return fact_checks
     
-    def _google_search(self, query: str, num_results: int = 10) -> list:
-        """Search Google and scrape results"""
-        search_results = []
-        
+    def _fact_check_query(self, query: str) -> list:
+        """Search the Google Fact Check API for the full query"""
+        # CRITICAL: Try Google Fact Check API first (most reliable)
         try:
-            # Build Google search URL
-            search_query = quote_plus(query[:200])
-            search_url = f'https://www.google.com/search?q={search_query}&num={num_results}'
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            
-            response = requests.get(search_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract search results (Google's structure)
-            # Try multiple selectors for different Google layouts
-            result_divs = soup.find_all('div', class_='g') or soup.find_all('div', {'data-ved': True})
-            
-            for idx, div in enumerate(result_divs[:num_results]):
-                try:
-                    # Extract title
-                    title_elem = div.find('h3') or div.find('a', {'data-ved': True})
-                    title = title_elem.get_text(strip=True) if title_elem else ''
-                    
-                    # Extract URL
-                    link_elem = div.find('a', href=True)
-                    url = ''
-                    if link_elem:
-                        url = link_elem.get('href', '')
-                        # Clean Google redirect URLs
-                        if url.startswith('/url?q='):
-                            url = url.split('/url?q=')[1].split('&')[0]
-                        elif url.startswith('/url?'):
-                            import urllib.parse
-                            parsed = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
-                            url = parsed.get('q', [''])[0]
-                    
-                    # Extract snippet
-                    snippet_elem = div.find('span', class_='aCOpRe') or div.find('div', class_='VwiC3b') or div.find('span', class_='st')
-                    snippet = snippet_elem.get_text(strip=True) if snippet_elem else ''
-                    
-                    if title and url:
-                        search_results.append({
-                            'title': title,
-                            'url': url,
-                            'snippet': snippet,
-                            'rank': idx + 1
-                        })
-                except Exception as e:
-                    continue
-            
-            # If no results found with standard selectors, try alternative method
-            if not search_results:
-                # Try scraping from search result links
-                links = soup.find_all('a', href=True)
-                for link in links[:num_results]:
-                    href = link.get('href', '')
-                    if href.startswith('/url?q=') or href.startswith('http'):
-                        title = link.get_text(strip=True)
-                        if title and len(title) > 10:  # Valid title
-                            if href.startswith('/url?q='):
-                                url = href.split('/url?q=')[1].split('&')[0]
-                            else:
-                                url = href
-                            
-                            if url and url.startswith('http'):
-                                search_results.append({
-                                    'title': title,
-                                    'url': url,
-                                    'snippet': '',
-                                    'rank': len(search_results) + 1
-                                })
-                                if len(search_results) >= num_results:
-                                    break
-            
-        except requests.RequestException as e:
-            print(f"⚠️ Google Search request error: {e}")
+            return self._query_fact_checks_from(self._fact_check_api_search(query, timeout=15))
         except Exception as e:
-            print(f"⚠️ Google Search parsing error: {e}")
+            print(f"⚠️ Google Fact Check API error: {e}")
+            return []
+    
+    def _fact_check_claim(self, claim_text: str) -> list:
+        """Search the Google Fact Check API for one extracted claim (debunks only)"""
+        if not claim_text:
+            return []
+        try:
+            return self._claim_fact_checks_from(self._fact_check_api_search(claim_text, timeout=10))
+        except Exception:
+            return []  # Continue if one claim search fails
+    
+    @staticmethod
+    def _query_fact_checks_from(claims: list) -> list:
+        """Fact-check entries for the main query (up to 2 reviews per claim)"""
+        fact_checks = []
+        for claim in (claims or [])[:10]:  # Get more results
+            reviews = claim.get('claimReview', [])
+            if reviews:
+                for review in reviews[:2]:  # Get up to 2 reviews per claim
+                    publisher = review.get('publisher', {})
+                    
+                    fact_checks.append({
+                        'claim': claim.get('text', ''),
+                        'claimant': claim.get('claimant', 'Unknown'),
+                        'rating': review.get('textualRating', 'Unknown'),
+                        'source': publisher.get('name', 'Unknown'),
+                        'url': review.get('url', ''),
+                        'date': review.get('reviewDate', ''),
+                        'type': 'api_verified',
+                        'relevance': 'high'
+                    })
+        return fact_checks
+    
+    @staticmethod
+    def _claim_fact_checks_from(claims: list) -> list:
+        """Fact-check entries for an extracted claim - only debunking reviews count"""
+        fact_checks = []
+        for claim in (claims or [])[:3]:
+            reviews = claim.get('claimReview', [])
+            if reviews:
+                review = reviews[0]
+                rating = review.get('textualRating', '').lower()
+                if rating in ['false', 'fake', 'debunked', 'hoax', 'pants on fire']:
+                    fact_checks.append({
+                        'claim': claim.get('text', ''),
+                        'rating': review.get('textualRating', 'Unknown'),
+                        'source': review.get('publisher', {}).get('name', 'Unknown'),
+                        'url': review.get('url', ''),
+                        'type': 'api_verified',
+                        'relevance': 'very_high'
+                    })
+        return fact_checks
+    
+    @staticmethod
+    def _fact_check_params(query: str) -> tuple:
+        """
+        API parameters (minus the key) and their cache key
+        Cache key: normalized query text + languageCode + maxAgeDays
+        """
+        params = {
+            'query': query[:200],
+            'languageCode': 'en',
+            'maxAgeDays': 365  # Check last year
+        }
+        normalized = ' '.join(params['query'].casefold().split()).strip(' .,!?;:\'"')
+        return params, f"{normalized}|{params['languageCode']}|{params['maxAgeDays']}"
+    
+    @staticmethod
+    def _cache_fact_check_claims(cache_key: str, claims: list) -> list:
+        """Store an API result; empty (negative) results get the shorter TTL"""
+        if claims:
+            fact_check_cache.set(cache_key, claims)
+        else:
+            fact_check_cache.set(cache_key, claims, ttl=FACT_CHECK_NEGATIVE_TTL)
+        return claims
+    
+    def _fact_check_api_search(self, query: str, timeout: int = 15):
+        """
+        Query the Google Fact Check API through the response cache
+        Returns: list of API claim objects, or None if the API is unavailable/failed
+        """
+        google_api_key = os.getenv('GOOGLE_API_KEY')
+        if not google_api_key:
+            return None
+        
+        params, cache_key = self._fact_check_params(query)
+        cached = fact_check_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
         
-        return search_results
+        response = http_client.get(FACT_CHECK_API_URL, params={'key': google_api_key, **params}, timeout=timeout)
+        if response.status_code != 200:
+            return None  # Don't cache transient API failures
+        
+        return self._cache_fact_check_claims(cache_key, response.json().get('claims', []))
     
-    def _google_search(self, query: str, num_results: int = 10) -> list:
+    def _fact_check_search_links(self, query: str) -> list:
+        """Manual search links (for user verification)"""
+        search_query = quote_plus(query[:100])
+        return [{
+            'source': source['name'],
+            'search_url': source['search_url'].format(query=search_query),
+            'type': 'manual_search',
+            'note': f"Search {source['name']} for related fact-checks"
+        } for source in self.fact_check_sources[:6]]  # Include all major sources
+    
+    def _gather_evidence(self, query: str, title: str, content: str, on_stage=None) -> dict:
         """
-        Perform a Google search and scrape results
-        Note: This is a basic scraper. For production, use Custom Search JSON API.
+        Run the network-bound evidence stages as a dependency graph
+        
+        The main-query fact check and the Google cross-reference search don't
+        need the extracted claims, so they start alongside claim extraction;
+        only the per-claim fact-check lookups wait for the claims.
+        
+        Returns: {key_claims, fact_checks, cross_references}
         """
-        results = []
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-            }
-            
-            # Search URL
-            url = f"https://www.google.com/search?q={quote_plus(query)}&num={num_results}"
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code != 200:
-                print(f"⚠️ Google Search failed: {response.status_code}")
-                return results
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Parse search results (div.g)
-            for g in soup.select('div.g'):
-                # Extract link
-                link = g.select_one('a')
-                if not link:
-                    continue
-                    
-                href = link.get('href')
-                if not href or not href.startswith('http'):
-                    continue
-                    
-                # Extract title
-                title_el = g.select_one('h3')
-                title = title_el.get_text() if title_el else href
-                
-                # Extract snippet
-                snippet_el = g.select_one('div.VwiC3b') or g.select_one('div.IsZvec') or g.select_one('div.s')
-                snippet = snippet_el.get_text() if snippet_el else ''
-                
-                results.append({
-                    'title': title,
-                    'url': href,
-                    'snippet': snippet,
-                    'rank': len(results) + 1
-                })
-                
-                if len(results) >= num_results:
-                    break
-                    
-        except Exception as e:
-            print(f"⚠️ Google Search error: {e}")
-            
-        return results
-
+        on_stage = on_stage or _ignore_stage
+        graph = StageGraph()
+        graph.add('key_claims', lambda: self._extract_key_claims(title, content))
+        graph.add('query_fact_checks', lambda: self._fact_check_query(query))
+        graph.add('cross_references', lambda: self._search_cross_references(query, []))
+        for i in range(3):  # Top 3 claims, one lookup each
+            graph.add(f'claim_fact_checks_{i}',
+                      lambda key_claims, i=i: self._fact_check_claim(key_claims[i]) if i < len(key_claims) else [],
+                      deps=['key_claims'])
+        
+        def report(name, stage_result):
+            if 'fact_checks' in name:
+                if stage_result:
+                    on_stage('fact_checks', stage_result)
+            else:
+                on_stage(name, stage_result)
+        
+        stages = graph.run(on_complete=report)
+        
+        fact_checks = list(stages['query_fact_checks'])
+        for i in range(3):
+            fact_checks.extend(stages[f'claim_fact_checks_{i}'])
+        search_links = self._fact_check_search_links(query)
+        fact_checks.extend(search_links)
+        on_stage('fact_checks', search_links)
+        
+        return {
+            'key_claims': stages['key_claims'],
+            'fact_checks': fact_checks,
+            'cross_references': stages['cross_references']
+        }
+    
+    def _google_search(self, query: str, num_results: int = 10) -> list:
+        """Web search through the cached, fallback-ordered provider chain (see search_providers)"""
+        return search_service.search(query, num_results)
+    
     def _search_cross_references(self, query: str, claims: list) -> list:
         """Search trusted news sources for corroborating reports - ENHANCED WITH GOOGLE SEARCH"""
-        cross_refs = []
-        
         # NEW: Perform actual Google Search and scrape results
         print(f"🔍 Performing Google Search for: {query[:50]}...")
         google_results = self._google_search(query, num_results=10)
+        return self._cross_references_from(query, google_results)
+    
+    def _cross_references_from(self, query: str, google_results: list) -> list:
+        """Cross-reference entries from search results plus manual search links"""
+        cross_refs = []
         
         # Add scraped Google search results
         for result in google_results[:5]:  # Top 5 results
             # Check if it's from a trusted source
-            domain = urlparse(result['url']).netloc.replace('www.', '')
-            is_trusted = any(trusted in domain.lower() for trusted in [
-                'reuters', 'bbc', 'ap.org', 'pib.gov', 'who.int', 'cdc.gov',
-                'thehindu', 'indianexpress', 'timesofindia', 'hindustantimes'
-            ])
+            entry = self.credibility.lookup(urlparse(result['url']).netloc)
+            is_trusted = bool(entry) and entry['tier'] in ('tier1', 'tier2', 'tier3')
             
             cross_refs.append({
                 'source': result['title'],
@@ -942,48 +1055,63 @@ Return ONLY the JSON array, no other text."""
         
         return cross_refs
     
-    def _ai_verify_claim(self, text: str, fact_checks: list, key_claims: list, cross_refs: list = None) -> dict:
+    def _ai_verify_claim(self, text: str, fact_checks: list, key_claims: list, cross_refs: list = None,
+                         hits=None) -> dict:
         """Use Gemini AI to verify claim against fact-checks, Google search results, and patterns - PRODUCTION STRICT VERSION"""
         if not gemini_model:
             print("⚠️ Gemini model not available - skipping AI verification")
             return {'score': None, 'verdict': None, 'warnings': []}
         
         try:
-            # Build fact-check summary
-            fact_check_summary = []
-            debunked_found = False
-            verified_found = False
-            
-            for fc in fact_checks[:10]:  # Check more fact-checks
-                if fc.get('type') != 'manual_search':
-                    rating = fc.get('rating', '').lower()
-                    source = fc.get('source', 'Unknown')
-                    fact_check_summary.append(f"- {source}: {rating}")
-                    
-                    if rating in ['false', 'fake', 'debunked', 'hoax', 'pants on fire', 'mostly false']:
-                        debunked_found = True
-                    elif rating in ['true', 'verified', 'correct', 'mostly true']:
-                        verified_found = True
-            
-            fact_check_text = '\n'.join(fact_check_summary) if fact_check_summary else "No fact-check results found"
-            
-            # Build Google Search results summary
-            google_search_summary = []
-            if cross_refs:
-                for ref in cross_refs:
-                    if ref.get('type') == 'google_search' and ref.get('url'):
-                        title = ref.get('source', 'Unknown')
-                        url = ref.get('url', '')
-                        snippet = ref.get('snippet', '')
-                        google_search_summary.append(f"- {title}\n  URL: {url}\n  Snippet: {snippet[:200]}")
-            
-            google_search_text = '\n'.join(google_search_summary[:5]) if google_search_summary else "No Google search results found"
-            
-            # BALANCED prompt - strict for scams, fair for legitimate claims
-            # Check if this is a simple factual statement
-            is_factual = self._is_simple_factual_statement(text)
-            
-            prompt = f"""You are a professional fact-checker AI. Your job is to accurately verify claims. Be STRICT for scams and manipulation, but FAIR for legitimate factual statements.
+            if hits is None:
+                hits = lexicon_registry.current().scan(text)
+            prompt, debunked_found = self._ai_verify_prompt(text, fact_checks, key_claims, cross_refs, hits)
+            response = gemini_model.generate_content(prompt, generation_config=AI_VERIFY_GENERATION_CONFIG)
+            return self._parse_ai_verdict(response.text, text, debunked_found, hits)
+        except Exception as e:
+            print(f"⚠️ AI verification error: {e}")
+            import traceback
+            traceback.print_exc()
+        
+        return {'score': None, 'verdict': None, 'warnings': []}
+    
+    def _ai_verify_prompt(self, text: str, fact_checks: list, key_claims: list, cross_refs: list, hits) -> tuple:
+        """Build the verification prompt. Returns (prompt, debunked_found)"""
+        # Build fact-check summary
+        fact_check_summary = []
+        debunked_found = False
+        verified_found = False
+        
+        for fc in fact_checks[:10]:  # Check more fact-checks
+            if fc.get('type') != 'manual_search':
+                rating = fc.get('rating', '').lower()
+                source = fc.get('source', 'Unknown')
+                fact_check_summary.append(f"- {source}: {rating}")
+                
+                if rating in ['false', 'fake', 'debunked', 'hoax', 'pants on fire', 'mostly false']:
+                    debunked_found = True
+                elif rating in ['true', 'verified', 'correct', 'mostly true']:
+                    verified_found = True
+        
+        fact_check_text = '\n'.join(fact_check_summary) if fact_check_summary else "No fact-check results found"
+        
+        # Build Google Search results summary
+        google_search_summary = []
+        if cross_refs:
+            for ref in cross_refs:
+                if ref.get('type') == 'google_search' and ref.get('url'):
+                    title = ref.get('source', 'Unknown')
+                    url = ref.get('url', '')
+                    snippet = ref.get('snippet', '')
+                    google_search_summary.append(f"- {title}\n  URL: {url}\n  Snippet: {snippet[:200]}")
+        
+        google_search_text = '\n'.join(google_search_summary[:5]) if google_search_summary else "No Google search results found"
+        
+        # BALANCED prompt - strict for scams, fair for legitimate claims
+        # Check if this is a simple factual statement
+        is_factual = self._is_simple_factual_statement(text, hits)
+        
+        prompt = f"""You are a professional fact-checker AI. Your job is to accurately verify claims. Be STRICT for scams and manipulation, but FAIR for legitimate factual statements.
 
 CLAIM TO VERIFY:
 "{text[:1000]}"
@@ -1063,139 +1191,95 @@ CRITICAL:
 - For SIMPLE FACTUAL STATEMENTS → Score HIGH (0.7-0.9) if factually correct
 - For LEGITIMATE NEWS without red flags → Score MEDIUM-HIGH (0.6-0.8)
 - Only default to suspicious (0.3) if there are actual red flags or manipulation tactics"""
-
-            response = gemini_model.generate_content(
-                prompt,
-                generation_config={
-                    "temperature": 0.1,  # Low temperature for consistent, strict results
-                    "top_p": 0.8,
-                    "top_k": 40
-                }
-            )
-            
-            # Extract JSON from response (try multiple methods)
-            response_text = response.text.strip()
-            
-            # Remove markdown code blocks if present
-            if '```json' in response_text:
-                response_text = response_text.split('```json')[1].split('```')[0]
-            elif '```' in response_text:
-                response_text = response_text.split('```')[1].split('```')[0]
-            
-            json_match = re.search(r'\{[\s\S]*\}', response_text)
-            if json_match:
-                try:
-                    ai_result = json.loads(json_match.group())
-                    
-                    score = float(ai_result.get('score', 0.25))  # Default to suspicious (lower)
-                    
-                    # CRITICAL: Enforce ABSOLUTE rules (AI cannot override these)
-                    if debunked_found:
-                        score = min(score, 0.15)  # If debunked, max 0.15 (ABSOLUTE)
-                    
-                    if ai_result.get('is_fake', False):
-                        score = min(score, 0.2)  # If AI says fake, max 0.2 (ABSOLUTE)
-                    
-                    # Check for scam patterns in text (ABSOLUTE CAPS)
-                    text_lower = text.lower()
-                    scam_phrases = ['free money', 'lottery', 'claim prize', 'forward to claim', 'share to get', 
-                                   'government giving', 'pm giving', 'free scheme', 'instant money', 'prize money',
-                                   'unclaimed money', 'tax refund', 'reward', 'bonus', 'free cash']
-                    if any(phrase in text_lower for phrase in scam_phrases):
-                        score = min(score, 0.1)  # Scam = VERY low (ABSOLUTE)
-                    
-                    urgency_phrases = ['share before deleted', 'forward immediately', 'act now', 'limited time',
-                                      'urgent share', 'must forward', 'share now', 'forward to all']
-                    if any(phrase in text_lower for phrase in urgency_phrases):
-                        score = min(score, 0.2)  # Urgency = very suspicious (ABSOLUTE)
-                    
-                    # Forward/share manipulation (ABSOLUTE)
-                    if any(phrase in text_lower for phrase in ['forward this', 'share this', 'send to', 'tell everyone']):
-                        score = min(score, 0.25)  # Viral manipulation = suspicious (ABSOLUTE)
-                    
-                    # Large numbers with money = SCAM (ABSOLUTE)
-                    if re.search(r'\d{4,}', text) and any(word in text_lower for word in ['free', 'money', 'rupees', 'dollars', 'claim']):
-                        score = min(score, 0.12)  # Scam with numbers = very low (ABSOLUTE)
-                    
-                    # Ensure score is reasonable (but respect absolute caps)
-                    score = max(0.05, min(0.95, round(score, 2)))
-                    
-                    red_flags = ai_result.get('red_flags', [])
-                    warnings = [f"🚨 {flag}" for flag in red_flags]
-                    
-                    return {
-                        'score': score,
-                        'verdict': ai_result.get('verdict', 'AI analysis indicates suspicious content'),
-                        'warnings': warnings,
-                        'confidence': ai_result.get('confidence', 'medium')
-                    }
-                except json.JSONDecodeError as e:
-                    print(f"⚠️ Failed to parse AI JSON response: {e}")
-                    print(f"Response text: {response_text[:500]}")
-            else:
-                print(f"⚠️ No JSON found in AI response: {response_text[:500]}")
+        return prompt, debunked_found
+    
+    def _parse_ai_verdict(self, response_text: str, text: str, debunked_found: bool, hits) -> dict:
+        """Turn the model's JSON reply into a capped AI result (absolute rules applied here)"""
+        # Extract JSON from response (try multiple methods)
+        response_text = response_text.strip()
+        
+        # Remove markdown code blocks if present
+        if '```json' in response_text:
+            response_text = response_text.split('```json')[1].split('```')[0]
+        elif '```' in response_text:
+            response_text = response_text.split('```')[1].split('```')[0]
+        
+        json_match = re.search(r'\{[\s\S]*\}', response_text)
+        if json_match:
+            try:
+                ai_result = json.loads(json_match.group())
                 
-        except Exception as e:
-            print(f"⚠️ AI verification error: {e}")
-            import traceback
-            traceback.print_exc()
+                score = float(ai_result.get('score', 0.25))  # Default to suspicious (lower)
+                
+                # CRITICAL: Enforce ABSOLUTE rules (AI cannot override these)
+                if debunked_found:
+                    score = min(score, 0.15)  # If debunked, max 0.15 (ABSOLUTE)
+                
+                if ai_result.get('is_fake', False):
+                    score = min(score, 0.2)  # If AI says fake, max 0.2 (ABSOLUTE)
+                
+                # Check for scam patterns in text (ABSOLUTE CAPS)
+                if hits.any('ai_scam'):
+                    score = min(score, 0.1)  # Scam = VERY low (ABSOLUTE)
+                
+                if hits.any('ai_urgency'):
+                    score = min(score, 0.2)  # Urgency = very suspicious (ABSOLUTE)
+                
+                # Forward/share manipulation (ABSOLUTE)
+                if hits.any('ai_forward'):
+                    score = min(score, 0.25)  # Viral manipulation = suspicious (ABSOLUTE)
+                
+                # Large numbers with money = SCAM (ABSOLUTE)
+                if re.search(r'\d{4,}', text) and hits.any('ai_money_words'):
+                    score = min(score, 0.12)  # Scam with numbers = very low (ABSOLUTE)
+                
+                # Ensure score is reasonable (but respect absolute caps)
+                score = max(0.05, min(0.95, round(score, 2)))
+                
+                red_flags = ai_result.get('red_flags', [])
+                warnings = [f"🚨 {flag}" for flag in red_flags]
+                
+                return {
+                    'score': score,
+                    'verdict': ai_result.get('verdict', 'AI analysis indicates suspicious content'),
+                    'warnings': warnings,
+                    'confidence': ai_result.get('confidence', 'medium')
+                }
+            except json.JSONDecodeError as e:
+                print(f"⚠️ Failed to parse AI JSON response: {e}")
+                print(f"Response text: {response_text[:500]}")
+        else:
+            print(f"⚠️ No JSON found in AI response: {response_text[:500]}")
         
         return {'score': None, 'verdict': None, 'warnings': []}
     
-    def _check_fake_patterns(self, text: str) -> tuple:
+    def _check_fake_patterns(self, text: str, hits=None) -> tuple:
         """Check for common fake news patterns - ULTRA STRICT VERSION"""
-        text_lower = text.lower()
+        if hits is None:
+            hits = lexicon_registry.current().scan(text)
         warnings = []
         score = 0.0
         
         # CRITICAL: Scam/fraud indicators (highest weight - ABSOLUTE RED FLAG)
-        scam_patterns = [
-            'free money', 'lottery', 'winner', 'claim your prize', 'limited time',
-            'act now', 'guaranteed', 'click here', 'congratulations', 'you have won',
-            'claim now', 'send to 10 people', 'forward to claim', 'share to get',
-            'government giving', 'pm giving', 'free scheme', 'instant money',
-            'rupees', 'dollars', 'prize money', 'reward', 'bonus', 'free cash',
-            'transfer money', 'bank account', 'aadhar', 'pan card', 'verify account',
-            'claim reward', 'unclaimed money', 'tax refund', 'free benefit'
-        ]
-        found_scam = [p for p in scam_patterns if p in text_lower]
+        found_scam = hits.found('scam')
         if found_scam:
             score += 0.8  # EXTREME penalty - SCAM
             warnings.append(f"🚨 SCAM INDICATORS DETECTED: {', '.join(found_scam[:3])}")
         
         # CRITICAL: Urgency/manipulation patterns (VERY HIGH WEIGHT)
-        urgency_patterns = [
-            'share before deleted', 'forward to everyone', 'spread the word',
-            'they dont want you to know', 'banned', 'censored', 'hidden truth',
-            'doctors hate this', 'government hiding', 'media hiding', 'secret revealed',
-            'forward immediately', 'share now', 'urgent share', 'must forward',
-            'share maximum', 'forward to all', 'tell everyone', 'spread this',
-            'viral', 'going viral', 'everyone is talking', 'breaking news',
-            'urgent', 'important', 'must read', 'must see', 'must share'
-        ]
-        found_urgency = [p for p in urgency_patterns if p in text_lower]
+        found_urgency = hits.found('urgency')
         if found_urgency:
             score += 0.7  # EXTREME penalty - manipulation
             warnings.append(f"⚠️ MANIPULATION TACTICS: {', '.join(found_urgency[:3])}")
         
         # Sensationalist language
-        sensational = [
-            'shocking', 'breaking', 'urgent', 'must read', 'must share',
-            'viral', 'unbelievable', 'you wont believe', 'secret',
-            'exposed', 'revealed', 'truth they hide', 'amazing', 'incredible'
-        ]
-        found_sensational = [w for w in sensational if w in text_lower]
+        found_sensational = hits.found('sensational')
         if found_sensational:
             score += 0.3
             warnings.append(f"Sensationalist language: {', '.join(found_sensational[:3])}")
         
         # Health misinformation patterns
-        health_fake = [
-            'miracle cure', 'cancer cured', 'doctors shocked', 'one simple trick',
-            'lose weight fast', 'instant cure', 'natural remedy that works',
-            'big pharma hiding', 'vaccine causes', 'medical conspiracy'
-        ]
-        found_health = [p for p in health_fake if p in text_lower]
+        found_health = hits.found('health')
         if found_health:
             score += 0.4
             warnings.append(f"Health misinformation patterns: {', '.join(found_health[:2])}")
@@ -1224,25 +1308,23 @@ CRITICAL:
             warnings.append("Multiple question marks (clickbait pattern)")
         
         # Forward chain patterns
-        forward_patterns = [
-            'forward this', 'send this', 'share this', 'pass this on',
-            'tell everyone', 'spread this', 'forward to all'
-        ]
-        if any(p in text_lower for p in forward_patterns):
+        if hits.any('forward'):
             score += 0.3
             warnings.append("Forward/share manipulation detected")
         
         # Numbers/statistics that seem fake
         if re.search(r'\d{4,}', text):  # Very large numbers
-            if any(word in text_lower for word in ['free', 'money', 'rupees', 'dollars']):
+            if hits.any('money_words'):
                 score += 0.2
                 warnings.append("Suspicious large numbers with money claims")
         
         # Return score (can exceed 1.0 for multiple severe patterns)
         return min(score, 1.2), warnings
     
-    def _is_simple_factual_statement(self, text: str) -> bool:
+    def _is_simple_factual_statement(self, text: str, hits=None) -> bool:
         """Detect if text is a simple factual statement (e.g., 'X is Y)"""
+        if hits is None:
+            hits = lexicon_registry.current().scan(text)
         text_lower = text.lower().strip()
         
         # Remove punctuation for pattern matching
@@ -1265,13 +1347,11 @@ CRITICAL:
         # Check for simple statements without manipulation tactics
         if len(text.split()) < 15:  # Short statements
             # No scam/urgency patterns
-            scam_words = ['free money', 'lottery', 'claim', 'forward', 'share', 'urgent', 'limited time', 'congratulations', 'you won']
-            if not any(word in text_lower for word in scam_words):
+            if not hits.any('factual_scam_words'):
                 # Contains factual indicators
-                factual_indicators = ['is', 'was', 'are', 'were', 'according to', 'said', 'announced', 'pm of', 'president of', 'minister of']
-                if any(indicator in text_lower for indicator in factual_indicators):
+                if hits.any('factual_indicators'):
                     # Check for political/positional facts
-                    if any(phrase in text_lower for phrase in ['pm of', 'president of', 'minister of', 'prime minister', 'chief minister']):
+                    if hits.any('positional'):
                         return True
                     # Check for simple "X is Y" structure
                     if ' is ' in text_lower and len(text.split()) <= 8:
@@ -1281,8 +1361,11 @@ CRITICAL:
         return False
     
     def _calculate_verification(self, source_cred: dict, fact_checks: list, 
-                                cross_refs: list, article: dict) -> dict:
-        """Calculate final verification score and verdict - BALANCED VERSION"""
+                                cross_refs: list, article: dict, ai_analysis: dict = None) -> dict:
+        """
+        Calculate final verification score and verdict - BALANCED VERSION
+        ai_analysis: a precomputed _ai_verify_claim result; computed here when omitted
+        """
         
         # Start with source credibility
         base_score = source_cred['score']
@@ -1290,22 +1373,22 @@ CRITICAL:
         
         # Use AI verification if available
         article_text = article.get('content', '') + ' ' + article.get('title', '')
-        ai_score = None
-        if gemini_model and article_text:
+        hits = lexicon_registry.current().scan(article_text)
+        if ai_analysis is None and gemini_model and article_text:
             try:
-                ai_analysis = self._ai_verify_claim(article_text, fact_checks, [])
-                ai_score = ai_analysis.get('score')
+                ai_analysis = self._ai_verify_claim(article_text, fact_checks, [], hits=hits)
             except:
                 pass
+        ai_score = ai_analysis.get('score') if ai_analysis else None
         
         # Check if it's a simple factual statement (give benefit of doubt)
-        is_simple_fact = self._is_simple_factual_statement(article_text)
+        is_simple_fact = self._is_simple_factual_statement(article_text, hits)
         if is_simple_fact:
             # Simple facts start at 0.7 (credible unless proven otherwise)
             base_score = max(base_score, 0.7)
         
         # Check content for fake patterns (but don't penalize simple facts too much)
-        fake_score, _ = self._check_fake_patterns(article_text)
+        fake_score, _ = self._check_fake_patterns(article_text, hits)
         has_severe_fake_patterns = fake_score > 0.3
         
         # If it's a simple fact AND has no fake patterns, trust it
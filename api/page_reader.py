@@ -0,0 +1,157 @@
+"""
+RapidVerify Page Reader
+Bounded, incremental decoding of fetched HTML: content-type/length checks, a byte cap,
+and early termination once the head and enough body text have arrived
+"""
+import codecs
+import os
+import re
+from typing import Optional
+
+import requests
+
+SCRAPE_MAX_BYTES = int(os.getenv('SCRAPE_MAX_BYTES', str(3 * 1024 * 1024)))  # Read cap per page
+SCRAPE_MAX_CONTENT_LENGTH = int(os.getenv('SCRAPE_MAX_CONTENT_LENGTH', str(25 * 1024 * 1024)))  # Refuse outright
+SCRAPE_BODY_TEXT_KB = int(os.getenv('SCRAPE_BODY_TEXT_KB', '64'))  # Stop after this much body text (0 = off)
+SCRAPE_CHUNK_SIZE = 16 * 1024
+
+HTML_CONTENT_TYPES = frozenset(['text/html', 'application/xhtml+xml'])
+
+_SNIFF_BYTES = 2048  # <meta charset> must appear this early (HTML spec: 1024)
+_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w-]+)', re.IGNORECASE)
+_BODY_RE = re.compile(r'<body[\s>]', re.IGNORECASE)
+_RAW_OPEN_RE = re.compile(r'<(script|style)\b', re.IGNORECASE)
+_RAW_CLOSE_RE = {
+    'script': re.compile(r'</script\s*>', re.IGNORECASE),
+    'style': re.compile(r'</style\s*>', re.IGNORECASE),
+}
+_TAG_RE = re.compile(r'<[^>]*>')
+_SPACE_RE = re.compile(r'\s+')
+
+
+class PageRejected(requests.RequestException):
+    """The response is not an HTML page we are willing to read"""
+
+
+class PageReader:
+    """
+    Decodes a page chunk by chunk and says when to stop reading
+
+    Construction validates the response headers: a non-HTML Content-Type or
+    a Content-Length above `max_content_length` raises PageRejected before
+    any body is read. feed() decodes incrementally (charset from the header,
+    else an early <meta charset>, else UTF-8) and returns True once
+    `max_bytes` have been read or, after <body>, `body_text_limit` characters
+    of visible text (script/style and tags excluded) have been seen.
+    """
+
+    def __init__(self, content_type: Optional[str], content_length: Optional[str],
+                 max_bytes: int = SCRAPE_MAX_BYTES, body_text_limit: int = SCRAPE_BODY_TEXT_KB * 1024,
+                 max_content_length: int = SCRAPE_MAX_CONTENT_LENGTH):
+        mime, _, params = (content_type or '').partition(';')
+        mime = mime.strip().lower()
+        if mime and mime not in HTML_CONTENT_TYPES:
+            raise PageRejected(f"Unsupported content type: {mime}")
+        if content_length and content_length.isdigit() and int(content_length) > max_content_length:
+            raise PageRejected(f"Page too large: {int(content_length)} bytes (limit {max_content_length})")
+
+        self.max_bytes = max_bytes
+        self.body_text_limit = body_text_limit
+        self.charset = self._header_charset(params)
+        self.bytes_read = 0
+        self.truncated = False  # Stopped before the end of the response
+        self._pending = b''  # Bytes held back until the charset is known
+        self._decoder = None
+        self._parts = []
+        self._text = ''  # Decoded text not yet scanned for body text
+        self._in_body = False
+        self._body_chars = 0
+        self._raw_close = None  # Inside <script>/<style>: the pattern that ends it
+
+    @staticmethod
+    def _header_charset(params: str) -> Optional[str]:
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'charset' and value.strip():
+                return value.strip().strip('"\'')
+        return None
+
+    def feed(self, chunk: bytes) -> bool:
+        """Add a chunk; True means enough has been read and the caller should stop"""
+        if self.bytes_read + len(chunk) > self.max_bytes:
+            chunk = chunk[:self.max_bytes - self.bytes_read]
+            self.truncated = True
+        self.bytes_read += len(chunk)
+
+        if self._decoder is None:
+            self._pending += chunk
+            if len(self._pending) < _SNIFF_BYTES and not self.truncated:
+                return False
+            chunk, self._pending = self._pending, b''
+            self._start_decoder(chunk)
+
+        self._consume(self._decoder.decode(chunk))
+        if not self.truncated and self.body_text_limit and self._body_chars >= self.body_text_limit:
+            self.truncated = True
+        return self.truncated
+
+    def finish(self) -> str:
+        """All text decoded so far"""
+        if self._decoder is None:
+            self._start_decoder(self._pending)
+            self._parts.append(self._decoder.decode(self._pending, final=True))
+            self._pending = b''
+        else:
+            self._parts.append(self._decoder.decode(b'', final=True))
+        return ''.join(self._parts)
+
+    def _start_decoder(self, head: bytes):
+        charset = self.charset
+        if not charset:
+            match = _CHARSET_RE.search(head[:_SNIFF_BYTES])
+            charset = match.group(1).decode('ascii') if match else 'utf-8'
+        try:
+            self._decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+        except LookupError:
+            charset = 'utf-8'
+            self._decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+        self.charset = charset
+
+    def _consume(self, text: str):
+        self._parts.append(text)
+        if not self.body_text_limit or self._body_chars >= self.body_text_limit:
+            return
+        self._text += text
+        if not self._in_body:
+            match = _BODY_RE.search(self._text)
+            if not match:
+                self._text = self._text[-8:]  # '<body' may straddle chunks
+                return
+            self._in_body = True
+            self._text = self._text[match.start():]
+        self._count_body_text()
+
+    def _count_body_text(self):
+        """Count visible text in complete markup; keep an open tag or script for the next chunk"""
+        text = self._text
+        end = text.rfind('>') + 1
+        pos = 0
+        while True:
+            if self._raw_close is not None:
+                close = self._raw_close.search(text, pos)
+                if not close:
+                    self._text = text[max(pos, len(text) - 9):]  # '</script>' may straddle chunks
+                    return
+                self._raw_close = None
+                pos = close.end()
+            if pos >= end:
+                break
+            raw = _RAW_OPEN_RE.search(text, pos, end)
+            stop = raw.start() if raw else end
+            self._body_chars += len(_SPACE_RE.sub(' ', _TAG_RE.sub(' ', text[pos:stop])).strip())
+            if not raw:
+                pos = end
+                break
+            self._raw_close = _RAW_CLOSE_RE[raw.group(1).lower()]
+            pos = raw.end()
+        self._text = text[pos:]
@@ -0,0 +1,104 @@
+"""
+RapidVerify Pattern Engine
+Compiles every phrase family into one Aho-Corasick automaton so a text is scanned once
+"""
+from collections import deque
+from typing import Dict, List
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher (reports every pattern id occurring in a text)"""
+
+    def __init__(self, patterns: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(pattern_id)
+
+        # Breadth-first pass to build failure links; outputs inherit along them
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                if self._fail[nxt] == nxt:
+                    self._fail[nxt] = 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> set:
+        """Return the ids of all patterns that occur in text"""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class PatternHits:
+    """Per-family matches from a single scan, in each family's declared order"""
+
+    def __init__(self, hits: Dict[str, List[str]]):
+        self._hits = hits
+
+    def found(self, family: str) -> List[str]:
+        return self._hits.get(family, [])
+
+    def any(self, family: str) -> bool:
+        return bool(self._hits.get(family))
+
+
+class PatternEngine:
+    """
+    Case-insensitive phrase matcher over named families
+
+    Matching semantics are the same as `phrase in text.lower()`: a phrase
+    hits anywhere it appears as a substring.
+    """
+
+    def __init__(self, families: Dict[str, List[str]]):
+        self.families = {name: [p.lower() for p in phrases] for name, phrases in families.items()}
+
+        # A phrase may belong to several families; map each unique phrase to (family, position)
+        self._phrases: List[str] = []
+        self._owners: List[List[tuple]] = []
+        index: Dict[str, int] = {}
+        for family, phrases in self.families.items():
+            for position, phrase in enumerate(phrases):
+                if phrase not in index:
+                    index[phrase] = len(self._phrases)
+                    self._phrases.append(phrase)
+                    self._owners.append([])
+                self._owners[index[phrase]].append((family, position))
+
+        self._automaton = AhoCorasick(self._phrases)
+
+    def scan(self, text: str) -> PatternHits:
+        """One linear pass over text returning the hits for every family"""
+        grouped: Dict[str, List[tuple]] = {}
+        for phrase_id in self._automaton.find(text.lower()):
+            for family, position in self._owners[phrase_id]:
+                grouped.setdefault(family, []).append((position, self._phrases[phrase_id]))
+        return PatternHits({family: [p for _, p in sorted(hits)] for family, hits in grouped.items()})
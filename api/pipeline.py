@@ -0,0 +1,100 @@
+"""
+RapidVerify Verification Pipeline
+Runs verification stages as a dependency graph so independent network calls overlap
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# Shared worker pool for pipeline stages (bounded so bursts can't spawn unlimited threads)
+PIPELINE_WORKERS = int(os.getenv('VERIFY_PIPELINE_WORKERS', '16'))
+CONCURRENT_PIPELINE = os.getenv('VERIFY_CONCURRENT', 'true').lower() not in ('0', 'false', 'no')
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class VerificationCancelled(Exception):
+    """Raised from a stage callback to abandon a verification (e.g. the client went away)"""
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Lazily create the shared stage executor (once, even when first requests race)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=PIPELINE_WORKERS, thread_name_prefix='verify-stage')
+    return _executor
+
+
+class StageGraph:
+    """
+    A small DAG of named pipeline stages
+
+    Each stage is a callable that receives the results of its dependencies
+    as keyword arguments. Stages whose dependencies are satisfied run
+    immediately, so independent stages execute in parallel.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, tuple] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], deps: Iterable[str] = ()) -> 'StageGraph':
+        """Register a stage; dependencies must already be registered"""
+        deps = tuple(deps)
+        for dep in deps:
+            if dep not in self._stages:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+        self._stages[name] = (fn, deps)
+        return self
+
+    def _call(self, name: str, results: Dict[str, Any]) -> Any:
+        fn, deps = self._stages[name]
+        return fn(**{dep: results[dep] for dep in deps})
+
+    def run(self, concurrent: bool = CONCURRENT_PIPELINE,
+            on_complete: Optional[Callable[[str, Any], None]] = None) -> Dict[str, Any]:
+        """
+        Execute every stage and return {stage_name: result}
+
+        Args:
+            concurrent: Run ready stages on the shared executor instead of inline
+            on_complete: Called in the caller's thread as each stage finishes;
+                if it raises, stages not yet started are cancelled
+        """
+        results: Dict[str, Any] = {}
+
+        if not concurrent:
+            # Registration order is already a valid topological order
+            for name in self._stages:
+                results[name] = self._call(name, results)
+                if on_complete:
+                    on_complete(name, results[name])
+            return results
+
+        executor = get_executor()
+        pending = dict(self._stages)
+        running = {}
+
+        while pending or running:
+            ready = [name for name, (_, deps) in pending.items()
+                     if all(dep in results for dep in deps)]
+            for name in ready:
+                del pending[name]
+                running[executor.submit(self._call, name, dict(results))] = name
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                    if on_complete:
+                        on_complete(name, results[name])
+                except Exception:
+                    for other in running:
+                        other.cancel()
+                    raise
+
+        return results
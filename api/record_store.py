@@ -0,0 +1,589 @@
+"""
+RapidVerify Record Store
+Durable local storage for verification records: SQLite (indexed, WAL) or an append-only journal
+"""
+import heapq
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+RECORD_STORE_BACKENDS = ('sqlite', 'journal')
+# Bumped when the stored counters were computed wrongly, so existing databases rebuild them once
+SQLITE_COUNTERS_VERSION = '2'
+
+
+def is_false_claim(record: Dict[str, Any]) -> bool:
+    """Dashboard 'false claims' rule: debunked, or scored below 0.4 (no score counts as 0)"""
+    return record.get('status') == 'debunked' or (record.get('verification_score') or 0) < 0.4
+
+
+def is_verified_claim(record: Dict[str, Any]) -> bool:
+    """Dashboard 'verified' rule: verified, or scored 0.7 and above"""
+    return record.get('status') == 'verified' or (record.get('verification_score') or 0) >= 0.7
+
+
+def _record_deltas(record: Dict[str, Any]) -> Tuple[Dict[str, int], int]:
+    """Counter increments contributed by one record, and its hour bucket (unix hours)"""
+    weight = 0 if record.get('chain_status') == 'orphaned' else 1  # Dropped from the chain by a reorg
+    counters = {
+        'total': weight,
+        'false': weight * is_false_claim(record),
+        'verified': weight * is_verified_claim(record),
+    }
+    if record.get('status'):
+        counters[f"status:{record['status']}"] = weight
+    return counters, int(record.get('timestamp') or 0) // 3600
+
+
+class RecordCounters:
+    """
+    Running dashboard aggregates: totals, per-status counts and a per-hour histogram
+
+    Updated per record (a replaced record is subtracted first), so reading
+    them never touches the records themselves.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {'total': 0, 'false': 0, 'verified': 0}
+        self.hourly: Dict[int, Dict[str, int]] = {}
+
+    def apply(self, record: Dict[str, Any], sign: int = 1):
+        counters, hour = _record_deltas(record)
+        for name, delta in counters.items():
+            self.counters[name] = self.counters.get(name, 0) + sign * delta
+        bucket = self.hourly.setdefault(hour, {'total': 0, 'false': 0, 'verified': 0})
+        for name in bucket:
+            bucket[name] += sign * counters[name]
+
+    def stats(self) -> Dict[str, Any]:
+        return _format_stats(self.counters)
+
+    def histogram(self, since_hour: int) -> List[Dict[str, int]]:
+        return [{'hour': hour, **self.hourly[hour]} for hour in sorted(self.hourly) if hour >= since_hour]
+
+
+def _format_stats(counters: Dict[str, int]) -> Dict[str, Any]:
+    return {
+        'total': counters.get('total', 0),
+        'false': counters.get('false', 0),
+        'verified': counters.get('verified', 0),
+        'by_status': {name.split(':', 1)[1]: value for name, value in counters.items()
+                      if name.startswith('status:') and value}
+    }
+
+
+class JournalRecordStore:
+    """
+    Records held in memory, persisted as an append-only JSONL journal
+
+    Each put() appends one line ({"seq", "id", "record"}), so the write cost
+    doesn't depend on how many records exist. Appends are flushed to the OS
+    immediately and fsynced in batches by a background thread (every
+    fsync_interval seconds; 0 = fsync on every write).
+
+    Once the journal holds compact_threshold entries it is rotated and the
+    full state is written as a snapshot in the background. The snapshot
+    header carries the highest seq it covers, so startup replay is the
+    snapshot plus any journal entries newer than it. A torn final line from
+    a crash mid-append is ignored.
+    """
+
+    def __init__(self, path_prefix: str, fsync_interval: float = 0.2, compact_threshold: int = 10000,
+                 legacy_json_path: Optional[str] = None):
+        self.snapshot_path = f"{path_prefix}.snapshot.jsonl"
+        self.journal_path = f"{path_prefix}.journal.jsonl"
+        self.rotated_path = f"{path_prefix}.journal.1.jsonl"  # Journal being folded into a snapshot
+        self.meta_path = f"{path_prefix}.meta.json"  # Small key/value state (e.g. indexer checkpoints)
+        self.fsync_interval = fsync_interval
+        self.compact_threshold = compact_threshold
+
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._counters = RecordCounters()  # Derived state, rebuilt on replay
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._journal_entries = 0
+        self._dirty = False
+        self._compacting = False
+        self._closed = False
+
+        os.makedirs(os.path.dirname(self.journal_path) or '.', exist_ok=True)
+        self._replay()
+        if legacy_json_path and not self._records:
+            self._migrate_legacy(legacy_json_path)
+
+        self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        if self.fsync_interval > 0:
+            threading.Thread(target=self._fsync_loop, name='record-journal-fsync', daemon=True).start()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def put(self, record_id: str, record: Dict[str, Any]):
+        """Insert or replace a record"""
+        with self._lock:
+            self._seq += 1
+            line = json.dumps({'seq': self._seq, 'id': record_id, 'record': record},
+                              separators=(',', ':'), default=str)
+            self._journal.write(line + '\n')
+            self._journal.flush()
+            if self.fsync_interval > 0:
+                self._dirty = True
+            else:
+                os.fsync(self._journal.fileno())
+            previous = self._records.get(record_id)
+            if previous is not None:
+                self._counters.apply(previous, -1)
+            # Keep the journaled form, not the caller's dict: callers go on mutating what they passed in,
+            # and replay after a restart must see exactly the same record
+            record = json.loads(line)['record']
+            self._records[record_id] = record
+            self._counters.apply(record)
+            self._journal_entries += 1
+            compact = self._journal_entries >= self.compact_threshold and not self._compacting
+
+        if compact:
+            self.compact(background=True)
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(record_id)
+        return dict(record) if record is not None else None
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Newest records first"""
+        with self._lock:
+            records = list(self._records.values())
+        return [dict(r) for r in heapq.nlargest(limit, records, key=lambda r: r.get('timestamp', 0))]
+
+    def count(self) -> int:
+        return len(self._records)
+
+    def find_by_claim_hash(self, claim_hash: str) -> Optional[Dict[str, Any]]:
+        """Newest record for a claim hash"""
+        with self._lock:
+            matches = [r for r in self._records.values() if r.get('claim_hash') == claim_hash]
+        latest = max(matches, key=lambda r: r.get('timestamp', 0), default=None)
+        return dict(latest) if latest is not None else None
+
+    def find_by_chain_status(self, *chain_statuses: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """(record_id, record) for records in any of the given chain_status states, oldest first"""
+        with self._lock:
+            matches = [(record_id, dict(record)) for record_id, record in self._records.items()
+                       if record.get('chain_status') in chain_statuses]
+        return sorted(matches, key=lambda item: item[1].get('timestamp', 0))
+
+    def find_by_transaction_hash(self, transaction_hash: str) -> Optional[Dict[str, Any]]:
+        """The record written by a transaction, if any"""
+        with self._lock:
+            match = next((r for r in self._records.values() if r.get('transaction_hash') == transaction_hash), None)
+        return dict(match) if match is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Exact totals from the running counters: {total, false, verified, by_status}"""
+        with self._lock:
+            return self._counters.stats()
+
+    def hourly(self, hours: int = 24) -> List[Dict[str, int]]:
+        """Per-hour {hour, total, false, verified} for the last `hours` hours (hour = unix time // 3600)"""
+        with self._lock:
+            return self._counters.histogram(int(time.time()) // 3600 - hours + 1)
+
+    def items(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            return list(self._records.items())
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._read_meta().get(key)
+
+    def set_meta(self, key: str, value: str):
+        """Durably set a metadata value (atomic file replace)"""
+        with self._lock:
+            meta = self._read_meta()
+            meta[key] = value
+            tmp_path = f"{self.meta_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.meta_path)
+
+    def _read_meta(self) -> Dict[str, str]:
+        if not os.path.exists(self.meta_path):
+            return {}
+        with open(self.meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def compact(self, background: bool = False):
+        """Rotate the journal and write a snapshot of the current state"""
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+            self._rotate()
+            records = dict(self._records)
+            seq = self._seq
+
+        if background:
+            threading.Thread(target=self._write_snapshot, args=(records, seq),
+                             name='record-journal-compact', daemon=True).start()
+        else:
+            self._write_snapshot(records, seq)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._journal.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'backend': 'journal',
+            'records': len(self._records),
+            'journal_entries': self._journal_entries,
+            'seq': self._seq,
+            'compacting': self._compacting
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _rotate(self):
+        """Move the live journal aside and start a fresh one (lock held)"""
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal.close()
+        if os.path.exists(self.rotated_path):
+            # A previous compaction never finished; keep its entries in order
+            with open(self.journal_path, 'r', encoding='utf-8') as src, \
+                    open(self.rotated_path, 'a', encoding='utf-8') as dst:
+                dst.write(src.read())
+            os.remove(self.journal_path)
+        else:
+            os.replace(self.journal_path, self.rotated_path)
+        self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        self._journal_entries = 0
+        self._dirty = False
+
+    def _write_snapshot(self, records: Dict[str, Dict[str, Any]], seq: int):
+        tmp_path = f"{self.snapshot_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'snapshot_seq': seq, 'count': len(records), 'created_at': time.time()}) + '\n')
+                for record_id, record in records.items():
+                    f.write(json.dumps({'id': record_id, 'record': record}, separators=(',', ':'), default=str) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            if os.path.exists(self.rotated_path):
+                os.remove(self.rotated_path)
+            print(f"✅ Record journal compacted: {len(records)} records in snapshot")
+        except (IOError, OSError) as e:
+            print(f"⚠️ Record journal compaction failed (journal kept): {e}")
+        finally:
+            self._compacting = False
+
+    def _replay(self):
+        """Rebuild state: snapshot, then rotated and live journal entries newer than it"""
+        snapshot_seq = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                header = f.readline()
+                if header.strip():
+                    snapshot_seq = json.loads(header).get('snapshot_seq', 0)
+                for line in f:
+                    entry = _parse_line(line)
+                    if entry:
+                        self._records[entry['id']] = entry['record']
+        self._seq = snapshot_seq
+
+        replayed = 0
+        for path in (self.rotated_path, self.journal_path):
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    entry = _parse_line(line)
+                    if not entry or entry.get('seq', 0) <= snapshot_seq:
+                        continue
+                    self._records[entry['id']] = entry['record']
+                    self._seq = max(self._seq, entry['seq'])
+                    replayed += 1
+                    if path == self.journal_path:
+                        self._journal_entries += 1
+
+        for record in self._records.values():
+            self._counters.apply(record)
+
+        if self._records:
+            print(f"✅ Loaded {len(self._records)} local blockchain records ({replayed} from journal)")
+
+    def _migrate_legacy(self, legacy_json_path: str):
+        """One-time import of the old whole-file JSON store"""
+        if not os.path.exists(legacy_json_path):
+            return
+        try:
+            with open(legacy_json_path, 'r') as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"⚠️ Failed to migrate legacy records from {legacy_json_path}: {e}")
+            return
+
+        self._records.update(legacy)
+        for record in legacy.values():
+            self._counters.apply(record)
+        self._write_snapshot(dict(self._records), self._seq)
+        os.replace(legacy_json_path, f"{legacy_json_path}.migrated")
+        print(f"✅ Migrated {len(legacy)} records from {os.path.basename(legacy_json_path)}")
+
+    def _fsync_loop(self):
+        while not self._closed:
+            time.sleep(self.fsync_interval)
+            with self._lock:
+                if self._dirty and not self._closed:
+                    try:
+                        os.fsync(self._journal.fileno())
+                    except OSError as e:
+                        print(f"⚠️ Record journal fsync failed: {e}")
+                    self._dirty = False
+
+
+def _parse_line(line: str) -> Optional[Dict[str, Any]]:
+    """Decode one journal/snapshot line; a torn or corrupt line yields None"""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        entry = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return entry if 'id' in entry and 'record' in entry else None
+
+
+class SQLiteRecordStore:
+    """
+    Records in a SQLite database (WAL mode) with secondary indexes
+
+    Nothing is held in memory beyond SQLite's page cache, so memory stays
+    bounded however long the history gets. Recent-records, lookup and
+    dashboard stats are indexed queries (timestamp, status, claim_hash,
+    score bucket, chain_status, transaction_hash) rather than scans of every record.
+    """
+
+    def __init__(self, path: str, legacy_json_path: Optional[str] = None, journal_prefix: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()  # One shared connection, serialized like TTLCache's
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')  # Durable at checkpoints; safe against corruption
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS records (
+                record_id TEXT PRIMARY KEY,
+                claim_hash TEXT,
+                status TEXT,
+                score REAL,
+                score_bucket INTEGER NOT NULL,
+                timestamp INTEGER NOT NULL,
+                chain_status TEXT,
+                transaction_hash TEXT,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_timestamp ON records (timestamp);
+            CREATE INDEX IF NOT EXISTS idx_records_status ON records (status);
+            CREATE INDEX IF NOT EXISTS idx_records_claim_hash ON records (claim_hash, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_records_score_bucket ON records (score_bucket);
+            CREATE TABLE IF NOT EXISTS record_counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS record_hourly (
+                hour INTEGER PRIMARY KEY,
+                total INTEGER NOT NULL,
+                false_count INTEGER NOT NULL,
+                verified INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS record_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        ''')
+        self._add_json_columns('chain_status', 'transaction_hash')
+        self._db.execute('CREATE INDEX IF NOT EXISTS idx_records_chain_status ON records (chain_status)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS idx_records_transaction_hash ON records (transaction_hash)')
+        self._db.commit()
+
+        if self.count() == 0:
+            self._import_existing(legacy_json_path, journal_prefix)
+        if not self._query("SELECT 1 FROM record_meta WHERE key = 'counters_ready' AND value = ?",
+                           (SQLITE_COUNTERS_VERSION,)):
+            self._rebuild_counters()
+
+    @staticmethod
+    def _row(record_id: str, record: Dict[str, Any]) -> tuple:
+        score = record.get('verification_score')
+        bucket = min(max(int((score or 0) * 10), 0), 10)  # 0.0-0.099 -> 0 ... 1.0 -> 10
+        return (record_id, record.get('claim_hash') or record.get('data_hash'), record.get('status'), score,
+                bucket, int(record.get('timestamp') or 0), record.get('chain_status'),
+                record.get('transaction_hash'), json.dumps(record, separators=(',', ':'), default=str))
+
+    def _add_json_columns(self, *names: str):
+        """Databases created before these indexed columns: add them and fill them from the stored records"""
+        columns = {row[1] for row in self._db.execute('PRAGMA table_info(records)')}
+        for name in names:
+            if name not in columns:
+                self._db.execute(f'ALTER TABLE records ADD COLUMN {name} TEXT')
+                self._db.execute(f"UPDATE records SET {name} = json_extract(data, '$.{name}')")
+
+    def put(self, record_id: str, record: Dict[str, Any]):
+        """Insert or replace a record (its counter updates commit in the same transaction)"""
+        self.put_many([(record_id, record)])
+
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        count = 0
+        with self._lock, self._db:
+            for record_id, record in items:
+                previous = self._db.execute('SELECT data FROM records WHERE record_id = ?', (record_id,)).fetchone()
+                if previous:
+                    self._apply_counters(json.loads(previous[0]), -1)
+                self._db.execute(
+                    'INSERT OR REPLACE INTO records (record_id, claim_hash, status, score, score_bucket, '
+                    'timestamp, chain_status, transaction_hash, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    self._row(record_id, record)
+                )
+                self._apply_counters(record, 1)
+                count += 1
+        return count
+
+    def _apply_counters(self, record: Dict[str, Any], sign: int):
+        """Add (sign=1) or remove (sign=-1) a record's contribution (lock and transaction held)"""
+        counters, hour = _record_deltas(record)
+        self._db.executemany(
+            'INSERT INTO record_counters (name, value) VALUES (?, ?) '
+            'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value',
+            [(name, sign * delta) for name, delta in counters.items()]
+        )
+        self._db.execute(
+            'INSERT INTO record_hourly (hour, total, false_count, verified) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT(hour) DO UPDATE SET total = total + excluded.total, '
+            'false_count = false_count + excluded.false_count, verified = verified + excluded.verified',
+            (hour, sign * counters['total'], sign * counters['false'], sign * counters['verified'])
+        )
+
+    def _rebuild_counters(self):
+        """One pass over existing records (databases created before counters existed, or by an older version)"""
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM record_counters')
+            self._db.execute('DELETE FROM record_hourly')
+            for (data,) in self._db.execute('SELECT data FROM records').fetchall():
+                self._apply_counters(json.loads(data), 1)
+            self._db.execute("INSERT OR REPLACE INTO record_meta (key, value) VALUES ('counters_ready', ?)",
+                             (SQLITE_COUNTERS_VERSION,))
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._query('SELECT data FROM records WHERE record_id = ?', (record_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Newest records first"""
+        rows = self._query('SELECT data FROM records ORDER BY timestamp DESC LIMIT ?', (max(int(limit), 0),))
+        return [json.loads(row[0]) for row in rows]
+
+    def find_by_claim_hash(self, claim_hash: str) -> Optional[Dict[str, Any]]:
+        """Newest record for a claim hash"""
+        rows = self._query(
+            'SELECT data FROM records WHERE claim_hash = ? ORDER BY timestamp DESC LIMIT 1', (claim_hash,)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def find_by_chain_status(self, *chain_statuses: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """(record_id, record) for records in any of the given chain_status states, oldest first"""
+        if not chain_statuses:
+            return []
+        rows = self._query(
+            f"SELECT record_id, data FROM records WHERE chain_status IN ({', '.join('?' * len(chain_statuses))}) "
+            'ORDER BY timestamp', tuple(chain_statuses)
+        )
+        return [(record_id, json.loads(data)) for record_id, data in rows]
+
+    def find_by_transaction_hash(self, transaction_hash: str) -> Optional[Dict[str, Any]]:
+        """The record written by a transaction, if any"""
+        rows = self._query('SELECT data FROM records WHERE transaction_hash = ? LIMIT 1', (transaction_hash,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def count(self) -> int:
+        return self._query('SELECT COUNT(*) FROM records')[0][0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Exact totals from the running counters: {total, false, verified, by_status}"""
+        return _format_stats(dict(self._query('SELECT name, value FROM record_counters')))
+
+    def hourly(self, hours: int = 24) -> List[Dict[str, int]]:
+        """Per-hour {hour, total, false, verified} for the last `hours` hours (hour = unix time // 3600)"""
+        rows = self._query(
+            'SELECT hour, total, false_count, verified FROM record_hourly WHERE hour >= ? ORDER BY hour',
+            (int(time.time()) // 3600 - hours + 1,)
+        )
+        return [{'hour': hour, 'total': total, 'false': false, 'verified': verified}
+                for hour, total, false, verified in rows]
+
+    def items(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        return [(record_id, json.loads(data)) for record_id, data in
+                self._query('SELECT record_id, data FROM records ORDER BY timestamp')]
+
+    def get_meta(self, key: str) -> Optional[str]:
+        rows = self._query('SELECT value FROM record_meta WHERE key = ?', (key,))
+        return rows[0][0] if rows else None
+
+    def set_meta(self, key: str, value: str):
+        with self._lock, self._db:
+            self._db.execute('INSERT OR REPLACE INTO record_meta (key, value) VALUES (?, ?)', (key, value))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'backend': 'sqlite', 'records': self.count(), 'path': self.path}
+
+    def _import_existing(self, legacy_json_path: Optional[str], journal_prefix: Optional[str]):
+        """First start on SQLite: pull in records from the journal store and/or legacy JSON file"""
+        sources = [path for path in (
+            legacy_json_path,
+            f"{journal_prefix}.snapshot.jsonl" if journal_prefix else None,
+            f"{journal_prefix}.journal.jsonl" if journal_prefix else None
+        ) if path and os.path.exists(path)]
+        if not sources:
+            return
+
+        journal = JournalRecordStore(journal_prefix or f"{self.path}.import", fsync_interval=0,
+                                     legacy_json_path=legacy_json_path)
+        try:
+            imported = self.put_many(journal.items())
+        finally:
+            journal.close()
+        print(f"✅ Imported {imported} records into {os.path.basename(self.path)}")
+
+
+def open_record_store(backend: str, data_dir: str, **journal_options):
+    """Open the configured record store under data_dir (imports older stores on first use)"""
+    prefix = os.path.join(data_dir, 'blockchain_records')
+    legacy_json_path = os.path.join(data_dir, 'blockchain_records.json')
+    if backend == 'sqlite':
+        return SQLiteRecordStore(f"{prefix}.sqlite3", legacy_json_path=legacy_json_path, journal_prefix=prefix)
+    if backend == 'journal':
+        return JournalRecordStore(prefix, legacy_json_path=legacy_json_path, **journal_options)
+    raise ValueError(f"Unknown record store backend '{backend}' (expected one of: {', '.join(RECORD_STORE_BACKENDS)})")
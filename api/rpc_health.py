@@ -0,0 +1,170 @@
+"""
+RapidVerify RPC Health
+Background-probed RPC endpoints with per-endpoint circuit breakers and failover
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class RpcEndpoint:
+    """One RPC URL, its probe client and its circuit breaker state"""
+
+    def __init__(self, url: str, client):
+        self.url = url
+        self.client = client  # Web3 instance used only for probes
+        self.failures = 0  # Consecutive failures (probes or reported request errors)
+        self.open_until = 0.0  # Breaker is open (endpoint skipped) until this time
+        self.healthy = False
+        self.block: Optional[int] = None
+        self.latency_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_probe: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if time.time() < self.open_until:
+            return 'open'
+        return 'half_open' if self.failures else 'closed'
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'url': self.url.split('?', 1)[0],  # Keep API keys in query strings out of status output
+            'healthy': self.healthy,
+            'breaker': self.state,
+            'failures': self.failures,
+            'block': self.block,
+            'latency_ms': self.latency_ms,
+            'last_error': self.last_error
+        }
+
+
+class RpcHealthMonitor:
+    """
+    Cached connectivity state for a prioritized list of RPC endpoints
+
+    A daemon thread probes every endpoint (eth_blockNumber) each
+    `probe_interval` seconds, so is_healthy() is a field read instead of a
+    network call. `failure_threshold` consecutive failures - from probes or
+    reported by callers via report_failure(); report_success() and a good
+    probe reset the count - open an endpoint's breaker for `cooldown`
+    seconds: it is skipped, and requests fail fast rather than each waiting
+    out a timeout. When the active endpoint's breaker
+    opens, or a higher-priority endpoint recovers, on_switch(url) is called
+    with the new active URL. Endpoints more than `max_block_lag` blocks
+    behind the best one count as unhealthy.
+    """
+
+    def __init__(self, urls: List[str], make_client: Callable[[str], Any],
+                 on_switch: Callable[[str], None] = None, probe_interval: float = 15,
+                 failure_threshold: int = 3, cooldown: float = 30, max_block_lag: int = 50):
+        if not urls:
+            raise ValueError("At least one RPC URL is required")
+        self.endpoints = [RpcEndpoint(url, make_client(url)) for url in urls]
+        self.on_switch = on_switch
+        self.probe_interval = probe_interval
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_block_lag = max_block_lag
+        self._active = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._switches = 0
+
+    @property
+    def active(self) -> RpcEndpoint:
+        return self.endpoints[self._active]
+
+    def start(self):
+        """Start the probe thread (idempotent)"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name='rpc-health', daemon=True)
+        self._thread.start()
+
+    def is_healthy(self) -> bool:
+        """Cached: the active endpoint answered its last probe and its breaker is not open"""
+        endpoint = self.active
+        return endpoint.healthy and endpoint.state != 'open'
+
+    def report_success(self):
+        """A request on the active endpoint succeeded: its consecutive-failure count starts over"""
+        with self._lock:
+            self.active.failures = 0
+
+    def report_failure(self, error: Exception):
+        """Count a request-path error against the active endpoint (may trip its breaker and fail over)"""
+        with self._lock:
+            self._fail(self.active, error)
+            self._select()
+
+    def probe_all(self):
+        """Probe every endpoint once, then re-pick the active one"""
+        for endpoint in self.endpoints:
+            started = time.time()
+            try:
+                block = endpoint.client.eth.block_number
+            except Exception as e:
+                with self._lock:
+                    endpoint.healthy = False
+                    self._fail(endpoint, e)
+                continue
+            finally:
+                endpoint.last_probe = time.time()
+            with self._lock:
+                endpoint.block = block
+                endpoint.latency_ms = round((time.time() - started) * 1000, 1)
+                endpoint.healthy = True
+                endpoint.failures = 0
+                endpoint.open_until = 0.0
+                endpoint.last_error = None
+
+        with self._lock:
+            best = max((e.block for e in self.endpoints if e.healthy and e.block is not None), default=None)
+            for endpoint in self.endpoints:
+                if endpoint.healthy and best is not None and best - endpoint.block > self.max_block_lag:
+                    endpoint.healthy = False
+                    endpoint.last_error = f"{best - endpoint.block} blocks behind"
+            self._select()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'active': self.active.url.split('?', 1)[0],
+                'healthy': self.is_healthy(),
+                'switches': self._switches,
+                'endpoints': [endpoint.describe() for endpoint in self.endpoints]
+            }
+
+    # ------------------------------------------------------------------
+    # Internals (lock held)
+    # ------------------------------------------------------------------
+
+    def _fail(self, endpoint: RpcEndpoint, error: Exception):
+        """Count one failure; a single request error only marks the endpoint unhealthy once the breaker opens"""
+        endpoint.failures += 1
+        endpoint.last_error = str(error) or type(error).__name__
+        if endpoint.failures >= self.failure_threshold and endpoint.state != 'open':
+            endpoint.healthy = False  # Stays down after the cooldown until a probe succeeds
+            endpoint.open_until = time.time() + self.cooldown
+            print(f"⚠️ RPC circuit open for {self.cooldown:.0f}s: {endpoint.describe()['url']} ({endpoint.last_error})")
+
+    def _select(self):
+        """Make the highest-priority usable endpoint active"""
+        for index, endpoint in enumerate(self.endpoints):
+            if endpoint.healthy and endpoint.state != 'open':
+                if index != self._active:
+                    self._active = index
+                    self._switches += 1
+                    print(f"🔀 RPC failover → {endpoint.describe()['url']}")
+                    if self.on_switch:
+                        self.on_switch(endpoint.url)
+                return
+
+    def _loop(self):
+        while True:
+            try:
+                self.probe_all()
+            except Exception as e:
+                print(f"⚠️ RPC health probe failed: {e}")
+            time.sleep(self.probe_interval)
@@ -0,0 +1,324 @@
+"""
+RapidVerify Search Providers
+One web-search interface (HTML scraping, Custom Search JSON API, offline fixtures)
+behind a TTL cache with per-provider timeouts and fallback ordering
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote_plus, urlparse
+
+from bs4 import BeautifulSoup
+
+from cache import TTLCache, MISSING, DATA_DIR
+from http_client import http_client
+
+GOOGLE_SEARCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+}
+CUSTOM_SEARCH_API_URL = 'https://www.googleapis.com/customsearch/v1'
+DEFAULT_FIXTURE_PATH = os.path.join(os.path.dirname(__file__), 'datasets', 'search_fixtures.json')
+
+# A request a provider wants sent: (url, headers); transports return (status, body text)
+SearchRequest = Tuple[str, Dict[str, str]]
+AsyncFetch = Callable[[str, Dict[str, str], float], Awaitable[Tuple[int, str]]]
+
+
+def normalize_query(query: str) -> str:
+    """Cache/fixture key form of a query (same normalization as the Fact Check cache)"""
+    return ' '.join(query[:200].casefold().split()).strip(' .,!?;:\'"')
+
+
+class SearchProviderError(Exception):
+    """A provider could not answer (HTTP error, blocked, malformed response)"""
+
+
+class SearchProvider:
+    """
+    Base class: build_request() describes the HTTP call and parse() turns the
+    response body into [{title, url, snippet, rank}], so the same provider
+    runs over the pooled sync client or the async verifier's aiohttp session.
+    Providers that need no network override search() instead.
+    """
+
+    name = 'base'
+    default_timeout = 10.0
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = float(os.getenv(f"SEARCH_{self.name.upper()}_TIMEOUT", self.default_timeout)) \
+            if timeout is None else timeout
+
+    def available(self) -> bool:
+        return True
+
+    def redact(self, text: str) -> str:
+        """text with this provider's credentials masked (for logs and stats)"""
+        return text
+
+    def build_request(self, query: str, num_results: int) -> SearchRequest:
+        raise NotImplementedError
+
+    def parse(self, body: str, num_results: int) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def search(self, query: str, num_results: int) -> List[Dict[str, Any]]:
+        url, headers = self.build_request(query, num_results)
+        response = http_client.get(url, headers=headers, timeout=self.timeout)
+        return self._parse_response(response.status_code, response.text, num_results)
+
+    async def search_async(self, query: str, num_results: int, fetch: AsyncFetch) -> List[Dict[str, Any]]:
+        url, headers = self.build_request(query, num_results)
+        status, body = await fetch(url, headers, self.timeout)
+        # HTML parsing is CPU-bound: keep it off the event loop
+        return await asyncio.get_running_loop().run_in_executor(None, self._parse_response, status, body, num_results)
+
+    def _parse_response(self, status: int, body: str, num_results: int) -> List[Dict[str, Any]]:
+        if status != 200:
+            raise SearchProviderError(f"{self.name}: HTTP {status}")
+        return self.parse(body, num_results)
+
+
+class GoogleHTMLSearchProvider(SearchProvider):
+    """Scrapes google.com result pages (no key needed; rate-limited hard by the host scheduler)"""
+
+    name = 'google_html'
+
+    def build_request(self, query: str, num_results: int) -> SearchRequest:
+        return f"https://www.google.com/search?q={quote_plus(query[:200])}&num={num_results}", GOOGLE_SEARCH_HEADERS
+
+    def parse(self, body: str, num_results: int) -> List[Dict[str, Any]]:
+        """Organic results (div.g), falling back to any outbound result link"""
+        results = []
+        soup = BeautifulSoup(body, 'html.parser')
+
+        for g in soup.select('div.g'):
+            link = g.select_one('a[href]')
+            url = self._result_url(link.get('href', '')) if link else ''
+            if not url:
+                continue
+
+            title_el = g.select_one('h3')
+            snippet_el = g.select_one('div.VwiC3b') or g.select_one('div.IsZvec') or g.select_one('div.s') \
+                or g.select_one('span.aCOpRe') or g.select_one('span.st')
+            results.append({
+                'title': title_el.get_text(strip=True) if title_el else url,
+                'url': url,
+                'snippet': snippet_el.get_text(strip=True) if snippet_el else '',
+                'rank': len(results) + 1
+            })
+            if len(results) >= num_results:
+                return results
+
+        # Layouts without div.g (e.g. the no-JS page): take /url?q= redirect and direct links with a real title
+        if not results:
+            for link in soup.find_all('a', href=True):
+                url = self._result_url(link['href'])
+                title = link.get_text(strip=True)
+                if url and len(title) > 10 and 'google.' not in urlparse(url).netloc:
+                    results.append({'title': title, 'url': url, 'snippet': '', 'rank': len(results) + 1})
+                    if len(results) >= num_results:
+                        break
+
+        return results
+
+    @staticmethod
+    def _result_url(href: str) -> str:
+        """Target of a result link, unwrapping Google's /url?q= redirects"""
+        if href.startswith('/url?'):
+            href = parse_qs(urlparse(href).query).get('q', [''])[0]
+        return href if href.startswith('http') else ''
+
+
+class CustomSearchAPIProvider(SearchProvider):
+    """Google Programmable Search (Custom Search JSON API); needs an API key and engine id"""
+
+    name = 'json_api'
+    default_timeout = 5.0
+
+    def __init__(self, timeout: Optional[float] = None):
+        super().__init__(timeout)
+        self.api_key = os.getenv('GOOGLE_CSE_API_KEY') or os.getenv('GOOGLE_API_KEY')
+        self.engine_id = os.getenv('GOOGLE_CSE_ID')
+
+    def available(self) -> bool:
+        return bool(self.api_key and self.engine_id)
+
+    def redact(self, text: str) -> str:
+        """The key travels in the query string, so transport errors quoting the URL contain it"""
+        if self.api_key:
+            text = text.replace(self.api_key, '***').replace(quote_plus(self.api_key), '***')
+        return text
+
+    def build_request(self, query: str, num_results: int) -> SearchRequest:
+        params = f"key={self.api_key}&cx={self.engine_id}&q={quote_plus(query[:200])}&num={min(num_results, 10)}"
+        return f"{CUSTOM_SEARCH_API_URL}?{params}", {'Accept': 'application/json'}
+
+    def parse(self, body: str, num_results: int) -> List[Dict[str, Any]]:
+        try:
+            items = json.loads(body).get('items') or []
+        except (ValueError, AttributeError) as e:
+            raise SearchProviderError(f"{self.name}: malformed response ({e})")
+        return [
+            {'title': item.get('title', ''), 'url': item['link'], 'snippet': item.get('snippet', ''), 'rank': rank}
+            for rank, item in enumerate((i for i in items if i.get('link')), start=1)
+        ][:num_results]
+
+
+class FixtureSearchProvider(SearchProvider):
+    """
+    Offline results from a JSON file ({"queries": {normalized query: [results]},
+    "default": [results]}): deterministic, for benchmarks and tests
+    """
+
+    name = 'fixture'
+
+    def __init__(self, path: Optional[str] = None, timeout: Optional[float] = None):
+        super().__init__(timeout)
+        self.path = path or os.getenv('SEARCH_FIXTURE_PATH') or DEFAULT_FIXTURE_PATH
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Search fixtures unavailable ({e})")
+            document = {}
+        self.queries = {normalize_query(q): results for q, results in (document.get('queries') or {}).items()}
+        self.default = document.get('default') or []
+
+    def search(self, query: str, num_results: int) -> List[Dict[str, Any]]:
+        results = self.queries.get(normalize_query(query), self.default)
+        return [{**result, 'rank': rank} for rank, result in enumerate(results[:num_results], start=1)]
+
+    async def search_async(self, query: str, num_results: int, fetch: AsyncFetch) -> List[Dict[str, Any]]:
+        return self.search(query, num_results)
+
+
+PROVIDERS = {
+    provider.name: provider
+    for provider in (GoogleHTMLSearchProvider, CustomSearchAPIProvider, FixtureSearchProvider)
+}
+
+
+class SearchService:
+    """
+    Cached, fallback-ordered web search
+
+    Providers are tried in order, skipping unconfigured ones; a provider
+    that errors or returns nothing hands over to the next (an empty scrape
+    usually means Google served a CAPTCHA). Results are cached by
+    normalized query for the cache's TTL, empty answers for `negative_ttl`;
+    nothing is cached when every provider failed.
+    """
+
+    def __init__(self, providers: List[SearchProvider], cache: TTLCache, negative_ttl: float = 600):
+        self.providers = providers
+        self.cache = cache
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._stats = {p.name: {'calls': 0, 'results': 0, 'empty': 0, 'errors': 0, 'time_ms': 0.0}
+                       for p in providers}
+
+    def search(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
+        cache_key, cached = self._cached(query, num_results)
+        if cached is not MISSING:
+            return cached
+        results, answered = [], False
+        for provider in self._usable():
+            started = time.time()
+            try:
+                results = provider.search(query, num_results)
+            except Exception as e:
+                self._record(provider, started, error=e)
+                continue
+            answered = True
+            self._record(provider, started, results=results)
+            if results:
+                break
+        return self._store(cache_key, results) if answered else results
+
+    async def search_async(self, query: str, num_results: int, fetch: AsyncFetch) -> List[Dict[str, Any]]:
+        """search() with network providers going through fetch(url, headers, timeout) -> (status, text)"""
+        # The cache may be SQLite-backed (SEARCH_CACHE_PERSIST): keep its reads and writes off the event loop
+        loop = asyncio.get_running_loop()
+        cache_key, cached = await loop.run_in_executor(None, self._cached, query, num_results)
+        if cached is not MISSING:
+            return cached
+        results, answered = [], False
+        for provider in self._usable():
+            started = time.time()
+            try:
+                results = await provider.search_async(query, num_results, fetch)
+            except Exception as e:
+                self._record(provider, started, error=e)
+                continue
+            answered = True
+            self._record(provider, started, results=results)
+            if results:
+                break
+        return await loop.run_in_executor(None, self._store, cache_key, results) if answered else results
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            providers = {name: dict(stats) for name, stats in self._stats.items()}
+        for stats in providers.values():
+            stats['avg_ms'] = round(stats.pop('time_ms') / stats['calls'], 1) if stats['calls'] else 0.0
+        return {
+            'order': [p.name for p in self.providers],
+            'available': [p.name for p in self._usable()],
+            'providers': providers,
+            'cache': self.cache.get_stats()
+        }
+
+    def _usable(self) -> List[SearchProvider]:
+        return [p for p in self.providers if p.available()]
+
+    def _cached(self, query: str, num_results: int) -> tuple:
+        cache_key = f"{normalize_query(query)}|{num_results}"
+        return cache_key, self.cache.get(cache_key)
+
+    def _store(self, cache_key: str, results: list) -> list:
+        if results:
+            self.cache.set(cache_key, results)
+        else:
+            self.cache.set(cache_key, results, ttl=self.negative_ttl)
+        return results
+
+    def _record(self, provider: SearchProvider, started: float, results: list = None, error: Exception = None):
+        if error is not None:
+            print(f"⚠️ Search provider {provider.name} failed: {provider.redact(str(error))}")
+        with self._lock:
+            stats = self._stats[provider.name]
+            stats['calls'] += 1
+            stats['time_ms'] += (time.time() - started) * 1000
+            if error is not None:
+                stats['errors'] += 1
+            elif results:
+                stats['results'] += 1
+            else:
+                stats['empty'] += 1
+
+
+def _load_search_service() -> SearchService:
+    providers = []
+    for name in os.getenv('SEARCH_PROVIDERS', 'json_api,google_html').split(','):
+        provider_class = PROVIDERS.get(name.strip())
+        if provider_class is None:
+            if name.strip():
+                print(f"⚠️ Unknown search provider: {name.strip()!r}")
+            continue
+        providers.append(provider_class())
+    cache = TTLCache(
+        'search',
+        max_entries=int(os.getenv('SEARCH_CACHE_SIZE', '2048')),
+        default_ttl=float(os.getenv('SEARCH_CACHE_TTL', '3600')),
+        persist_path=os.path.join(DATA_DIR, 'search_cache.sqlite3')
+        if os.getenv('SEARCH_CACHE_PERSIST', 'false').lower() == 'true' else None
+    )
+    return SearchService(providers, cache, negative_ttl=float(os.getenv('SEARCH_CACHE_NEGATIVE_TTL', '600')))
+
+
+# Global instance, shared by NewsVerifier and AsyncNewsVerifier
+search_service = _load_search_service()
@@ -0,0 +1,141 @@
+"""
+RapidVerify Structured Data
+Pulls article fields from JSON-LD and meta tags with a regex scan - no DOM is built
+"""
+import html as html_lib
+import json
+import re
+from typing import Any, Dict, List
+
+# schema.org types that carry headline/articleBody/author/datePublished
+ARTICLE_TYPES = frozenset([
+    'Article', 'NewsArticle', 'ReportageNewsArticle', 'AnalysisNewsArticle',
+    'OpinionNewsArticle', 'BackgroundNewsArticle', 'ReviewNewsArticle',
+    'BlogPosting', 'LiveBlogPosting', 'Report', 'WebPage'
+])
+
+# Meta tags (property= or name=) used when JSON-LD lacks a field
+META_FIELDS = {
+    'og:title': 'title',
+    'twitter:title': 'title',
+    'author': 'author',
+    'article:published_time': 'date',
+    'og:image': 'images',
+    'twitter:image': 'images',
+}
+
+_JSON_LD_RE = re.compile(
+    r'<script[^>]+type\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+_META_RE = re.compile(r'<meta\s[^>]*>', re.IGNORECASE)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))')
+_HEAD_END_RE = re.compile(r'</head\s*>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def extract_structured_data(page: str) -> Dict[str, Any]:
+    """
+    Article fields declared by the page itself, as {title, content, author,
+    date, images}; a field is absent when the page does not declare it.
+    JSON-LD wins over meta tags. content is plain text (tags stripped,
+    entities decoded) but not otherwise cleaned.
+    """
+    fields: Dict[str, Any] = {}
+    # A page-level WebPage item only fills what the article item(s) lack
+    for item in sorted(_json_ld_items(page), key=lambda item: item.get('@type') == 'WebPage'):
+        _merge(fields, _article_fields(item))
+    _merge(fields, _meta_fields(page))
+    return fields
+
+
+def _merge(fields: Dict[str, Any], found: Dict[str, Any]):
+    for key, value in found.items():
+        if value and not fields.get(key):
+            fields[key] = value
+
+
+def _json_ld_items(page: str) -> List[dict]:
+    """Every JSON-LD object on the page, flattening top-level lists and @graph"""
+    items = []
+    for match in _JSON_LD_RE.finditer(page):
+        raw = match.group(1).strip()
+        if raw.startswith('<!--'):
+            raw = raw[4:].rsplit('-->', 1)[0]
+        raw = raw.replace('<![CDATA[', '').replace(']]>', '')
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            try:
+                data = json.loads(raw, strict=False)  # Raw newlines inside articleBody strings
+            except ValueError:
+                continue
+        stack = data if isinstance(data, list) else [data]
+        while stack:
+            item = stack.pop(0)
+            if not isinstance(item, dict):
+                continue
+            items.append(item)
+            graph = item.get('@graph')
+            if isinstance(graph, list):
+                stack.extend(graph)
+    return items
+
+
+def _article_fields(item: dict) -> Dict[str, Any]:
+    types = item.get('@type')
+    types = types if isinstance(types, list) else [types]
+    if not any(t in ARTICLE_TYPES for t in types if isinstance(t, str)):
+        return {}
+
+    fields = {
+        'title': _text(item.get('headline') or item.get('name')),
+        'content': _text(item.get('articleBody')),
+        'author': ', '.join(_names(item.get('author'))),
+        'date': _text(item.get('datePublished')),
+        'images': _urls(item.get('image')),
+    }
+    return {key: value for key, value in fields.items() if value}
+
+
+def _text(value) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    if not isinstance(value, str):
+        return ''
+    return html_lib.unescape(_TAG_RE.sub(' ', value)).strip()
+
+
+def _names(value) -> List[str]:
+    if isinstance(value, list):
+        return [name for entry in value for name in _names(entry)]
+    if isinstance(value, dict):
+        value = value.get('name')
+    name = _text(value)
+    return [name] if name else []
+
+
+def _urls(value) -> List[str]:
+    if isinstance(value, list):
+        return [url for entry in value for url in _urls(entry)]
+    if isinstance(value, dict):
+        value = value.get('url') or value.get('contentUrl')
+    return [value.strip()] if isinstance(value, str) and value.strip() else []
+
+
+def _meta_fields(page: str) -> Dict[str, Any]:
+    """og:/article:/author meta tags from <head> only"""
+    head_end = _HEAD_END_RE.search(page)
+    head = page[:head_end.start()] if head_end else page
+    fields: Dict[str, Any] = {}
+    for tag in _META_RE.finditer(head):
+        attrs = {}
+        for name, double, single, bare in _ATTR_RE.findall(tag.group(0)):
+            attrs[name.lower()] = double or single or bare
+        key = (attrs.get('property') or attrs.get('name') or '').lower()
+        field = META_FIELDS.get(key)
+        content = html_lib.unescape(attrs.get('content', '')).strip()
+        if not field or not content or fields.get(field):
+            continue
+        fields[field] = [content] if field == 'images' else content
+    return fields
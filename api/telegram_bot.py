@@ -26,8 +26,8 @@ def get_verifier():
     global verifier
     if verifier is None:
         try:
-            from news_scraper import NewsVerifier
-            verifier = NewsVerifier()
+            from async_verifier import AsyncNewsVerifier
+            verifier = AsyncNewsVerifier()
             print("✅ Telegram Bot: Verifier loaded")
         except ImportError:
             print("❌ Telegram Bot: Failed to load verifier")
@@ -77,13 +77,13 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             # Simple URL extraction
             url = next((word for word in user_text.split() if word.startswith('http')), None)
             if url:
-                result = v.verify_url(url)
+                result = await v.verify_url_async(url)
                 response = format_response(result, 'url')
             else:
-                result = v.verify_text(user_text)
+                result = await v.verify_text_async(user_text)
                 response = format_response(result, 'text')
         else:
-            result = v.verify_text(user_text)
+            result = await v.verify_text_async(user_text)
             response = format_response(result, 'text')
             
         await status_msg.edit_text(response, parse_mode='Markdown')
@@ -124,6 +124,11 @@ def format_response(result: dict, type: str) -> str:
             
     return response
 
+async def close_verifier(application):
+    """Release the verifier's HTTP session when the bot stops"""
+    if verifier is not None:
+        await verifier.close()
+
 def run_telegram_bot():
     """Entry point to run the bot"""
     token = os.getenv('TELEGRAM_BOT_TOKEN')
@@ -135,8 +140,15 @@ def run_telegram_bot():
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     
-    # Create App
-    application = ApplicationBuilder().token(token).build()
+    # Create App - updates are handled concurrently so one slow verification
+    # doesn't hold up other chats
+    application = (
+        ApplicationBuilder()
+        .token(token)
+        .concurrent_updates(int(os.getenv('TELEGRAM_CONCURRENT_UPDATES', '256')))
+        .post_shutdown(close_verifier)
+        .build()
+    )
     
     # Add handlers
     application.add_handler(CommandHandler("start", start))
@@ -0,0 +1,91 @@
+"""
+RapidVerify Transaction Helpers
+Local nonce allocation and cached fee estimates for the service wallet
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class NonceManager:
+    """
+    Hands out consecutive nonces for one sending address
+
+    The pending nonce is fetched from the node once; after that allocate()
+    is a locked increment, so concurrent senders never reuse a nonce and no
+    RPC round trip precedes each transaction. Call resync() after a send
+    fails (nonce too low, replaced, dropped) to refetch on the next
+    allocation.
+    """
+
+    def __init__(self, w3, address: str):
+        self.w3 = w3
+        self.address = address
+        self._next: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats = {'allocated': 0, 'syncs': 0}
+
+    def allocate(self) -> int:
+        with self._lock:
+            if self._next is None:
+                self._next = self.w3.eth.get_transaction_count(self.address, 'pending')
+                self._stats['syncs'] += 1
+            nonce = self._next
+            self._next += 1
+            self._stats['allocated'] += 1
+            return nonce
+
+    def resync(self):
+        with self._lock:
+            self._next = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'next_nonce': self._next, **self._stats}
+
+
+class GasPriceOracle:
+    """
+    Fee parameters for new transactions, cached for `ttl` seconds
+
+    On EIP-1559 chains (latest block has a base fee) returns
+    maxFeePerGas / maxPriorityFeePerGas, with headroom for the base fee to
+    rise for a few blocks; otherwise a legacy gasPrice.
+    """
+
+    def __init__(self, w3, ttl: float = 10, base_fee_multiplier: float = 2.0,
+                 min_priority_fee_gwei: float = 0, max_fee_gwei: Optional[float] = None):
+        self.w3 = w3
+        self.ttl = ttl
+        self.base_fee_multiplier = base_fee_multiplier
+        self.min_priority_fee = int(min_priority_fee_gwei * 10**9)  # Polygon enforces a minimum tip
+        self.max_fee = int(max_fee_gwei * 10**9) if max_fee_gwei else None  # Spending cap, None = no cap
+        self._fees: Optional[Dict[str, int]] = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    def fees(self) -> Dict[str, int]:
+        """Transaction fee fields ({maxFeePerGas, maxPriorityFeePerGas} or {gasPrice})"""
+        with self._lock:
+            if self._fees is None or time.time() - self._fetched_at >= self.ttl:
+                self._fees = self._fetch()
+                self._fetched_at = time.time()
+            return dict(self._fees)
+
+    def invalidate(self):
+        """Refetch on next use (e.g. after an 'underpriced' rejection)"""
+        with self._lock:
+            self._fees = None
+
+    def _fetch(self) -> Dict[str, int]:
+        base_fee = self.w3.eth.get_block('latest').get('baseFeePerGas')
+        if base_fee is None:
+            gas_price = self.w3.eth.gas_price
+            return {'gasPrice': min(gas_price, self.max_fee) if self.max_fee else gas_price}
+
+        priority_fee = max(self.w3.eth.max_priority_fee, self.min_priority_fee)
+        max_fee = int(base_fee * self.base_fee_multiplier) + priority_fee
+        if self.max_fee:
+            max_fee = min(max_fee, self.max_fee)
+            priority_fee = min(priority_fee, max_fee)
+        return {'maxFeePerGas': max_fee, 'maxPriorityFeePerGas': priority_fee}
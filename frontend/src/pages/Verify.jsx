@@ -1,4 +1,80 @@
-import { useState } from 'react'
+import { useEffect, useRef, useState } from 'react'
+
+const STAGE_LABELS = {
+  started: 'Starting analysis',
+  patterns: 'Checked message patterns',
+  article: 'Fetched article',
+  source_credibility: 'Checked source credibility',
+  key_claims: 'Extracted key claims',
+  fact_checks: 'Searching fact-checkers',
+  cross_references: 'Cross-referenced news sources',
+  ai_analysis: 'AI analysis complete',
+  verification: 'Score calculated',
+  blockchain: 'Recorded verification'
+}
+
+// POST to a streaming endpoint and call onEvent(event, data) for each Server-Sent Event
+async function streamVerification(endpoint, body, onEvent, signal) {
+  const response = await fetch(endpoint, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify(body),
+    signal
+  })
+
+  if (!response.ok || !response.body) {
+    const errorData = await response.json().catch(() => ({ error: `Server error: ${response.status}` }))
+    throw new Error(errorData.error || `HTTP ${response.status}`)
+  }
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+
+  for (;;) {
+    const { value, done } = await reader.read()
+    if (done) break
+    buffer += decoder.decode(value, { stream: true })
+
+    let boundary
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const chunk = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+
+      let event = 'message'
+      const dataLines = []
+      for (const line of chunk.split('\n')) {
+        if (line.startsWith('event:')) event = line.slice(6).trim()
+        else if (line.startsWith('data:')) dataLines.push(line.slice(5).trim())
+      }
+      if (dataLines.length) onEvent(event, JSON.parse(dataLines.join('\n')))
+    }
+  }
+}
+
+// Fold one streamed stage into the partial result shown while verification runs
+function applyStage(partial, event, data) {
+  switch (event) {
+    case 'patterns':
+      return { ...partial, warnings: data.warnings }
+    case 'article':
+      return { ...partial, article: data }
+    case 'source_credibility':
+      return { ...partial, source_credibility: data }
+    case 'key_claims':
+      return { ...partial, key_claims: data }
+    case 'fact_checks':
+      return { ...partial, fact_checks: [...(partial.fact_checks || []), ...data] }
+    case 'cross_references':
+      return { ...partial, cross_references: data }
+    case 'verification':
+      return { ...partial, ...data }
+    case 'blockchain':
+      return { ...partial, blockchain: data }
+    default:
+      return partial
+  }
+}
 
 export default function Verify() {
   const [activeTab, setActiveTab] = useState('url')
@@ -7,6 +83,10 @@ export default function Verify() {
   const [imageInput, setImageInput] = useState('')
   const [loading, setLoading] = useState(false)
   const [result, setResult] = useState(null)
+  const abortRef = useRef(null)
+
+  // Closing the page cancels an in-flight streaming verification on the server
+  useEffect(() => () => abortRef.current?.abort(), [])
 
   const validateInput = (type) => {
     if (type === 'url') {
@@ -52,8 +132,40 @@ export default function Verify() {
 
     setLoading(true)
     setResult(null)
+    abortRef.current?.abort()
 
     try {
+      // Text and URL checks stream each stage as it completes
+      if (type === 'text' || type === 'url') {
+        const controller = new AbortController()
+        abortRef.current = controller
+        const endpoint = type === 'url' ? '/api/verify/url/stream' : '/api/verify/stream'
+        const body = type === 'url' ? { url: urlInput.trim() } : { claim: textInput.trim() }
+
+        let partial = { type, partial: true, stage: STAGE_LABELS.started }
+        let final = null
+        await streamVerification(endpoint, body, (event, data) => {
+          if (event === 'result') {
+            final = { ...data, type }
+          } else if (event === 'error') {
+            throw new Error(data.error || 'Verification failed')
+          } else {
+            partial = { ...applyStage(partial, event, data), stage: STAGE_LABELS[event] || partial.stage }
+            setResult(partial)
+          }
+        }, controller.signal)
+
+        if (!final) throw new Error('Verification stream ended unexpectedly')
+        setResult(final)
+        setTimeout(() => {
+          const resultElement = document.querySelector('.result-container')
+          if (resultElement) {
+            resultElement.scrollIntoView({ behavior: 'smooth', block: 'start' })
+          }
+        }, 100)
+        return
+      }
+
       let endpoint = '/api/verify'
       let body = {}
 
@@ -94,6 +206,7 @@ export default function Verify() {
         }
       }, 100)
     } catch (error) {
+      if (error.name === 'AbortError') return
       setResult({ error: error.message || 'Failed to verify. Please try again.' })
     } finally {
       setLoading(false)
@@ -256,22 +369,32 @@ Example:
                 {/* Header */}
                 <div className="result-header">
                   <div className="result-status">
-                    <div className={`status-icon ${result.status || 'investigating'}`}>
-                      <i className={`fas ${result.status === 'verified' ? 'fa-check-circle' : result.status === 'debunked' ? 'fa-times-circle' : 'fa-question-circle'}`}></i>
+                    <div className={`status-icon ${(!result.partial && result.status) || 'investigating'}`}>
+                      <i className={`fas ${result.partial ? 'fa-question-circle' : result.status === 'verified' ? 'fa-check-circle' : result.status === 'debunked' ? 'fa-times-circle' : 'fa-question-circle'}`}></i>
                     </div>
                     <div className="status-text">
-                      <h4>{getStatusText(result.score || 0.5)}</h4>
-                      <span>{result.confidence || 'medium'} confidence</span>
+                      {/* No verdict until the final event: a placeholder score would read as a real one */}
+                      <h4>{result.partial ? 'Verification in progress' : getStatusText(result.score || 0.5)}</h4>
+                      {!result.partial && <span>{result.confidence || 'medium'} confidence</span>}
                     </div>
                   </div>
-                  <div className="score-display">
-                    <span className={`score-value ${getScoreClass(result.score || 0.5)}`}>
-                      {Math.round((result.score || 0.5) * 100)}%
-                    </span>
-                    <span className="score-label">Authenticity</span>
-                  </div>
+                  {!result.partial && (
+                    <div className="score-display">
+                      <span className={`score-value ${getScoreClass(result.score || 0.5)}`}>
+                        {Math.round((result.score || 0.5) * 100)}%
+                      </span>
+                      <span className="score-label">Authenticity</span>
+                    </div>
+                  )}
                 </div>
 
+                {/* Streaming progress */}
+                {result.partial && (
+                  <div style={{ display: 'flex', alignItems: 'center', gap: 'var(--space-sm)', fontSize: '0.85rem', color: 'var(--text-muted)', marginBottom: 'var(--space-lg)' }}>
+                    <i className="fas fa-circle-notch fa-spin" style={{ color: 'var(--primary)' }}></i> {result.stage}...
+                  </div>
+                )}
+
                 {/* Article Preview */}
                 {result.article?.title && (
                   <div style={{
@@ -468,167 +591,172 @@ Example:
                   </div>
                 </div>
 
-                {/* Recommendation */}
-                <div style={{
-                  marginTop: 'var(--space-xl)',
-                  padding: 'var(--space-lg)',
-                  background: `rgba(${(result.score || 0.5) < 0.4 ? '255, 107, 107' : (result.score || 0.5) < 0.7 ? '255, 217, 61' : '107, 203, 119'}, 0.1)`,
-                  borderRadius: 'var(--radius-md)',
-                  textAlign: 'center'
-                }}>
-                  <span style={{ fontSize: '1.5rem', display: 'block', marginBottom: 'var(--space-sm)' }}>
-                    {(result.score || 0.5) < 0.4 ? '🚫' : (result.score || 0.5) < 0.7 ? '⚠️' : '✅'}
-                  </span>
-                  <span style={{
-                    color: (result.score || 0.5) < 0.4 ? 'var(--danger)' : (result.score || 0.5) < 0.7 ? 'var(--warning)' : 'var(--success)',
-                    fontWeight: 600,
-                    fontSize: '1.1rem'
+                {/* Verdict-dependent sections wait for the final result */}
+                {!result.partial && (
+                  <>
+                  {/* Recommendation */}
+                  <div style={{
+                    marginTop: 'var(--space-xl)',
+                    padding: 'var(--space-lg)',
+                    background: `rgba(${(result.score || 0.5) < 0.4 ? '255, 107, 107' : (result.score || 0.5) < 0.7 ? '255, 217, 61' : '107, 203, 119'}, 0.1)`,
+                    borderRadius: 'var(--radius-md)',
+                    textAlign: 'center'
                   }}>
-                    {(result.score || 0.5) < 0.4 ? 'DO NOT SHARE - Likely Misinformation!' :
-                      (result.score || 0.5) < 0.7 ? 'VERIFY before sharing' : 'Appears Credible'}
-                  </span>
-                </div>
-
-                {/* Blockchain Proof Section - Always Visible */}
-                <div style={{
-                  marginTop: 'var(--space-xl)',
-                  padding: 'var(--space-lg)',
-                  background: 'linear-gradient(135deg, rgba(138, 43, 226, 0.15), rgba(75, 0, 130, 0.08))',
-                  border: '1px solid rgba(138, 43, 226, 0.3)',
-                  borderRadius: 'var(--radius-lg)'
-                }}>
-                  <div style={{ display: 'flex', alignItems: 'center', gap: 'var(--space-sm)', marginBottom: 'var(--space-lg)' }}>
-                    <span style={{ fontSize: '1.5rem' }}>⛓️</span>
-                    <h3 style={{ margin: 0, fontSize: '1.1rem', color: '#9B59B6' }}>Blockchain Proof</h3>
-                    {result.blockchain ? (
-                      <>
-                        <div style={{
-                          display: 'flex', justifyContent: 'space-between', alignItems: 'center',
-                          padding: 'var(--space-sm) var(--space-md)',
-                          background: 'rgba(0, 0, 0, 0.2)',
-                          borderRadius: 'var(--radius-sm)'
-                        }}>
-                          <span style={{ color: 'var(--text-muted)', fontSize: '0.85rem' }}>Record ID</span>
-                          <span style={{ fontFamily: 'var(--font-mono)', fontSize: '0.75rem', color: 'var(--primary)' }}>
-                            {result.blockchain.record_id?.slice(0, 12)}...{result.blockchain.record_id?.slice(-8)}
-                          </span>
-                        </div>
-
-                        <div style={{
-                          display: 'flex', justifyContent: 'space-between', alignItems: 'center',
-                          padding: 'var(--space-sm) var(--space-md)',
-                          background: 'rgba(0, 0, 0, 0.2)',
-                          borderRadius: 'var(--radius-sm)'
-                        }}>
-                          <span style={{ color: 'var(--text-muted)', fontSize: '0.85rem' }}>Network</span>
-                          <span style={{ display: 'flex', alignItems: 'center', gap: '6px', fontSize: '0.85rem' }}>
-                            <span style={{ width: '8px', height: '8px', borderRadius: '50%', background: '#8247e5' }}></span>
-                            {result.blockchain.network}
-                          </span>
-                        </div>
+                    <span style={{ fontSize: '1.5rem', display: 'block', marginBottom: 'var(--space-sm)' }}>
+                      {(result.score || 0.5) < 0.4 ? '🚫' : (result.score || 0.5) < 0.7 ? '⚠️' : '✅'}
+                    </span>
+                    <span style={{
+                      color: (result.score || 0.5) < 0.4 ? 'var(--danger)' : (result.score || 0.5) < 0.7 ? 'var(--warning)' : 'var(--success)',
+                      fontWeight: 600,
+                      fontSize: '1.1rem'
+                    }}>
+                      {(result.score || 0.5) < 0.4 ? 'DO NOT SHARE - Likely Misinformation!' :
+                        (result.score || 0.5) < 0.7 ? 'VERIFY before sharing' : 'Appears Credible'}
+                    </span>
+                  </div>
 
-                        {result.blockchain.transaction_hash && (
+                  {/* Blockchain Proof Section - Always Visible */}
+                  <div style={{
+                    marginTop: 'var(--space-xl)',
+                    padding: 'var(--space-lg)',
+                    background: 'linear-gradient(135deg, rgba(138, 43, 226, 0.15), rgba(75, 0, 130, 0.08))',
+                    border: '1px solid rgba(138, 43, 226, 0.3)',
+                    borderRadius: 'var(--radius-lg)'
+                  }}>
+                    <div style={{ display: 'flex', alignItems: 'center', gap: 'var(--space-sm)', marginBottom: 'var(--space-lg)' }}>
+                      <span style={{ fontSize: '1.5rem' }}>⛓️</span>
+                      <h3 style={{ margin: 0, fontSize: '1.1rem', color: '#9B59B6' }}>Blockchain Proof</h3>
+                      {result.blockchain ? (
+                        <>
                           <div style={{
                             display: 'flex', justifyContent: 'space-between', alignItems: 'center',
                             padding: 'var(--space-sm) var(--space-md)',
                             background: 'rgba(0, 0, 0, 0.2)',
                             borderRadius: 'var(--radius-sm)'
                           }}>
-                            <span style={{ color: 'var(--text-muted)', fontSize: '0.85rem' }}>Transaction</span>
-                            <span style={{ fontFamily: 'var(--font-mono)', fontSize: '0.75rem' }}>
-                              {result.blockchain.transaction_hash?.slice(0, 10)}...{result.blockchain.transaction_hash?.slice(-6)}
+                            <span style={{ color: 'var(--text-muted)', fontSize: '0.85rem' }}>Record ID</span>
+                            <span style={{ fontFamily: 'var(--font-mono)', fontSize: '0.75rem', color: 'var(--primary)' }}>
+                              {result.blockchain.record_id?.slice(0, 12)}...{result.blockchain.record_id?.slice(-8)}
                             </span>
                           </div>
-                        )}
 
-                        {result.blockchain.block_number && (
                           <div style={{
                             display: 'flex', justifyContent: 'space-between', alignItems: 'center',
                             padding: 'var(--space-sm) var(--space-md)',
                             background: 'rgba(0, 0, 0, 0.2)',
                             borderRadius: 'var(--radius-sm)'
                           }}>
-                            <span style={{ color: 'var(--text-muted)', fontSize: '0.85rem' }}>Block</span>
-                            <span style={{ fontFamily: 'var(--font-mono)', fontSize: '0.85rem' }}>
-                              #{result.blockchain.block_number.toLocaleString()}
+                            <span style={{ color: 'var(--text-muted)', fontSize: '0.85rem' }}>Network</span>
+                            <span style={{ display: 'flex', alignItems: 'center', gap: '6px', fontSize: '0.85rem' }}>
+                              <span style={{ width: '8px', height: '8px', borderRadius: '50%', background: '#8247e5' }}></span>
+                              {result.blockchain.network}
                             </span>
                           </div>
-                        )}
 
-                        <div style={{
-                          display: 'flex', justifyContent: 'space-between', alignItems: 'center',
-                          padding: 'var(--space-sm) var(--space-md)',
-                          background: 'rgba(0, 0, 0, 0.2)',
-                          borderRadius: 'var(--radius-sm)'
-                        }}>
-                          <span style={{ color: 'var(--text-muted)', fontSize: '0.85rem' }}>Timestamp</span>
-                          <span style={{ fontSize: '0.8rem' }}>{result.blockchain.timestamp}</span>
-                        </div>
+                          {result.blockchain.transaction_hash && (
+                            <div style={{
+                              display: 'flex', justifyContent: 'space-between', alignItems: 'center',
+                              padding: 'var(--space-sm) var(--space-md)',
+                              background: 'rgba(0, 0, 0, 0.2)',
+                              borderRadius: 'var(--radius-sm)'
+                            }}>
+                              <span style={{ color: 'var(--text-muted)', fontSize: '0.85rem' }}>Transaction</span>
+                              <span style={{ fontFamily: 'var(--font-mono)', fontSize: '0.75rem' }}>
+                                {result.blockchain.transaction_hash?.slice(0, 10)}...{result.blockchain.transaction_hash?.slice(-6)}
+                              </span>
+                            </div>
+                          )}
 
+                          {result.blockchain.block_number && (
+                            <div style={{
+                              display: 'flex', justifyContent: 'space-between', alignItems: 'center',
+                              padding: 'var(--space-sm) var(--space-md)',
+                              background: 'rgba(0, 0, 0, 0.2)',
+                              borderRadius: 'var(--radius-sm)'
+                            }}>
+                              <span style={{ color: 'var(--text-muted)', fontSize: '0.85rem' }}>Block</span>
+                              <span style={{ fontFamily: 'var(--font-mono)', fontSize: '0.85rem' }}>
+                                #{result.blockchain.block_number.toLocaleString()}
+                              </span>
+                            </div>
+                          )}
 
-                        {result.blockchain.explorer_url && (
-                          <a
-                            href={result.blockchain.explorer_url}
-                            target="_blank"
-                            rel="noopener noreferrer"
-                            style={{
-                              display: 'flex', alignItems: 'center', justifyContent: 'center', gap: 'var(--space-sm)',
-                              marginTop: 'var(--space-lg)',
-                              padding: 'var(--space-md)',
-                              background: 'linear-gradient(135deg, rgba(138, 43, 226, 0.3), rgba(75, 0, 130, 0.2))',
-                              border: '1px solid rgba(138, 43, 226, 0.5)',
-                              borderRadius: 'var(--radius-md)',
-                              color: '#9B59B6',
-                              textDecoration: 'none',
-                              fontWeight: 500,
-                              transition: 'all 0.2s ease'
-                            }}
-                            onMouseOver={(e) => e.currentTarget.style.transform = 'translateY(-2px)'}
-                            onMouseOut={(e) => e.currentTarget.style.transform = 'translateY(0)'}
-                          >
-                            <i className="fas fa-external-link-alt"></i>
-                            View on Block Explorer
-                          </a>
-                        )}
-
-                        <p style={{
+                          <div style={{
+                            display: 'flex', justifyContent: 'space-between', alignItems: 'center',
+                            padding: 'var(--space-sm) var(--space-md)',
+                            background: 'rgba(0, 0, 0, 0.2)',
+                            borderRadius: 'var(--radius-sm)'
+                          }}>
+                            <span style={{ color: 'var(--text-muted)', fontSize: '0.85rem' }}>Timestamp</span>
+                            <span style={{ fontSize: '0.8rem' }}>{result.blockchain.timestamp}</span>
+                          </div>
+
+
+                          {result.blockchain.explorer_url && (
+                            <a
+                              href={result.blockchain.explorer_url}
+                              target="_blank"
+                              rel="noopener noreferrer"
+                              style={{
+                                display: 'flex', alignItems: 'center', justifyContent: 'center', gap: 'var(--space-sm)',
+                                marginTop: 'var(--space-lg)',
+                                padding: 'var(--space-md)',
+                                background: 'linear-gradient(135deg, rgba(138, 43, 226, 0.3), rgba(75, 0, 130, 0.2))',
+                                border: '1px solid rgba(138, 43, 226, 0.5)',
+                                borderRadius: 'var(--radius-md)',
+                                color: '#9B59B6',
+                                textDecoration: 'none',
+                                fontWeight: 500,
+                                transition: 'all 0.2s ease'
+                              }}
+                              onMouseOver={(e) => e.currentTarget.style.transform = 'translateY(-2px)'}
+                              onMouseOut={(e) => e.currentTarget.style.transform = 'translateY(0)'}
+                            >
+                              <i className="fas fa-external-link-alt"></i>
+                              View on Block Explorer
+                            </a>
+                          )}
+
+                          <p style={{
+                            textAlign: 'center',
+                            fontSize: '0.75rem',
+                            color: 'var(--text-muted)',
+                            marginTop: 'var(--space-md)',
+                            marginBottom: 0
+                          }}>
+                            🔒 This verification is permanently recorded for transparency and tamper-proof evidence
+                          </p>
+                        </>
+                      ) : (
+                        <div style={{
+                          padding: 'var(--space-lg)',
                           textAlign: 'center',
-                          fontSize: '0.75rem',
-                          color: 'var(--text-muted)',
-                          marginTop: 'var(--space-md)',
-                          marginBottom: 0
-                        }}>
-                          🔒 This verification is permanently recorded for transparency and tamper-proof evidence
-                        </p>
-                      </>
-                    ) : (
-                      <div style={{
-                        padding: 'var(--space-lg)',
-                        textAlign: 'center',
-                        background: 'rgba(0, 0, 0, 0.2)',
-                        borderRadius: 'var(--radius-md)'
-                      }}>
-                        <p style={{
-                          color: 'var(--text-secondary)',
-                          marginBottom: 'var(--space-sm)',
-                          fontSize: '0.9rem'
-                        }}>
-                          {result.score < 0.4
-                            ? '⚠️ High-risk content detected. Blockchain recording is available but not configured.'
-                            : 'ℹ️ Blockchain recording is only enabled for high-risk content (score < 40%). This verification scored ' + Math.round((result.score || 0.5) * 100) + '%.'
-                          }
-                        </p>
-                        <p style={{
-                          fontSize: '0.75rem',
-                          color: 'var(--text-muted)',
-                          marginTop: 'var(--space-sm)'
+                          background: 'rgba(0, 0, 0, 0.2)',
+                          borderRadius: 'var(--radius-md)'
                         }}>
-                          🔒 Blockchain anchoring provides tamper-proof evidence for critical misinformation alerts
-                        </p>
-                      </div>
-                    )}
+                          <p style={{
+                            color: 'var(--text-secondary)',
+                            marginBottom: 'var(--space-sm)',
+                            fontSize: '0.9rem'
+                          }}>
+                            {result.score < 0.4
+                              ? '⚠️ High-risk content detected. Blockchain recording is available but not configured.'
+                              : 'ℹ️ Blockchain recording is only enabled for high-risk content (score < 40%). This verification scored ' + Math.round((result.score || 0.5) * 100) + '%.'
+                            }
+                          </p>
+                          <p style={{
+                            fontSize: '0.75rem',
+                            color: 'var(--text-muted)',
+                            marginTop: 'var(--space-sm)'
+                          }}>
+                            🔒 Blockchain anchoring provides tamper-proof evidence for critical misinformation alerts
+                          </p>
+                        </div>
+                      )}
+                    </div>
                   </div>
-                </div>
+                  </>
+                )}
               </div>
             </div>
           )}
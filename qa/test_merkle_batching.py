@@ -0,0 +1,221 @@
+"""
+Merkle batch anchoring (BLOCKCHAIN_WRITE_MODE=batch)
+
+The demo-mode tests need nothing running. The live tests anchor against a
+local node with the RapidVerify contract deployed and are skipped otherwise:
+
+    cd contracts && npm run node            # terminal 1
+    cd contracts && npm run deploy:local     # terminal 2
+    BLOCKCHAIN_CONTRACT_ADDRESS=0x... python -m pytest qa/test_merkle_batching.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pytest
+
+# The module-level service is created on import: keep it off data/ and off any real network
+os.environ['RECORD_STORE_DIR'] = tempfile.mkdtemp(prefix='rapidverify-qa-')
+os.environ['BLOCKCHAIN_NETWORK'] = 'localhost'
+os.environ['BLOCKCHAIN_INDEXER'] = 'false'
+os.environ.pop('BLOCKCHAIN_WRITE_MODE', None)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+
+from blockchain_service import BlockchainService  # noqa: E402
+from merkle import record_leaf  # noqa: E402
+
+HARDHAT_ACCOUNT_0 = '0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80'
+CONTRACT_ARTIFACT = os.path.join(os.path.dirname(__file__), '..', 'contracts', 'artifacts',
+                                 'RapidVerify.sol', 'RapidVerify.json')
+CLOSED_RPC = 'http://127.0.0.1:9'
+
+
+def _batch_service(monkeypatch, tmp_path, **env) -> BlockchainService:
+    monkeypatch.setenv('RECORD_STORE_DIR', str(tmp_path))
+    monkeypatch.setenv('BLOCKCHAIN_WRITE_MODE', 'batch')
+    monkeypatch.setenv('BLOCKCHAIN_BATCH_SIZE', '64')
+    monkeypatch.setenv('BLOCKCHAIN_BATCH_SECONDS', '3600')  # Tests flush explicitly unless they set a timer
+    monkeypatch.setenv('BLOCKCHAIN_BATCH_RETRY_SECONDS', '3600')
+    monkeypatch.setenv('BLOCKCHAIN_RPC_PROBE_TIMEOUT', '2')
+    monkeypatch.delenv('BLOCKCHAIN_RPC_URLS', raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    return BlockchainService()
+
+
+def _record_batch(service: BlockchainService, count: int) -> list:
+    claims = [f"QA claim {index} at {time.time()}" for index in range(count)]
+    records = [service.record_verification(claim, 0.25 + index / 100, 'debunked', 'False claim')
+               for index, claim in enumerate(claims)]
+    return list(zip(claims, records))
+
+
+@pytest.fixture
+def demo_service(monkeypatch, tmp_path):
+    monkeypatch.delenv('BLOCKCHAIN_CONTRACT_ADDRESS', raising=False)
+    monkeypatch.delenv('BLOCKCHAIN_PRIVATE_KEY', raising=False)
+    return lambda **env: _batch_service(monkeypatch, tmp_path, BLOCKCHAIN_RPC_URL=CLOSED_RPC, **env)
+
+
+@pytest.fixture
+def local_chain(monkeypatch, tmp_path):
+    """A batch-mode service anchoring to the local node (deploys the contract if no address is given)"""
+    web3 = pytest.importorskip('web3')
+    rpc_url = os.getenv('BLOCKCHAIN_RPC_URL') or BlockchainService.NETWORKS['localhost']['rpc']
+    w3 = web3.Web3(web3.Web3.HTTPProvider(rpc_url, request_kwargs={'timeout': 2}))
+    try:
+        w3.eth.block_number
+    except Exception:
+        pytest.skip(f"No local node at {rpc_url} (run `npm run node` in contracts/)")
+
+    private_key = os.getenv('BLOCKCHAIN_PRIVATE_KEY') or HARDHAT_ACCOUNT_0
+    contract_address = os.getenv('BLOCKCHAIN_CONTRACT_ADDRESS')
+    if not contract_address:
+        if not os.path.exists(CONTRACT_ARTIFACT):
+            pytest.skip('Set BLOCKCHAIN_CONTRACT_ADDRESS or compile the contract (`npm run compile` in contracts/)')
+        with open(CONTRACT_ARTIFACT, 'r', encoding='utf-8') as f:
+            artifact = json.load(f)
+        account = w3.eth.account.from_key(private_key)
+        tx = w3.eth.contract(abi=artifact['abi'], bytecode=artifact['bytecode']).constructor().build_transaction({
+            'from': account.address,
+            'nonce': w3.eth.get_transaction_count(account.address)
+        })
+        tx_hash = w3.eth.send_raw_transaction(account.sign_transaction(tx).raw_transaction)
+        contract_address = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)['contractAddress']
+
+    service = _batch_service(monkeypatch, tmp_path, BLOCKCHAIN_RPC_URL=rpc_url,
+                             BLOCKCHAIN_PRIVATE_KEY=private_key, BLOCKCHAIN_CONTRACT_ADDRESS=contract_address)
+    if not service.is_fully_configured():
+        pytest.skip('Could not configure the blockchain service against the local node')
+    return service
+
+
+# ----------------------------------------------------------------------
+# Demo mode: proofs only, no chain
+# ----------------------------------------------------------------------
+
+def test_flush_timer_anchors_a_partial_batch(demo_service):
+    service = demo_service(BLOCKCHAIN_BATCH_SECONDS='0.5')
+    [(claim, record)] = _record_batch(service, 1)
+    assert service._store.get(record['record_id'])['merkle'] == {'status': 'pending'}
+
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        merkle = service._store.get(record['record_id'])['merkle']
+        if merkle.get('status') != 'pending':
+            break
+        time.sleep(0.05)
+    assert merkle['status'] == 'local'
+    assert merkle['size'] == 1
+    assert service.get_status()['pending_batch'] == 0
+
+
+def test_flush_timer_flushes_a_full_batch_at_once(demo_service):
+    service = demo_service(BLOCKCHAIN_BATCH_SIZE='3')
+    records = [record for _, record in _record_batch(service, 3)]
+
+    deadline = time.time() + 5
+    while time.time() < deadline and service._store.get(records[-1]['record_id'])['merkle']['status'] == 'pending':
+        time.sleep(0.05)
+    roots = {service._store.get(record['record_id'])['merkle'].get('root') for record in records}
+    assert len(roots) == 1 and None not in roots
+
+
+def test_unanchored_proof_verifies_and_detects_tampering(demo_service):
+    service = demo_service()
+    batch = _record_batch(service, 5)
+    assert service.flush_batch()['status'] == 'local'
+
+    claim, record = batch[2]
+    result = service.verify_record(record['record_id'], claim)
+    assert result['verified'] is True
+    assert result['merkle'] == {'root': result['record']['merkle']['root'], 'included': True,
+                                'anchored': False, 'anchor_status': 'local'}
+
+    stored = service._store.get(record['record_id'])
+    stored['verification_score'] = 0.99
+    service._store.put(record['record_id'], stored)
+    result = service.verify_record(record['record_id'], claim)
+    assert result['verified'] is False
+    assert 'inclusion proof' in result['reason']
+
+
+# ----------------------------------------------------------------------
+# Local node: root anchored on-chain
+# ----------------------------------------------------------------------
+
+def test_batch_root_is_anchored_and_records_verify(local_chain):
+    service = local_chain
+    batch = _record_batch(service, 7)
+    anchor = service.flush_batch()
+    assert anchor['status'] == 'anchored'
+    assert anchor['transaction_hash'] and anchor['onchain_record_id']
+
+    onchain = service._read_onchain_record(anchor['onchain_record_id'])
+    assert onchain['claim_hash'] == anchor['root']
+    assert onchain['status'] == 'merkle_root'
+
+    for index, (claim, record) in enumerate(batch):
+        stored = service._store.get(record['record_id'])
+        assert stored['mode'] == 'live'
+        assert stored['merkle']['leaf_index'] == index
+        result = service.verify_record(record['record_id'], claim)
+        assert result['verified'] is True, result
+        assert result['merkle']['anchored'] is True
+        assert result['merkle']['anchor_record_id'] == anchor['onchain_record_id']
+
+    claim, record = batch[0]
+    assert service.verify_record(record['record_id'], claim + ' (edited)')['verified'] is False
+
+
+def test_rewritten_local_root_is_rejected(local_chain):
+    service = local_chain
+    [(claim, record)] = _record_batch(service, 1)
+    service.flush_batch()
+
+    # A consistent forgery: new score, and a one-leaf "tree" whose root is the new leaf
+    stored = service._store.get(record['record_id'])
+    stored['verification_score'] = 0.99
+    stored['merkle'] = {**stored['merkle'], 'root': record_leaf(stored), 'proof': []}
+    service._store.put(record['record_id'], stored)
+
+    result = service.verify_record(record['record_id'], claim)
+    assert result['verified'] is False
+    assert 'on-chain anchor' in result['reason']
+
+
+def test_failed_anchor_is_persisted_and_retried(local_chain, monkeypatch):
+    service = local_chain
+    batch = _record_batch(service, 3)
+
+    def unreachable(*args, **kwargs):
+        raise ConnectionError('node went away')
+
+    monkeypatch.setattr(service, '_send_record_transaction', unreachable)
+    anchor = service.flush_batch()
+    assert anchor['status'] == 'failed'
+    failed = json.loads(service._store.get_meta(BlockchainService.FAILED_ANCHORS_META))
+    assert [entry['root'] for entry in failed] == [anchor['root']]
+    assert failed[0]['record_ids'] == [record['record_id'] for _, record in batch]
+    assert service.get_status()['failed_anchors'] == 1
+
+    claim, record = batch[1]
+    result = service.verify_record(record['record_id'], claim)
+    assert result['verified'] is True and result['merkle']['anchor_status'] == 'failed'
+
+    assert service.retry_failed_anchors(force=True) == 0  # Still down: backs off
+    assert service._failed_anchors[0]['attempts'] == 2
+
+    monkeypatch.undo()
+    assert service.retry_failed_anchors(force=True) == 1
+    assert json.loads(service._store.get_meta(BlockchainService.FAILED_ANCHORS_META)) == []
+
+    for claim, record in batch:
+        stored = service._store.get(record['record_id'])
+        assert stored['merkle']['root'] == anchor['root']
+        assert 'error' not in stored['merkle']
+        result = service.verify_record(record['record_id'], claim)
+        assert result['verified'] is True, result
+        assert result['merkle']['anchored'] is True
@@ -0,0 +1,158 @@
+"""
+Record stores (RECORD_STORE_BACKEND=sqlite|journal)
+
+The dashboard reads stats() and hourly() from running counters instead of
+scanning records; these tests recount the stored records independently
+and check the counters agree after replacements, reorg orphaning,
+reopening, journal compaction and legacy migration.
+
+    python -m pytest qa/test_record_store.py
+"""
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+
+from record_store import RECORD_STORE_BACKENDS, open_record_store  # noqa: E402
+
+NOW_HOUR = int(time.time()) // 3600
+STATUSES = ('verified', 'debunked', 'investigating')
+
+
+def _record(index: int, **changes) -> dict:
+    record = {
+        'record_id': f"0x{index:064x}",
+        'claim_hash': f"0x{index % 7:064x}",
+        'verification_score': (index * 37 % 101) / 100,
+        'status': STATUSES[index % len(STATUSES)],
+        'timestamp': (NOW_HOUR - index % 5) * 3600 + index,
+        'chain_status': 'confirmed',
+        'transaction_hash': f"0x{index:064x}"
+    }
+    record.update(changes)
+    return record
+
+
+def _recount(records) -> tuple:
+    """stats() and non-empty hourly() buckets computed from scratch with the dashboard rules"""
+    stats = {'total': 0, 'false': 0, 'verified': 0, 'by_status': {}}
+    hourly = {}
+    for record in records:
+        if record.get('chain_status') == 'orphaned':
+            continue
+        score = record.get('verification_score') or 0
+        is_false = record.get('status') == 'debunked' or score < 0.4
+        is_verified = record.get('status') == 'verified' or score >= 0.7
+        stats['total'] += 1
+        stats['false'] += is_false
+        stats['verified'] += is_verified
+        stats['by_status'][record['status']] = stats['by_status'].get(record['status'], 0) + 1
+        bucket = hourly.setdefault(record['timestamp'] // 3600, {'total': 0, 'false': 0, 'verified': 0})
+        bucket['total'] += 1
+        bucket['false'] += is_false
+        bucket['verified'] += is_verified
+    return stats, [{'hour': hour, **hourly[hour]} for hour in sorted(hourly)]
+
+
+def _assert_counters_match(store):
+    stats, hourly = _recount(record for _, record in store.items())
+    assert store.stats() == stats
+    assert [bucket for bucket in store.hourly(24) if bucket['total'] or bucket['false'] or bucket['verified']] \
+        == hourly
+
+
+def _open(backend: str, **options):
+    return open_record_store(backend, os.environ['RECORD_STORE_DIR'], fsync_interval=0, **options)
+
+
+@pytest.fixture(params=RECORD_STORE_BACKENDS)
+def backend(request, monkeypatch, tmp_path):
+    monkeypatch.setenv('RECORD_STORE_DIR', str(tmp_path))
+    return request.param
+
+
+def test_counters_follow_replacements_and_orphaning(backend):
+    store = _open(backend)
+    for index in range(40):
+        store.put(f"r{index}", _record(index))
+    _assert_counters_match(store)
+
+    # Re-verification changes status and score; a reorg orphans the record (weight 0), then it is re-mined
+    for index in range(0, 40, 3):
+        store.put(f"r{index}", _record(index, status='debunked', verification_score=0.1))
+    for index in range(1, 40, 4):
+        store.put(f"r{index}", _record(index, chain_status='orphaned'))
+    _assert_counters_match(store)
+    store.put('r1', _record(1))
+    _assert_counters_match(store)
+    assert store.stats()['total'] == 40 - len(range(5, 40, 4))
+
+    store.close()
+    store = _open(backend)
+    _assert_counters_match(store)
+    assert store.count() == 40
+    store.close()
+
+
+def test_caller_mutation_does_not_reach_the_store(backend):
+    store = _open(backend)
+    record = _record(3, status='verified', verification_score=0.9)
+    store.put('r3', record)
+    record['status'] = 'debunked'
+    record['chain_status'] = 'orphaned'
+
+    assert store.get('r3')['status'] == 'verified'
+    store.put('r3', _record(3, status='investigating', verification_score=0.5))
+    _assert_counters_match(store)
+    store.close()
+
+
+def test_journal_compaction_and_replay_keep_counters(monkeypatch, tmp_path):
+    monkeypatch.setenv('RECORD_STORE_DIR', str(tmp_path))
+    store = _open('journal')
+    for index in range(30):
+        store.put(f"r{index}", _record(index))
+    store.compact()  # Snapshot of r0-r29, journal rotated away
+    for index in range(0, 30, 2):
+        store.put(f"r{index}", _record(index, chain_status='orphaned'))  # Only in the new journal
+    store.put('r30', _record(30))
+    expected = store.stats()
+    _assert_counters_match(store)
+    store.close()
+
+    store = _open('journal')
+    assert store.count() == 31
+    assert store.stats() == expected
+    _assert_counters_match(store)
+    store.close()
+
+
+def test_lookups_by_chain_status_and_transaction_hash(backend):
+    store = _open(backend)
+    for index in range(6):
+        store.put(f"r{index}", _record(index, chain_status=('pending', 'submitted', 'confirmed')[index % 3]))
+
+    in_flight = store.find_by_chain_status('pending', 'submitted')
+    assert sorted(record_id for record_id, _ in in_flight) == ['r0', 'r1', 'r3', 'r4']
+    assert [record['timestamp'] for _, record in in_flight] == sorted(r['timestamp'] for _, r in in_flight)
+    assert store.find_by_transaction_hash(_record(4)['transaction_hash'])['record_id'] == _record(4)['record_id']
+    assert store.find_by_transaction_hash('0xmissing') is None
+    store.close()
+
+
+def test_legacy_json_is_migrated_with_counters(backend):
+    records = {f"r{index}": _record(index) for index in range(12)}
+    records['r5']['chain_status'] = 'orphaned'
+    legacy_path = os.path.join(os.environ['RECORD_STORE_DIR'], 'blockchain_records.json')
+    with open(legacy_path, 'w', encoding='utf-8') as f:
+        json.dump(records, f)
+
+    store = _open(backend)
+    assert store.count() == 12
+    _assert_counters_match(store)
+    assert store.stats()['total'] == 11
+    store.close()
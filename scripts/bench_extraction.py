@@ -0,0 +1,120 @@
+"""
+RapidVerify Article Extraction Benchmark
+Times the single-pass lxml extractor against the BeautifulSoup selector cascade
+over a corpus of saved article HTML, and reports any field where they disagree.
+Also times the full scrape path (JSON-LD/meta fast path, DOM only when needed).
+
+The default corpus is a small set of synthetic pages committed under
+api/datasets/article_corpus (JSON-LD, OpenGraph, microdata, blog, AMP and
+bare layouts). Pages fetched with --save go to data/article_corpus, which
+is not committed, unless --corpus says otherwise.
+
+Usage:
+    python scripts/bench_extraction.py [--corpus DIR] [--rounds N]
+    python scripts/bench_extraction.py --save URL [URL ...]   # fetch pages into data/article_corpus
+    python scripts/bench_extraction.py --corpus data/article_corpus
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+
+from news_scraper import NewsScraper, STRUCTURED_REQUIRED_FIELDS  # noqa: E402
+from http_client import http_client  # noqa: E402
+from structured_data import extract_structured_data  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), '..', 'api', 'datasets', 'article_corpus')
+SAVED_CORPUS = os.path.join(os.path.dirname(__file__), '..', 'data', 'article_corpus')  # --save target
+FIELDS = ('title', 'content', 'author', 'date', 'images')
+
+
+def save_pages(urls, corpus: str, scraper: NewsScraper):
+    """Fetch each URL once and store its HTML as <corpus>/<sha1(url)>.html"""
+    os.makedirs(corpus, exist_ok=True)
+    for url in urls:
+        try:
+            response = http_client.get(url, headers=scraper.headers, timeout=15)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"⚠️ {url}: {e}")
+            continue
+        name = hashlib.sha1(url.encode()).hexdigest()[:16] + '.html'
+        with open(os.path.join(corpus, name), 'w', encoding='utf-8') as f:
+            f.write(f"<!-- {url} -->\n{response.text}")
+        print(f"✅ {url} → {name}")
+
+
+def load_corpus(corpus: str) -> list:
+    pages = []
+    for name in sorted(os.listdir(corpus)):
+        if name.endswith(('.html', '.htm')):
+            with open(os.path.join(corpus, name), encoding='utf-8', errors='replace') as f:
+                pages.append((name, f.read()))
+    return pages
+
+
+def run(parse, pages: list, rounds: int) -> float:
+    """Best-of-rounds seconds to extract the whole corpus"""
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for name, html in pages:
+            parse(html, 'https://example.com/' + name, {})
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--corpus', help='Directory of saved .html pages (default: the committed fixture corpus;'
+                                         ' data/article_corpus with --save)')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed passes per engine (best is reported)')
+    parser.add_argument('--save', nargs='+', metavar='URL', help='Fetch URLs into the corpus and exit')
+    args = parser.parse_args()
+
+    scraper = NewsScraper()
+    if args.save:
+        save_pages(args.save, args.corpus or SAVED_CORPUS, scraper)
+        return
+    args.corpus = args.corpus or DEFAULT_CORPUS
+    if scraper.extractor is None:
+        sys.exit("lxml is not installed (or ARTICLE_EXTRACTOR=soup): nothing to compare")
+    if not os.path.isdir(args.corpus) or not load_corpus(args.corpus):
+        sys.exit(f"No .html files in {args.corpus} - add some with --save URL ...")
+
+    pages = load_corpus(args.corpus)
+    total_kb = sum(len(html) for _, html in pages) / 1024
+
+    # Agreement first: the fast path must pick the same candidates as the cascade
+    mismatches = 0
+    for name, html in pages:
+        url = 'https://example.com/' + name
+        fast = scraper._parse_article_lxml(html, url, scraper._new_article_result(url))
+        slow = scraper._parse_article_soup(html, url, scraper._new_article_result(url))
+        for field in FIELDS:
+            if fast[field] != slow[field]:
+                mismatches += 1
+                print(f"≠ {name} {field}: lxml={str(fast[field])[:80]!r} soup={str(slow[field])[:80]!r}")
+
+    soup_seconds = run(scraper._parse_article_soup, pages, args.rounds)
+    lxml_seconds = run(scraper._parse_article_lxml, pages, args.rounds)
+    full_seconds = run(scraper._parse_article, pages, args.rounds)
+    structured = sum(
+        1 for _, html in pages
+        if all(extract_structured_data(html).get(field) for field in STRUCTURED_REQUIRED_FIELDS)
+    )
+
+    print(f"\n📄 {len(pages)} pages, {total_kb:.0f} KB, best of {args.rounds} rounds")
+    print(f"   BeautifulSoup cascade: {soup_seconds * 1000:8.1f} ms  ({soup_seconds * 1000 / len(pages):.2f} ms/page)")
+    print(f"   lxml single pass:      {lxml_seconds * 1000:8.1f} ms  ({lxml_seconds * 1000 / len(pages):.2f} ms/page)")
+    print(f"   Structured fast path:  {full_seconds * 1000:8.1f} ms  ({full_seconds * 1000 / len(pages):.2f} ms/page,"
+          f" {structured}/{len(pages)} pages declared every field)")
+    print(f"   Speedup: {soup_seconds / lxml_seconds:.1f}x (lxml), {soup_seconds / full_seconds:.1f}x (full path),"
+          f" field mismatches: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()